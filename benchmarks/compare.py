@@ -0,0 +1,95 @@
+"""Compare two JSON baselines written by benchmarks.suite.
+
+Exit code is 1 if a metric regresses by more than the threshold.
+
+Usage: python -m benchmarks.compare benchmarks/results/main.json benchmarks/results/my_branch.json --threshold 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+# Metrics where a higher value is better (others: lower is better)
+HIGHER_IS_BETTER: tuple[str, ...] = ("calls_per_s", "items_per_s")
+# Metrics which are not compared (counters)
+IGNORED: tuple[str, ...] = ("calls", "items", "repeat", "rules")
+
+
+def flatten(results: dict[str, Any], prefix: str = "") -> dict[str, float]:
+    """Return the numeric metrics as a flat dictionary (k: 'benchmark.metric', v: value)."""
+    metrics: dict[str, float] = {}
+
+    for key, value in results.items():
+        name: str = f"{prefix}{key}"
+        if isinstance(value, dict):
+            metrics.update(flatten(value, f"{name}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool) and key not in IGNORED:
+            metrics[name] = float(value)
+
+    return metrics
+
+
+def compare(baseline: dict[str, Any], candidate: dict[str, Any], threshold: float) -> list[dict[str, Any]]:
+    """Return the comparison of the common metrics.
+
+    Args:
+        baseline: Reference results.
+        candidate: New results.
+        threshold: Relative change (percent) above which a worse metric is a regression.
+
+    Returns:
+        A list of rows: metric, baseline, candidate, change (percent, positive is better) and regression flag.
+    """
+    base_metrics: dict[str, float] = flatten(baseline["results"])
+    cand_metrics: dict[str, float] = flatten(candidate["results"])
+    rows: list[dict[str, Any]] = []
+
+    for name in sorted(base_metrics.keys() & cand_metrics.keys()):
+        base: float = base_metrics[name]
+        cand: float = cand_metrics[name]
+
+        if base == 0:
+            continue
+
+        # Positive change is an improvement
+        change: float = (cand - base) / base * 100 if name.endswith(HIGHER_IS_BETTER) else (base - cand) / base * 100
+
+        rows.append(
+            {"metric": name, "baseline": base, "candidate": cand, "change": change, "regression": change < -threshold}
+        )
+
+    return rows
+
+
+def main() -> None:
+    """Print the comparison table of two baselines."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("baseline", type=Path, help="Reference JSON results.")
+    parser.add_argument("candidate", type=Path, help="New JSON results.")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Regression threshold (percent).")
+    args = parser.parse_args()
+
+    baseline: dict[str, Any] = json.loads(args.baseline.read_text(encoding="utf-8"))
+    candidate: dict[str, Any] = json.loads(args.candidate.read_text(encoding="utf-8"))
+
+    if baseline["parameters"] != candidate["parameters"]:
+        print("Warning: the baselines were run with different parameters.")  # noqa: T201
+
+    rows: list[dict[str, Any]] = compare(baseline, candidate, args.threshold)
+
+    print(f"{'metric':<40} {'baseline':>14} {'candidate':>14} {'change':>9}")  # noqa: T201
+    for row in rows:
+        flag: str = "  REGRESSION" if row["regression"] else ""
+        print(  # noqa: T201
+            f"{row['metric']:<40} {row['baseline']:>14.3f} {row['candidate']:>14.3f} {row['change']:>+8.1f}%{flag}"
+        )
+
+    sys.exit(1 if any(row["regression"] for row in rows) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Validation functions, actions and custom condition used by the synthetic configurations (see generator.py)."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from arta.condition import BaseCondition
+from arta.utils import ParsingErrorStrategy
+
+
+def is_in_range(value: Any, low: int, high: int) -> bool:
+    """Return True if the value is between low and high (included)."""
+    return value is not None and low <= value <= high
+
+
+def is_equal(value: Any, expected: Any) -> bool:
+    """Return True if the value equals the expected one."""
+    return value == expected
+
+
+def set_value(value: Any) -> Any:
+    """Return the value."""
+    return value
+
+
+def set_label(label: str, **kwargs: Any) -> dict[str, Any]:
+    """Return a label and the number of input fields (value sharing)."""
+    return {"label": label, "fields": len(kwargs["input_data"])}
+
+
+class HasFlag(BaseCondition):
+    """Custom condition: the lowercase condition id is a key of the input data (e.g., FLAG_C -> input["flag_c"])."""
+
+    __slots__ = ()
+
+    def verify(self, input_data: dict[str, Any], parsing_error_strategy: ParsingErrorStrategy, **kwargs: Any) -> bool:
+        """Return True if the condition is verified."""
+        return self._condition_id.lower() in input_data
@@ -0,0 +1,127 @@
+"""Copy-on-write benchmark: memory of N forked workers sharing a rules engine built by the parent (Linux only).
+
+Each worker applies the rules and runs garbage collections (like a pre-fork server worker), then reports
+its private (copied) and shared memory from /proc/self/smaps_rollup. Each variant (with and without
+RulesEngine.freeze()) runs in a fresh interpreter, as gc.freeze() applies to the whole process.
+
+Usage: python -m benchmarks.fork_memory --rules 20000 --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+from arta import RulesEngine
+from benchmarks.generator import generate_inputs
+from benchmarks.memory_footprint import build_config
+
+SMAPS_ROLLUP: Path = Path("/proc/self/smaps_rollup")
+
+
+def read_memory() -> dict[str, int]:
+    """Return the memory of the current process (kB) from smaps_rollup."""
+    fields: dict[str, int] = {}
+
+    for line in SMAPS_ROLLUP.read_text(encoding="ascii").splitlines()[1:]:
+        name, value = line.split(":", 1)
+        fields[name] = int(value.split()[0])
+
+    return {
+        "rss_kb": fields["Rss"],
+        "pss_kb": fields["Pss"],
+        "private_kb": fields["Private_Clean"] + fields["Private_Dirty"],
+        "shared_kb": fields["Shared_Clean"] + fields["Shared_Dirty"],
+    }
+
+
+def _worker(eng: RulesEngine, inputs: list[dict[str, Any]], write_fd: int) -> None:
+    """Run a forked worker: apply the rules, collect the garbage and report its memory."""
+    for input_data in inputs:
+        eng.apply_rules(input_data, rule_set="rule_set_0")
+    gc.collect()
+
+    with os.fdopen(write_fd, "w") as pipe:
+        pipe.write(json.dumps(read_memory()))
+
+
+def run_variant(freeze: bool, rules: int, workers: int, requests: int) -> dict[str, Any]:
+    """Build the engine, fork the workers and return their memory.
+
+    Args:
+        freeze: Call RulesEngine.freeze() before forking.
+        rules: Number of rules of the engine.
+        workers: Number of forked workers.
+        requests: Number of requests applied by each worker.
+
+    Returns:
+        The memory of the parent and of the workers (mean values).
+    """
+    eng: RulesEngine = RulesEngine(config_dict=build_config(rules))
+    inputs: list[dict[str, Any]] = generate_inputs(requests)
+
+    if freeze:
+        eng.freeze()
+
+    parent: dict[str, int] = read_memory()
+    pipes: list[tuple[int, int]] = []
+
+    for _ in range(workers):
+        read_fd, write_fd = os.pipe()
+        pid: int = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            _worker(eng, inputs, write_fd)
+            os._exit(0)
+        os.close(write_fd)
+        pipes.append((pid, read_fd))
+
+    children: list[dict[str, int]] = []
+    for pid, read_fd in pipes:
+        with os.fdopen(read_fd) as pipe:
+            children.append(json.loads(pipe.read()))
+        os.waitpid(pid, 0)
+
+    return {
+        "freeze": freeze,
+        "parent_rss_kb": parent["rss_kb"],
+        "worker_private_kb": sum(child["private_kb"] for child in children) // workers,
+        "worker_shared_kb": sum(child["shared_kb"] for child in children) // workers,
+        "workers_pss_kb": sum(child["pss_kb"] for child in children),
+    }
+
+
+def main() -> None:
+    """Run both variants in fresh interpreters and print the JSON results."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rules", type=int, default=20_000, help="Number of rules.")
+    parser.add_argument("--workers", type=int, default=4, help="Number of forked workers.")
+    parser.add_argument("--requests", type=int, default=20, help="Number of requests per worker.")
+    parser.add_argument("--variant", choices=["freeze", "no-freeze"], default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if not SMAPS_ROLLUP.exists() or not hasattr(os, "fork"):
+        sys.exit("This benchmark needs Linux (fork and /proc/self/smaps_rollup).")
+
+    if args.variant is not None:
+        print(json.dumps(run_variant(args.variant == "freeze", args.rules, args.workers, args.requests)))  # noqa: T201
+        return
+
+    results: list[dict[str, Any]] = []
+    for variant in ("no-freeze", "freeze"):
+        command: list[str] = [sys.executable, "-m", "benchmarks.fork_memory", "--variant", variant]
+        command += ["--rules", str(args.rules), "--workers", str(args.workers), "--requests", str(args.requests)]
+        output: str = subprocess.run(command, check=True, capture_output=True, text=True).stdout  # noqa: S603
+        results.append(json.loads(output))
+
+    print(json.dumps({"rules": args.rules, "workers": args.workers, "results": results}, indent=2))  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""Deterministic generator of synthetic configurations and input data.
+
+A configuration has N rule sets x M groups x K rules with a mix of standard, simple and custom conditions.
+The same parameters and seed always give the same configuration and inputs.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Any
+
+FIXTURES_MODULE: str = "benchmarks.fixtures"
+CATEGORIES: str = "abcde"
+
+
+def _suffix(idx: int) -> str:
+    """Return a letters only suffix (data paths of simple conditions can't contain digits): 0 -> 'a', 26 -> 'ba'."""
+    letters: str = ""
+    while True:
+        idx, rem = divmod(idx, 26)
+        letters = chr(ord("a") + rem) + letters
+        if idx == 0:
+            return letters
+
+
+def _field_names(input_fields: int) -> tuple[list[str], list[str], list[str]]:
+    """Return the numeric, categorical and flag field names (a third of the fields each)."""
+    suffixes: list[str] = [_suffix(idx) for idx in range(max(1, input_fields // 3))]
+    return (
+        [f"num_{suffix}" for suffix in suffixes],
+        [f"cat_{suffix}" for suffix in suffixes],
+        [f"flag_{suffix}" for suffix in suffixes],
+    )
+
+
+def generate_config(
+    rule_sets: int = 1,
+    groups: int = 10,
+    rules_per_group: int = 10,
+    standard_conditions: int = 50,
+    input_fields: int = 30,
+    simple_ratio: float = 0.3,
+    custom_ratio: float = 0.1,
+    rule_activation_mode: str = "one_by_group",
+    seed: int = 0,
+) -> dict[str, Any]:
+    """Return a synthetic configuration (usable with RulesEngine(config_dict=...)).
+
+    Args:
+        rule_sets: Number of rule sets.
+        groups: Number of groups per rule set.
+        rules_per_group: Number of rules per group.
+        standard_conditions: Number of distinct standard conditions (shared by the rules).
+        input_fields: Number of fields of the input data (see generate_inputs()).
+        simple_ratio: Ratio of rules using a simple condition.
+        custom_ratio: Ratio of rules using a custom condition.
+        rule_activation_mode: 'one_by_group' or 'many_by_group'.
+        seed: Seed of the random generator.
+
+    Returns:
+        The configuration dictionary.
+    """
+    rand: random.Random = random.Random(seed)
+    num_fields, cat_fields, flag_fields = _field_names(input_fields)
+
+    # Standard conditions: range or equality checks on one field
+    conditions: dict[str, Any] = {}
+    for idx in range(standard_conditions):
+        if rand.random() < 0.5:
+            low: int = rand.randrange(0, 80)
+            conditions[f"COND_{idx}"] = {
+                "description": f"Synthetic range condition {idx}",
+                "validation_function": "is_in_range",
+                "condition_parameters": {"value": f"input.{rand.choice(num_fields)}", "low": low, "high": low + 30},
+            }
+        else:
+            conditions[f"COND_{idx}"] = {
+                "description": f"Synthetic equality condition {idx}",
+                "validation_function": "is_equal",
+                "condition_parameters": {
+                    "value": f"input.{rand.choice(cat_fields)}",
+                    "expected": rand.choice(CATEGORIES),
+                },
+            }
+
+    rules: dict[str, Any] = {}
+    for set_idx in range(rule_sets):
+        rule_set: dict[str, Any] = {}
+        rules[f"rule_set_{set_idx}"] = rule_set
+
+        for group_idx in range(groups):
+            group: dict[str, Any] = {}
+            rule_set[f"group_{group_idx}"] = group
+
+            for rule_idx in range(rules_per_group):
+                cond_a, cond_b = rand.sample(range(standard_conditions), 2) if standard_conditions > 1 else (0, 0)
+                operator: str = rand.choice(["and", "or", "and not"])
+                rule: dict[str, Any] = {"condition": f"COND_{cond_a} {operator} COND_{cond_b}"}
+
+                draw: float = rand.random()
+                if draw < simple_ratio:
+                    rule["simple_condition"] = (
+                        f"input.{rand.choice(num_fields)}>={rand.randrange(0, 100)} "
+                        f'or input.{rand.choice(cat_fields)}=="{rand.choice(CATEGORIES)}"'
+                    )
+                elif draw < simple_ratio + custom_ratio:
+                    rule["custom_condition"] = rand.choice(flag_fields).upper()
+
+                if rand.random() < 0.5:
+                    rule["action"] = "set_value"
+                    rule["action_parameters"] = {"value": f"{group_idx}_{rule_idx}"}
+                else:
+                    rule["action"] = "set_label"
+                    rule["action_parameters"] = {"label": f"label_{rule_idx % 5}"}
+
+                group[f"RULE_{set_idx}_{group_idx}_{rule_idx}"] = rule
+
+    return {
+        "rules": rules,
+        "conditions": conditions,
+        "conditions_source_modules": [FIXTURES_MODULE],
+        "actions_source_modules": [FIXTURES_MODULE],
+        "custom_classes_source_modules": [FIXTURES_MODULE],
+        "condition_factory_mapping": {"custom_condition": "HasFlag"},
+        "rule_activation_mode": rule_activation_mode,
+    }
+
+
+def generate_inputs(count: int, input_fields: int = 30, seed: int = 0) -> list[dict[str, Any]]:
+    """Return synthetic input data matching the generated configurations.
+
+    Args:
+        count: Number of inputs.
+        input_fields: Number of fields of each input (numeric, categorical and optional flags).
+        seed: Seed of the random generator.
+
+    Returns:
+        A list of input data dictionaries.
+    """
+    rand: random.Random = random.Random(seed)
+    num_fields, cat_fields, flag_fields = _field_names(input_fields)
+    inputs: list[dict[str, Any]] = []
+
+    for _ in range(count):
+        data: dict[str, Any] = {field: rand.randrange(0, 100) for field in num_fields}
+        data.update({field: rand.choice(CATEGORIES) for field in cat_fields})
+        data.update({field: True for field in flag_fields if rand.random() < 0.5})
+        inputs.append(data)
+
+    return inputs
@@ -0,0 +1,223 @@
+"""Load test: a single shared rules engine driven by many threads (or processes).
+
+Reports the latency percentiles, the throughput and the scaling efficiency for each number of workers.
+The input corpus is synthetic (see generator.py) or recorded (JSON lines file, one input data per line).
+
+Usage: python -m benchmarks.loadtest --workers 1,2,4,8 --requests 2000 [--mode process] [--corpus inputs.jsonl]
+
+With --min-efficiency, the exit code is 1 if the scaling efficiency of a number of workers is below the threshold
+(e.g., checking the near-linear scaling of threads on a free-threaded build).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from arta import RulesEngine
+from benchmarks.generator import generate_config, generate_inputs
+from benchmarks.metrics import environment, summarize_latencies
+from benchmarks.suite import PROFILES
+
+RULE_SET: str = "rule_set_0"
+
+# Engine of the worker processes (inherited when forked, else built by _init_process())
+_process_engine: RulesEngine | None = None
+
+
+def load_corpus(path: Path) -> list[dict[str, Any]]:
+    """Return the inputs of a recorded corpus (JSON lines file)."""
+    with path.open(encoding="utf-8") as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
+def _run_worker(eng: RulesEngine, corpus: list[dict[str, Any]], offset: int, requests: int) -> list[int]:
+    """Apply the rules on 'requests' inputs of the corpus (starting at 'offset') and return the latencies (ns)."""
+    durations: list[int] = []
+    size: int = len(corpus)
+
+    for idx in range(offset, offset + requests):
+        start_ns: int = time.perf_counter_ns()
+        eng.apply_rules(corpus[idx % size], rule_set=RULE_SET)
+        durations.append(time.perf_counter_ns() - start_ns)
+
+    return durations
+
+
+def run_threads(eng: RulesEngine, corpus: list[dict[str, Any]], workers: int, requests: int) -> tuple[list[int], float]:
+    """Run the workers in threads sharing the engine.
+
+    Returns:
+        All the latencies (ns) and the wall time (s).
+    """
+    results: list[list[int]] = [[] for _ in range(workers)]
+    barrier: threading.Barrier = threading.Barrier(workers + 1)
+
+    def target(worker_idx: int) -> None:
+        barrier.wait()
+        results[worker_idx] = _run_worker(eng, corpus, worker_idx * requests, requests)
+
+    threads: list[threading.Thread] = [threading.Thread(target=target, args=(idx,)) for idx in range(workers)]
+    for thread in threads:
+        thread.start()
+
+    barrier.wait()
+    start: float = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed: float = time.perf_counter() - start
+
+    return [duration for durations in results for duration in durations], elapsed
+
+
+def _init_process(config: dict[str, Any]) -> None:
+    """Build the engine of a worker process (if not inherited from the parent process)."""
+    global _process_engine  # noqa: PLW0603
+    if _process_engine is None:
+        _process_engine = RulesEngine(config_dict=config)
+
+
+def _process_target(corpus: list[dict[str, Any]], offset: int, requests: int) -> list[int]:
+    """Worker of a process pool."""
+    if _process_engine is None:
+        raise RuntimeError("The worker process has no rules engine.")
+    return _run_worker(_process_engine, corpus, offset, requests)
+
+
+def run_processes(
+    eng: RulesEngine, config: dict[str, Any], corpus: list[dict[str, Any]], workers: int, requests: int
+) -> tuple[list[int], float]:
+    """Run the workers in processes (the engine is inherited with 'fork', else rebuilt in each process).
+
+    Returns:
+        All the latencies (ns) and the wall time (s), process startup excluded.
+    """
+    global _process_engine  # noqa: PLW0603
+    method: str = "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+    _process_engine = eng
+
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context(method),
+            initializer=_init_process,
+            initargs=(config,),
+        ) as pool:
+            # Start the processes before timing
+            list(pool.map(_process_target, [corpus] * workers, [0] * workers, [1] * workers))
+
+            start: float = time.perf_counter()
+            futures = [pool.submit(_process_target, corpus, idx * requests, requests) for idx in range(workers)]
+            results: list[list[int]] = [future.result() for future in futures]
+            elapsed: float = time.perf_counter() - start
+    finally:
+        _process_engine = None
+
+    return [duration for durations in results for duration in durations], elapsed
+
+
+def run(
+    worker_counts: list[int],
+    requests: int,
+    mode: str = "thread",
+    profile: str = "medium",
+    corpus: list[dict[str, Any]] | None = None,
+    seed: int = 0,
+) -> dict[str, Any]:
+    """Run the load test for each number of workers.
+
+    Args:
+        worker_counts: Numbers of workers to test (e.g., [1, 2, 4, 8]).
+        requests: Number of requests per worker.
+        mode: 'thread' or 'process'.
+        profile: Generator profile of the rule sets (see benchmarks.suite.PROFILES).
+        corpus: Recorded inputs (None: synthetic inputs).
+        seed: Seed of the generator.
+
+    Returns:
+        A dictionary of results (with the environment and the parameters).
+    """
+    params: dict[str, Any] = PROFILES[profile]
+    config: dict[str, Any] = generate_config(seed=seed, **params)
+    inputs: list[dict[str, Any]] = (
+        corpus if corpus is not None else generate_inputs(1000, input_fields=params["input_fields"], seed=seed)
+    )
+    eng: RulesEngine = RulesEngine(config_dict=config)
+
+    # Warm up
+    _run_worker(eng, inputs, 0, min(len(inputs), 100))
+
+    results: dict[str, Any] = {}
+    single_throughput: float | None = None
+
+    for workers in worker_counts:
+        durations, elapsed = (
+            run_threads(eng, inputs, workers, requests)
+            if mode == "thread"
+            else run_processes(eng, config, inputs, workers, requests)
+        )
+        throughput: float = len(durations) / elapsed
+
+        if single_throughput is None:
+            # Reference of the scaling efficiency (per worker)
+            single_throughput = throughput / workers
+
+        results[str(workers)] = {
+            **summarize_latencies(durations),
+            "calls_per_s": throughput,
+            "scaling_efficiency": throughput / (workers * single_throughput),
+        }
+
+    return {
+        "environment": environment(),
+        "parameters": {
+            "mode": mode,
+            "profile": profile,
+            "requests_per_worker": requests,
+            "corpus": "recorded" if corpus is not None else "synthetic",
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+def main() -> None:
+    """Run the load test, print and optionally save its JSON results."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", default="1,2,4,8", help="Comma separated numbers of workers.")
+    parser.add_argument("--requests", type=int, default=2000, help="Number of requests per worker.")
+    parser.add_argument("--mode", choices=["thread", "process"], default="thread", help="Kind of workers.")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="medium", help="Size of the rule sets.")
+    parser.add_argument("--corpus", type=Path, default=None, help="Recorded inputs (JSON lines file).")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the generator.")
+    parser.add_argument("--output", type=Path, default=None, help="Path of the JSON results to write.")
+    parser.add_argument("--min-efficiency", type=float, default=None, help="Minimum scaling efficiency (0 to 1).")
+    args = parser.parse_args()
+
+    corpus: list[dict[str, Any]] | None = load_corpus(args.corpus) if args.corpus is not None else None
+    worker_counts: list[int] = [int(count) for count in args.workers.split(",")]
+
+    results: dict[str, Any] = run(worker_counts, args.requests, args.mode, args.profile, corpus, args.seed)
+    output: str = json.dumps(results, indent=2)
+
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(output + "\n", encoding="utf-8")
+
+    print(output)  # noqa: T201
+
+    if args.min_efficiency is not None and any(
+        result["scaling_efficiency"] < args.min_efficiency for result in results["results"].values()
+    ):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Memory footprint benchmark of a rules engine holding many rules.
+
+Usage: python -m benchmarks.memory_footprint --rules 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import tracemalloc
+from typing import Any
+
+from arta import RulesEngine
+from benchmarks.generator import generate_config
+
+
+def build_config(rule_count: int, group_size: int = 100) -> dict[str, Any]:
+    """Return a synthetic configuration of 'rule_count' rules (rounded up to a multiple of 'group_size')."""
+    groups: int = max(1, -(-rule_count // group_size))
+    return generate_config(groups=groups, rules_per_group=min(rule_count, group_size))
+
+
+def measure(rule_count: int) -> dict[str, Any]:
+    """Return the memory allocated by a rules engine (built from a configuration of 'rule_count' rules)."""
+    config: dict[str, Any] = build_config(rule_count)
+    gc.collect()
+
+    tracemalloc.start()
+    eng: RulesEngine = RulesEngine(config_dict=config)
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    rule_total: int = sum(len(rules) for rule_set_dict in eng.rules.values() for rules in rule_set_dict.values())
+    del eng
+
+    return {
+        "rules": rule_total,
+        "retained_bytes": current,
+        "peak_bytes": peak,
+        "bytes_per_rule": round(current / rule_total, 1),
+    }
+
+
+def main() -> None:
+    """Run the benchmark and print its JSON result."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rules", type=int, default=20_000, help="Number of rules.")
+    args = parser.parse_args()
+
+    print(json.dumps(measure(args.rules), indent=2))  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
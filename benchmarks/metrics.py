@@ -0,0 +1,55 @@
+"""Helpers shared by the benchmarks: latency summaries and environment description."""
+
+from __future__ import annotations
+
+import os
+import platform
+import sys
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any
+
+
+def percentile(sorted_samples: list[int], percent: float) -> float:
+    """Return a percentile (nearest rank) of sorted samples (0.0 if no sample)."""
+    if len(sorted_samples) == 0:
+        return 0.0
+
+    idx: int = min(len(sorted_samples) - 1, int(round(percent / 100 * (len(sorted_samples) - 1))))
+    return float(sorted_samples[idx])
+
+
+def summarize_latencies(samples_ns: list[int]) -> dict[str, float]:
+    """Return the latency summary (microseconds) of a list of durations (nanoseconds)."""
+    samples: list[int] = sorted(samples_ns)
+    count: int = len(samples)
+
+    return {
+        "calls": count,
+        "mean_us": sum(samples) / count / 1e3 if count > 0 else 0.0,
+        "p50_us": percentile(samples, 50) / 1e3,
+        "p95_us": percentile(samples, 95) / 1e3,
+        "p99_us": percentile(samples, 99) / 1e3,
+        "p999_us": percentile(samples, 99.9) / 1e3,
+        "max_us": samples[-1] / 1e3 if count > 0 else 0.0,
+    }
+
+
+def environment() -> dict[str, Any]:
+    """Return a description of the environment running the benchmarks."""
+    try:
+        arta_version: str = version("arta")
+    except PackageNotFoundError:
+        arta_version = "unknown"
+
+    gil_enabled = getattr(sys, "_is_gil_enabled", None)
+
+    return {
+        "arta": arta_version,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "gil_enabled": gil_enabled() if gil_enabled is not None else True,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "usable_cpus": len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count(),
+    }
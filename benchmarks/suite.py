@@ -0,0 +1,186 @@
+"""Benchmark suite of the rules engine: build time, latency, throughput, batch modes and memory.
+
+Results are written as a JSON baseline, compared with benchmarks.compare.
+
+Usage: python -m benchmarks.suite --profile medium --output benchmarks/results/my_branch.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+from arta import RulesEngine
+from arta.hooks import InMemorySpanExporter, TracingHook
+from benchmarks.generator import generate_config, generate_inputs
+from benchmarks.metrics import environment, summarize_latencies
+
+# Generator parameters of each profile
+PROFILES: dict[str, dict[str, Any]] = {
+    "small": {"rule_sets": 1, "groups": 5, "rules_per_group": 5, "standard_conditions": 10, "input_fields": 9},
+    "medium": {"rule_sets": 2, "groups": 10, "rules_per_group": 10, "standard_conditions": 50, "input_fields": 30},
+    "large": {"rule_sets": 4, "groups": 25, "rules_per_group": 40, "standard_conditions": 200, "input_fields": 90},
+}
+
+
+def bench_build(config: dict[str, Any], repeat: int) -> dict[str, Any]:
+    """Time the construction of the rules engine."""
+    durations: list[int] = []
+
+    for _ in range(repeat):
+        start_ns: int = time.perf_counter_ns()
+        RulesEngine(config_dict=config)
+        durations.append(time.perf_counter_ns() - start_ns)
+
+    return {"repeat": repeat, "min_ms": min(durations) / 1e6, "mean_ms": sum(durations) / repeat / 1e6}
+
+
+def bench_latency(eng: RulesEngine, inputs: list[dict[str, Any]], rule_set: str, verbose: bool) -> dict[str, Any]:
+    """Measure the latency of each apply_rules() call."""
+    durations: list[int] = []
+
+    for input_data in inputs:
+        start_ns: int = time.perf_counter_ns()
+        eng.apply_rules(input_data, rule_set=rule_set, verbose=verbose)
+        durations.append(time.perf_counter_ns() - start_ns)
+
+    return summarize_latencies(durations)
+
+
+def bench_throughput(
+    eng: RulesEngine, inputs: list[dict[str, Any]], rule_set: str, duration_s: float
+) -> dict[str, Any]:
+    """Count the apply_rules() calls done during a fixed duration."""
+    calls: int = 0
+    deadline: float = time.perf_counter() + duration_s
+    start: float = time.perf_counter()
+
+    while time.perf_counter() < deadline:
+        for input_data in inputs:
+            eng.apply_rules(input_data, rule_set=rule_set)
+        calls += len(inputs)
+
+    elapsed: float = time.perf_counter() - start
+    return {"calls": calls, "calls_per_s": calls / elapsed}
+
+
+def bench_batch_modes(config: dict[str, Any], inputs: list[dict[str, Any]], rule_set: str) -> dict[str, Any]:
+    """Process the whole input corpus in several execution modes (lean, verbose, statistics, tracing)."""
+    setups: dict[str, Callable[[RulesEngine], bool]] = {
+        "lean": lambda eng: False,
+        "verbose": lambda eng: True,
+        "stats": lambda eng: eng.enable_stats() or False,
+        "tracing": lambda eng: eng.add_hook(TracingHook(InMemorySpanExporter(max_traces=100))) or False,
+    }
+    results: dict[str, Any] = {}
+
+    for mode, setup in setups.items():
+        eng: RulesEngine = RulesEngine(config_dict=config)
+        verbose: bool = setup(eng)
+
+        start_ns: int = time.perf_counter_ns()
+        for input_data in inputs:
+            eng.apply_rules(input_data, rule_set=rule_set, verbose=verbose)
+        elapsed_ns: int = time.perf_counter_ns() - start_ns
+
+        results[mode] = {
+            "items": len(inputs),
+            "total_ms": elapsed_ns / 1e6,
+            "items_per_s": len(inputs) / elapsed_ns * 1e9,
+        }
+
+    return results
+
+
+def bench_memory(config: dict[str, Any], inputs: list[dict[str, Any]], rule_set: str) -> dict[str, Any]:
+    """Measure the memory retained by the engine and the peak allocation of one call."""
+    gc.collect()
+    tracemalloc.start()
+    eng: RulesEngine = RulesEngine(config_dict=config)
+    gc.collect()
+    engine_bytes, build_peak_bytes = tracemalloc.get_traced_memory()
+
+    tracemalloc.reset_peak()
+    eng.apply_rules(inputs[0], rule_set=rule_set)
+    _, call_peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    rule_count: int = sum(len(rules) for rule_set_dict in eng.rules.values() for rules in rule_set_dict.values())
+
+    return {
+        "rules": rule_count,
+        "engine_bytes": engine_bytes,
+        "build_peak_bytes": build_peak_bytes,
+        "bytes_per_rule": round(engine_bytes / max(1, rule_count), 1),
+        "call_peak_bytes": max(0, call_peak_bytes - engine_bytes),
+    }
+
+
+def run(
+    profile: str, inputs_count: int = 500, repeat: int = 5, duration_s: float = 2.0, seed: int = 0
+) -> dict[str, Any]:
+    """Run the whole suite and return its results.
+
+    Args:
+        profile: Name of the generator profile (see PROFILES).
+        inputs_count: Number of synthetic inputs.
+        repeat: Number of engine constructions timed.
+        duration_s: Duration of the throughput benchmark (seconds).
+        seed: Seed of the generator.
+
+    Returns:
+        A dictionary of results (with the environment and the parameters).
+    """
+    params: dict[str, Any] = PROFILES[profile]
+    config: dict[str, Any] = generate_config(seed=seed, **params)
+    inputs: list[dict[str, Any]] = generate_inputs(inputs_count, input_fields=params["input_fields"], seed=seed)
+    rule_set: str = "rule_set_0"
+
+    eng: RulesEngine = RulesEngine(config_dict=config)
+
+    # Warm up
+    for input_data in inputs[:50]:
+        eng.apply_rules(input_data, rule_set=rule_set)
+
+    return {
+        "environment": environment(),
+        "parameters": {"profile": profile, "inputs": inputs_count, "seed": seed, **params},
+        "results": {
+            "build": bench_build(config, repeat),
+            "latency": bench_latency(eng, inputs, rule_set, verbose=False),
+            "latency_verbose": bench_latency(eng, inputs, rule_set, verbose=True),
+            "throughput": bench_throughput(eng, inputs, rule_set, duration_s),
+            "batch": bench_batch_modes(config, inputs, rule_set),
+            "memory": bench_memory(config, inputs, rule_set),
+        },
+    }
+
+
+def main() -> None:
+    """Run the suite, print and optionally save its JSON results."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="medium", help="Size of the rule sets.")
+    parser.add_argument("--inputs", type=int, default=500, help="Number of synthetic inputs.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of engine constructions timed.")
+    parser.add_argument("--duration", type=float, default=2.0, help="Duration of the throughput benchmark (s).")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the generator.")
+    parser.add_argument("--output", type=Path, default=None, help="Path of the JSON baseline to write.")
+    args = parser.parse_args()
+
+    results: dict[str, Any] = run(args.profile, args.inputs, args.repeat, args.duration, args.seed)
+    output: str = json.dumps(results, indent=2)
+
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(output + "\n", encoding="utf-8")
+
+    print(output)  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,9 @@
 from importlib.metadata import version
 
 from arta._engine import RulesEngine
+from arta.registry import EngineRegistry
+from arta.reload import ReloadableRulesEngine
 
-__all__ = ["RulesEngine"]
+__all__ = ["EngineRegistry", "ReloadableRulesEngine", "RulesEngine"]
 
 __version__ = version("arta")
@@ -6,19 +6,33 @@ Class: RulesEngine
 from __future__ import annotations
 
 import copy
+import gc
 import importlib
 import inspect
+import itertools
 import logging
+import time
+from collections.abc import Iterable, Mapping, Sequence
 from inspect import getmembers, isclass, isfunction
 from pathlib import Path
-from types import FunctionType, MethodType, ModuleType
+from types import FunctionType, MappingProxyType, MethodType, ModuleType
 from typing import Any, Callable
 
+from arta.cache import PURE_ATTRIBUTE, CacheInfo, FunctionCache, InternPool, is_pure
 from arta.condition import BaseCondition, SimpleCondition, StandardCondition
 from arta.config import load_config
+from arta.context import EvaluationContext
+from arta.dataset import ReferenceDataset, load_datasets
+from arta.decision_tree import DecisionTree, UnsupportedGroupError
+from arta.diagnostics import DEPRECATED_INPUT_DATA, IGNORED_CONDITION
+from arta.hooks import EngineHook
+from arta.incremental import BuildState, get_config_digest, get_module_mtime
 from arta.models import Configuration, RulesDict
+from arta.pattern_index import GroupPatternIndex
 from arta.rule import Rule
-from arta.utils import ParsingErrorStrategy, RuleActivationMode
+from arta.stats import StatsCollector
+from arta.utils import InputNamespace, ParsingErrorStrategy, RuleActivationMode
+from arta.window import SlidingWindow, build_windows
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -44,6 +58,7 @@ class RulesEngine:
     CONST_CONDITION_VALIDATION_FUNCTION_CONF_KEY: str = "validation_function"
     CONST_CONDITION_DESCRIPTION_CONF_KEY: str = "description"
     CONST_CONDITION_VALIDATION_PARAMETERS_CONF_KEY: str = "condition_parameters"
+    CONST_CONDITION_PURE_CONF_KEY: str = "pure"
     CONST_USER_CONDITION_STRING: str = "USER_CONDITION"
 
     # Built-in factory mapping
@@ -58,6 +73,8 @@ class RulesEngine:
         rules_dict: dict[str, dict[str, Any]] | None = None,
         config_path: Path | str | None = None,
         config_dict: dict[str, Any] | None = None,
+        previous: RulesEngine | None = None,
+        intern_pool: InternPool | None = None,
     ) -> None:
         """Initialize the rules.
 
@@ -68,6 +85,10 @@ class RulesEngine:
             config_path: Path to the directory containing the YAML files.
             config_dict: A dictionary containing the configuration (same as YAML files but already
                          parsed in a dictionary).
+            previous: Engine built from a previous version of the configuration (incremental rebuild):
+                      its unchanged conditions and rules are reused and its unchanged source modules
+                      are not re-imported (modified ones are reloaded).
+            intern_pool: Pool of interned values shared with other engines (e.g., tenants of an EngineRegistry).
 
         Raises:
             KeyError: Key not found.
@@ -85,11 +106,50 @@ class RulesEngine:
             logger.error(msg)
             raise ValueError(msg)
 
+        if previous is not None and rules_dict is not None:
+            msg = "'previous' can only be used with 'config_path' or 'config_dict'."
+            logger.error(msg)
+            raise ValueError(msg)
+
         # Init. default global settings (useful if not set, can't be set in the Pydantic model
         # because of the rules dict mode)
         self._parsing_error_strategy: ParsingErrorStrategy = ParsingErrorStrategy.RAISE
         self._rule_activation_mode: RuleActivationMode = RuleActivationMode.ONE_BY_GROUP
 
+        # Memoization caches of the pure functions (k: function qualified name, v: cache)
+        self._function_caches: dict[str, FunctionCache] = {}
+
+        # Opt-in execution statistics
+        self._stats_collector: StatsCollector | None = None
+        self._hooks: tuple[EngineHook, ...] = ()
+
+        # Structures shared between rules (compact representation)
+        self._intern_pool: InternPool = intern_pool if intern_pool is not None else InternPool()
+        self._condition_registry: dict[tuple[type[BaseCondition], str], BaseCondition] = {}
+        self._frozen: bool = False
+
+        # Incremental rebuild: what the engine is built from (config only) and the previous engine's one
+        self._build_state: BuildState | None = None
+        self._build_report: dict[str, Any] = {}
+
+        # Decision trees of the compiled rule groups (k: (rule set, group id)), see compile_decision_trees()
+        self._decision_trees: dict[tuple[str, str], DecisionTree] = {}
+        self._decision_tree_report: dict[str, dict[str, Any]] = {}
+
+        # Pattern indexes of the rule groups (k: (rule set, group id)), see compile_pattern_indexes()
+        self._pattern_indexes: dict[tuple[str, str], GroupPatternIndex] = {}
+        self._pattern_index_report: dict[str, dict[str, Any]] = {}
+
+        # Reference datasets of the simple conditions (k: name, v: memory-mapped dataset)
+        self._datasets: dict[str, ReferenceDataset] = {}
+
+        # Sliding windows of the simple conditions (k: name, v: window updated by each request)
+        self._windows: dict[str, SlidingWindow] = {}
+        # Sliding windows used by each rule set (k: rule set, v: windows updated by its requests)
+        self._rule_set_windows: dict[str, tuple[SlidingWindow, ...]] = {}
+
+        previous_state: BuildState | None = previous._build_state if previous is not None else None
+
         # Initialize directly with a rules dict
         if rules_dict is not None:
             # Data validation
@@ -107,7 +167,7 @@ class RulesEngine:
                 raise KeyError(msg)
 
             # Attribute definition
-            self.rules: dict[str, dict[str, list[Rule]]] = self._adapt_user_rules_dict(rules_dict)
+            self.rules: Mapping[str, Mapping[str, Sequence[Rule]]] = self._adapt_user_rules_dict(rules_dict)
 
         # Initialize with a config_path or config_dict
         else:
@@ -117,6 +177,14 @@ class RulesEngine:
 
             # Data validation
             config: Configuration = Configuration.model_validate(config_dict)
+            config_data: dict[str, Any] = config.model_dump()
+
+            state: BuildState = BuildState()
+            state.report["incremental"] = previous_state is not None
+
+            if previous is not None and previous_state is not None:
+                # Caches of the unchanged pure functions are kept
+                self._function_caches.update(previous._function_caches)
 
             if config.parsing_error_strategy is not None:
                 # Set parsing error handling strategy from config
@@ -126,20 +194,47 @@ class RulesEngine:
                 # Set rule activation mode from config
                 self._rule_activation_mode = RuleActivationMode(config.rule_activation_mode)
 
+            if config.reference_datasets is not None:
+                # Relative paths are resolved from the configuration directory (unchanged datasets are reused)
+                state.datasets = load_datasets(
+                    config_data["reference_datasets"],
+                    Path(config_path) if config_path is not None else Path.cwd(),
+                    previous_state.datasets if previous_state is not None else None,
+                )
+                self._datasets = {name: dataset for name, (_, dataset) in state.datasets.items()}
+
+            if config.sliding_windows is not None:
+                # Unchanged windows are reused with their events
+                state.windows = build_windows(
+                    config_data["sliding_windows"], previous_state.windows if previous_state is not None else None
+                )
+                self._windows = {name: window for name, (_, window) in state.windows.items()}
+
+                same_names: list[str] = sorted(self._windows.keys() & self._datasets.keys())
+                if len(same_names) > 0:
+                    msg = f"Datasets and windows can't have the same name: {same_names}."
+                    logger.error(msg)
+                    raise ValueError(msg)
+
             # dict of available action functions (k: function name, v: function object)
             action_modules: list[str] = config.actions_source_modules
-            action_functions: dict[str, Callable] = self._get_object_from_source_modules(action_modules)
+            action_functions: dict[str, Callable] = self._load_source_modules(action_modules, previous_state, state)
 
             # dict of available standard condition functions (k: function name, v: function object)
             condition_modules: list[str] = (
                 config.conditions_source_modules if config.conditions_source_modules is not None else []
             )
-            std_condition_functions: dict[str, Callable] = self._get_object_from_source_modules(condition_modules)
+            std_condition_functions: dict[str, Callable] = self._load_source_modules(
+                condition_modules, previous_state, state
+            )
 
             # Dictionary of condition instances (k: condition id, v: instance), built from config data
             if len(std_condition_functions) > 0:
                 std_condition_instances = self._build_std_conditions(
-                    config=config.model_dump(), condition_functions_dict=std_condition_functions
+                    config=config_data,
+                    condition_functions_dict=std_condition_functions,
+                    previous_state=previous_state,
+                    state=state,
                 )
 
             # User-defined/custom conditions
@@ -147,8 +242,8 @@ class RulesEngine:
                 logger.info("Custom condition configuration detected.")
 
                 # dict of custom condition classes (k: classe name, v: class object)
-                custom_condition_classes: dict[str, type[BaseCondition]] = self._get_object_from_source_modules(
-                    config.custom_classes_source_modules
+                custom_condition_classes: dict[str, type[BaseCondition]] = self._load_source_modules(
+                    config.custom_classes_source_modules, previous_state, state
                 )
 
                 # Build a factory mapping dictionary (k: conf key, v:class object)
@@ -166,9 +261,16 @@ class RulesEngine:
             self.rules = self._build_rules(
                 std_condition_instances=std_condition_instances,
                 action_functions=action_functions,
-                config=config.model_dump(),
+                config=config_data,
                 factory_mapping_classes=factory_mapping_classes,
+                previous=previous if previous_state is not None else None,
+                state=state,
             )
+            self._build_state = state
+            self._build_report = state.report
+
+            if len(self._windows) > 0:
+                self._rule_set_windows = self._get_rule_set_windows()
 
         logger.info(
             f"Rules engine correctly instanciated with '{str(self._parsing_error_strategy)}' and '{str(self._rule_activation_mode)}'"
@@ -176,11 +278,12 @@ class RulesEngine:
 
     def apply_rules(
         self,
-        input_data: dict[str, Any],
+        input_data: Any,
         *,
         rule_set: str | None = None,
         ignored_rules: set[str] | None = None,
         verbose: bool = False,
+        copy_input: bool | None = None,
         **kwargs: Any,
     ) -> dict[str, Any]:
         """Apply the rules and return results.
@@ -194,18 +297,25 @@ class RulesEngine:
         This means that the order of the rules in the configuration file
         (e.g., rules.yaml) is meaningful.
 
+        The results of the rule groups (the 'output' data path) are stored with the data of the request,
+        never in the input data.
+
         Args:
-            input_data: Input data to apply rules on.
+            input_data: Input data to apply rules on: a dictionary, or an object whose attributes are read
+                (e.g., a dataclass, a Pydantic model, see arta.path.get_item()).
             rule_set: Apply rules associated with the specified rule set.
             ignored_rules: A set/list of rule's ids to be ignored/disabled during evaluation.
             verbose: If True, add extra ids (group_id, rule_id) for result explicability.
+            copy_input: If True, the input data is deep-copied: the functions modifying it (value sharing) can't
+                modify the data of the caller. If False, it is not (faster for large inputs). By default (None),
+                dictionaries are deep-copied and objects are read in place.
             **kwargs: For user extra arguments.
 
         Returns:
             A dictionary containing the rule groups' results (k: group id, v: action result).
 
         Raises:
-            TypeError: Wrong type (e.g., input_data is not a dictionary).
+            TypeError: Wrong type (e.g., input_data is a string).
             KeyError: Key not found (e.g., input_data is an empty dictionary).
             RuleExecutionError: A rule fails during execution.
             ConditionExecutionError: A condition fails during execution.
@@ -213,82 +323,534 @@ class RulesEngine:
         rule_count: int = 0
 
         # Input_data validation
-        if not isinstance(input_data, dict):
-            msg: str = f"'input_data' must be dict type, not '{type(input_data)}'."
+        if not isinstance(input_data, Mapping) and type(input_data).__module__ == "builtins":
+            msg: str = f"'input_data' must be a dictionary or an object (e.g., a dataclass), not '{type(input_data)}'."
             logger.error(msg)
             raise TypeError(msg)
-        elif len(input_data) == 0:
+        elif isinstance(input_data, dict) and len(input_data) == 0:
             msg = "'input_data' couldn't be empty."
             logger.error(msg)
             raise KeyError(msg)
 
         # Var init.
-        input_data_copy: dict[str, Any] = copy.deepcopy(input_data)
+        # Data of the request: input data and results ('output' key), the input data of the caller is never modified
+        # (except by value sharing functions if it is not copied)
+        input_data_copy: dict[str, Any]
+        if isinstance(input_data, dict):
+            input_data_copy = copy.deepcopy(input_data) if copy_input is not False else dict(input_data)
+            input_data_copy["output"] = {}
+        else:
+            # Objects are read without conversion (see arta.path.get_item()) nor copy (the results are stored apart)
+            input_data_copy = InputNamespace(copy.deepcopy(input_data) if copy_input else input_data)
+
         ignored_ids: set[str] = ignored_rules if ignored_rules is not None else set()
         if len(ignored_ids) > 0:
-            logger.info(f"Configured ignored rules are: {ignored_ids}")
-
-        # Prepare the result key
-        input_data_copy["output"] = {}
+            logger.info("Configured ignored rules are: %s", ignored_ids)
 
         # If there is no given rule set param. and there is only one rule set in self.rules
         # and its value is 'default_rule_set', look for this one (rule_set='default_rule_set')
         if rule_set is None and len(self.rules) == 1 and self.rules.get(self.CONST_DFLT_RULE_SET_ID) is not None:
             rule_set = self.CONST_DFLT_RULE_SET_ID
 
-        logger.info(f"Rules engine is running with the following rule set: '{rule_set}', verbose: {verbose}")
+        logger.info("Rules engine is running with the following rule set: '%s', verbose: %s", rule_set, verbose)
 
         # Check if given rule set is in self.rules?
-        if rule_set not in self.rules:
+        if rule_set is None or rule_set not in self.rules:
             msg = f"Rule set '{rule_set}' not found in the rules, available rule sets are : {list(self.rules.keys())}."
             logger.error(msg)
             raise KeyError(msg)
 
         # Var init.
-        results_dict: dict[str, Any] = {"verbosity": {"rule_set": rule_set, "results": []}}
+        # Verbosity details are only built when requested
+        results_dict: dict[str, Any] = {"verbosity": {"rule_set": rule_set, "results": []}} if verbose else {}
+        stats_collector: StatsCollector | None = self._stats_collector
+        hooks: tuple[EngineHook, ...] = self._hooks
+        context: EvaluationContext = EvaluationContext(
+            record_stats=stats_collector is not None and stats_collector.should_sample(), hooks=hooks
+        )
+        set_start_ns: int = 0
+        error: BaseException | None = None
+        # Instrumented requests record every evaluated rule: no shortcut
+        decision_trees: dict[tuple[str, str], DecisionTree] = {} if context.instrumented else self._decision_trees
+        pattern_indexes: dict[tuple[str, str], GroupPatternIndex] = (
+            {} if context.instrumented else self._pattern_indexes
+        )
+
+        if len(hooks) > 0:
+            set_start_ns = time.perf_counter_ns()
+            for hook in hooks:
+                hook.on_rule_set_start(rule_set, set_start_ns)
+
+        # Events of the sliding windows used by the rule set (the current one is part of the aggregates)
+        recorded_events: list[tuple[SlidingWindow, tuple[Any, float, float | None]]] = []
+        for window in self._rule_set_windows.get(rule_set, ()):
+            event: tuple[Any, float, float | None] | None = window.record(input_data_copy)
+            if event is not None:
+                recorded_events.append((window, event))
+
+        try:
+            # Groups' loop
+            for group_id, rules_list in self.rules[rule_set].items():
+                group_rule_count: int = 0
+                logger.debug("Entering rule group: %s", group_id)
+
+                group_start_ns: int = 0
+                if len(hooks) > 0:
+                    group_start_ns = time.perf_counter_ns()
+                    for hook in hooks:
+                        hook.on_group_start(rule_set, group_id, group_start_ns)
+
+                # Initialize result of the rule group with None
+                results_dict[group_id] = None
+
+                # Pattern conditions of the group are verified together (indexed groups only)
+                group_index: GroupPatternIndex | None = (
+                    pattern_indexes.get((rule_set, group_id)) if len(pattern_indexes) > 0 else None
+                )
+                pattern_results: dict[Any, bool] = {}
+                if group_index is not None:
+                    pattern_results = group_index.match(input_data_copy, self._parsing_error_strategy)
+                    context.condition_results.update(pattern_results)
+
+                # Start from the first rule which can be activated (compiled groups only)
+                group_rules: Iterable[Rule] = rules_list
+                if len(decision_trees) > 0:
+                    tree: DecisionTree | None = decision_trees.get((rule_set, group_id))
+                    first_match: int | None = tree.find_first_match(input_data_copy) if tree is not None else None
+                    if first_match is not None:
+                        group_rules = itertools.islice(rules_list, first_match, None)
+
+                # Rules which can't be activated are skipped (indexed groups whose conditions can't modify the data,
+                # which doesn't change before the break)
+                if (
+                    group_index is not None
+                    and group_index.filterable
+                    and self._rule_activation_mode is RuleActivationMode.ONE_BY_GROUP
+                ):
+                    group_rules = group_index.filter_rules(group_rules, pattern_results)
+
+                # Rules' loop (inside a group)
+                for rule in group_rules:
+                    if rule._rule_id in ignored_ids:
+                        # Ignore that rule
+                        continue
+
+                    rule_count += 1
+                    group_rule_count += 1
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Evaluating rule '%s': %s", group_rule_count, rule._rule_id)
+
+                    # Apply rules
+                    is_activated: bool
+                    action_result: Any
+                    start_ns: int = time.perf_counter_ns() if context.instrumented else 0
+
+                    if verbose:
+                        action_result, rule_details = rule.apply(
+                            input_data_copy,
+                            parsing_error_strategy=self._parsing_error_strategy,
+                            context=context,
+                            **kwargs,
+                        )
+                        is_activated = "action_result" in rule_details
+                    else:
+                        # Lean execution path (no result details)
+                        is_activated, action_result = rule.apply_lean(
+                            input_data_copy,
+                            parsing_error_strategy=self._parsing_error_strategy,
+                            context=context,
+                            **kwargs,
+                        )
+
+                    if context.instrumented:
+                        context.record_rule(
+                            rule_set, group_id, rule._rule_id, is_activated, start_ns, time.perf_counter_ns() - start_ns
+                        )
+
+                    # Check if the rule has been applied (= action activated)
+                    if is_activated:
+                        # Save result and details
+                        results_dict[group_id] = action_result
+                        if verbose:
+                            results_dict["verbosity"]["results"].append(rule_details)
+
+                        # Update input data with current result with key 'output' (can be used in next rules)
+                        input_data_copy["output"][group_id] = copy.deepcopy(results_dict[group_id])
+
+                        # Data may have changed: condition results can't be shared anymore
+                        context.invalidate()
+
+                        if self._rule_activation_mode is RuleActivationMode.ONE_BY_GROUP:
+                            # We can only have one result per group => break when the rule is activated
+                            break
+
+                        # Condition results have been forgotten: the patterns are matched again
+                        if group_index is not None:
+                            context.condition_results.update(
+                                group_index.match(input_data_copy, self._parsing_error_strategy)
+                            )
+
+                if len(hooks) > 0:
+                    group_end_ns: int = time.perf_counter_ns()
+                    for hook in hooks:
+                        hook.on_group_end(rule_set, group_id, group_start_ns, group_end_ns - group_start_ns)
+        except BaseException as exc:
+            error = exc
+
+            # Failed requests are not part of the aggregates
+            for window, event in recorded_events:
+                window.forget(event)
+            raise
+        finally:
+            if context.stats_records is not None and stats_collector is not None:
+                # Statistics of the request are merged at once
+                stats_collector.merge(context.stats_records)
+
+            if len(hooks) > 0:
+                set_end_ns: int = time.perf_counter_ns()
+                for hook in hooks:
+                    hook.on_rule_set_end(rule_set, set_start_ns, set_end_ns - set_start_ns, error)
+
+        logger.info("'%s' rules were correctly evaluated against input data.", rule_count)
+        return results_dict
+
+    def enable_stats(self, sample_rate: int = 1, reservoir_size: int = 1024) -> None:
+        """Start collecting execution statistics (evaluations, activations, latencies).
+
+        Args:
+            sample_rate: One request out of 'sample_rate' is recorded (1 means every request).
+            reservoir_size: Maximum number of latency samples kept per item for the percentiles.
+        """
+        self._stats_collector = StatsCollector(sample_rate=sample_rate, reservoir_size=reservoir_size)
+
+    def disable_stats(self) -> None:
+        """Stop collecting execution statistics (collected statistics are lost)."""
+        self._stats_collector = None
+
+    def stats(self) -> dict[str, Any]:
+        """Return a snapshot of the execution statistics per rule, per condition id and per action.
+
+        Returns:
+            A dictionary of statistics (empty if statistics are not enabled), see StatsCollector.snapshot().
+        """
+        if self._stats_collector is None:
+            return {}
+
+        return self._stats_collector.snapshot()
+
+    def reset_stats(self) -> None:
+        """Reset the execution statistics."""
+        if self._stats_collector is not None:
+            self._stats_collector.reset()
+
+    def add_hook(self, hook: EngineHook) -> None:
+        """Register an execution hook (see arta.hooks), called during each following call of apply_rules().
+
+        Args:
+            hook: The hook to register.
+        """
+        # Immutable tuple: requests running concurrently keep the hooks they started with
+        self._hooks = (*self._hooks, hook)
+
+    def remove_hook(self, hook: EngineHook) -> None:
+        """Unregister an execution hook.
+
+        Args:
+            hook: The hook to unregister.
+
+        Raises:
+            ValueError: The hook is not registered.
+        """
+        if hook not in self._hooks:
+            raise ValueError(f"Hook '{hook}' is not registered.")
+
+        self._hooks = tuple(registered for registered in self._hooks if registered is not hook)
 
-        # Groups' loop
-        for group_id, rules_list in self.rules[rule_set].items():
-            group_rule_count: int = 0
-            logger.debug(f"Entering rule group: {group_id}")
+    def diagnostics(self) -> dict[str, dict[str, int]]:
+        """Return the counters of the diagnostic events (only reported once per rule or condition).
+
+        Returns:
+            A dictionary as: {'deprecated_input_data': {'rule_set/group_id/rule_id': count},
+            'ignored_condition': {condition id: count}} (events without occurrence are omitted).
+        """
+        diagnostics: dict[str, dict[str, int]] = {DEPRECATED_INPUT_DATA: {}, IGNORED_CONDITION: {}}
 
-            # Initialize result of the rule group with None
-            results_dict[group_id] = None
+        for rule_set, rule_set_dict in self.rules.items():
+            for group_id, rules_list in rule_set_dict.items():
+                for rule in rules_list:
+                    for counter_kind, key, counter in rule.get_event_counters():
+                        if counter.count > 0:
+                            item_id: str = key if counter_kind == IGNORED_CONDITION else f"{rule_set}/{group_id}/{key}"
+                            diagnostics[counter_kind][item_id] = counter.count
+
+        return diagnostics
+
+    def reset_diagnostics(self) -> None:
+        """Reset the counters of the diagnostic events (the next occurrences will be reported again)."""
+        for rule_set_dict in self.rules.values():
+            for rules_list in rule_set_dict.values():
+                for rule in rules_list:
+                    for _, _, counter in rule.get_event_counters():
+                        counter.reset()
+
+    def cache_info(self) -> dict[str, CacheInfo]:
+        """Return the memoization statistics of the pure functions.
+
+        Returns:
+            A dictionary of statistics (k: function qualified name, v: CacheInfo).
+        """
+        return {name: cache.info() for name, cache in self._function_caches.items()}
+
+    def cache_clear(self) -> None:
+        """Clear the memoization caches of the pure functions."""
+        for cache in self._function_caches.values():
+            cache.clear()
+
+    def freeze(self, gc_freeze: bool = True) -> None:
+        """Finalize the rules engine before forking worker processes (e.g., pre-fork servers).
+
+        The rules become read-only (rule sets and groups are wrapped in read-only mappings, rule lists in tuples)
+        and the structures only needed at build time are released. Then, all the objects are moved
+        to the permanent generation of the garbage collector (gc.freeze()): the collections of the forked workers
+        no longer write into their memory pages, which stay shared with the parent process (copy-on-write).
+
+        Args:
+            gc_freeze: If False, gc.freeze() is not called (e.g., if your server already does it).
+        """
+        if not self._frozen:
+            self.rules = MappingProxyType(
+                {
+                    rule_set: MappingProxyType({group_id: tuple(rules) for group_id, rules in groups.items()})
+                    for rule_set, groups in self.rules.items()
+                }
+            )
+
+            # Build time only structures (the built rules keep the shared objects)
+            self._intern_pool = InternPool()
+            self._condition_registry = {}
+            self._build_state = None
+            self._frozen = True
+
+        if gc_freeze:
+            gc.collect()
+            gc.freeze()
+
+    def build_info(self) -> dict[str, Any]:
+        """Return what has been reused by the last build (see 'previous' parameter of RulesEngine).
+
+        Returns:
+            A dictionary as: {'incremental': bool, 'reused_rules': int, 'built_rules': int,
+            'reused_conditions': int, 'built_conditions': int, 'reloaded_modules': [module names]}
+            (empty if the engine is built from a rules dictionary).
+        """
+        return copy.deepcopy(self._build_report)
+
+    def compile_decision_trees(self, min_rules: int = 2, max_nodes: int = 10_000) -> dict[str, dict[str, Any]]:
+        """Compile the rule groups made of simple conditions into decision trees (ONE_BY_GROUP mode only).
+
+        A compiled group finds the first rule which can be activated in O(tree depth), then rules are applied
+        as usual from this rule (same results, verbosity and errors). Requests the tree can't decide
+        (e.g., missing key, unexpected value type) and instrumented requests (statistics, hooks)
+        verify the rules one by one, like the groups which can't be compiled.
+
+        Args:
+            min_rules: Minimum number of rules of a compiled group.
+            max_nodes: Maximum number of split nodes of a decision tree (else, the group is not compiled).
+
+        Returns:
+            The compilation report, see decision_tree_info().
+        """
+        decision_trees: dict[tuple[str, str], DecisionTree] = {}
+        report: dict[str, dict[str, Any]] = {}
 
-            # Rules' loop (inside a group)
-            for rule in rules_list:
-                if rule._rule_id in ignored_ids:
-                    # Ignore that rule
+        for rule_set, rule_set_dict in self.rules.items():
+            for group_id, rules_list in rule_set_dict.items():
+                key: str = f"{rule_set}/{group_id}"
+
+                if self._rule_activation_mode is not RuleActivationMode.ONE_BY_GROUP:
+                    report[key] = {"compiled": False, "reason": "Only the ONE_BY_GROUP activation mode is supported."}
                     continue
 
-                rule_count += 1
-                group_rule_count += 1
-                logger.debug(f"Evaluating rule '{group_rule_count}': {rule._rule_id}")
+                if len(rules_list) < min_rules:
+                    report[key] = {"compiled": False, "reason": f"Less than {min_rules} rules."}
+                    continue
 
-                # Apply rules
-                action_result, rule_details = rule.apply(
-                    input_data_copy, parsing_error_strategy=self._parsing_error_strategy, **kwargs
-                )
+                try:
+                    tree: DecisionTree = DecisionTree(rules_list, self._parsing_error_strategy, max_nodes)
+                except UnsupportedGroupError as error:
+                    report[key] = {"compiled": False, "reason": str(error)}
+                    continue
 
-                # Check if the rule has been applied (= action activated)
-                if "action_result" in rule_details:
-                    # Save result and details
-                    results_dict[group_id] = action_result
-                    results_dict["verbosity"]["results"].append(rule_details)
+                decision_trees[(rule_set, group_id)] = tree
+                report[key] = {
+                    "compiled": True,
+                    "rules": tree.rule_count,
+                    "nodes": tree.node_count,
+                    "depth": tree.depth,
+                }
 
-                    # Update input data with current result with key 'output' (can be used in next rules)
-                    input_data_copy["output"][group_id] = copy.deepcopy(results_dict[group_id])
+        # Swapped at once (concurrent requests)
+        self._decision_trees = decision_trees
+        self._decision_tree_report = report
+        logger.info("%s rule group(s) compiled into decision trees.", len(decision_trees))
 
-                    if self._rule_activation_mode is RuleActivationMode.ONE_BY_GROUP:
-                        # We can only have one result per group => break when "action_result" in rule_details
-                        break
+        return self.decision_tree_info()
 
-        # Handling non-verbose mode
-        if not verbose:
-            results_dict.pop("verbosity")
+    def decision_tree_info(self) -> dict[str, dict[str, Any]]:
+        """Return the report of the last compilation of the rule groups (see compile_decision_trees()).
 
-        logger.info(f"'{rule_count}' rules were correctly evaluated against input data.")
-        return results_dict
+        Returns:
+            A dictionary as: {'rule_set/group_id': {'compiled': True, 'rules': int, 'nodes': int, 'depth': int}
+            or {'compiled': False, 'reason': str}} (empty if the groups have not been compiled).
+        """
+        return copy.deepcopy(self._decision_tree_report)
+
+    def compile_pattern_indexes(self, min_patterns: int = 2) -> dict[str, dict[str, Any]]:
+        """Index the simple conditions of each rule group searching substrings or patterns in the same data path.
+
+        E.g., 'input.comment contains "refund"', 'input.comment matches /^urgent/'
+
+        An indexed group verifies these conditions together before evaluating its rules: literal patterns
+        are found in one pass over the text (Aho-Corasick automaton) and the other regular expressions are
+        skipped at once when their combined alternation doesn't match. Rules are then applied as usual
+        (both activation modes, same results, verbosity and errors). Texts which are not strings
+        (e.g., missing key) and instrumented requests (statistics, hooks) verify the conditions one by one.
+
+        Args:
+            min_patterns: Minimum number of conditions of an indexed data path.
+
+        Returns:
+            The compilation report, see pattern_index_info().
+        """
+        pattern_indexes: dict[tuple[str, str], GroupPatternIndex] = {}
+        report: dict[str, dict[str, Any]] = {}
+
+        for rule_set, rule_set_dict in self.rules.items():
+            for group_id, rules_list in rule_set_dict.items():
+                key: str = f"{rule_set}/{group_id}"
+                group_index: GroupPatternIndex = GroupPatternIndex(rules_list, min_patterns)
+
+                if len(group_index.indexes) == 0:
+                    report[key] = {"compiled": False, "reason": f"Less than {min_patterns} pattern conditions."}
+                    continue
+
+                pattern_indexes[(rule_set, group_id)] = group_index
+                report[key] = {
+                    "compiled": True,
+                    "paths": {
+                        index.path: {"literals": index.literal_count, "regexes": index.regex_count}
+                        for index in group_index.indexes
+                    },
+                }
+
+        # Swapped at once (concurrent requests)
+        self._pattern_indexes = pattern_indexes
+        self._pattern_index_report = report
+        logger.info("%s rule group(s) with pattern indexes.", len(pattern_indexes))
+
+        return self.pattern_index_info()
+
+    def pattern_index_info(self) -> dict[str, dict[str, Any]]:
+        """Return the report of the last indexing of the rule groups (see compile_pattern_indexes()).
+
+        Returns:
+            A dictionary as: {'rule_set/group_id': {'compiled': True, 'paths': {path: {'literals': int,
+            'regexes': int}}} or {'compiled': False, 'reason': str}} (empty if the groups have not been indexed).
+        """
+        return copy.deepcopy(self._pattern_index_report)
+
+    def dataset_info(self) -> dict[str, dict[str, Any]]:
+        """Return the reference datasets of the configuration (see 'reference_datasets').
+
+        Returns:
+            A dictionary as: {name: {'size': int, 'path': str, 'bloom_filter': bool}}
+            ('path' is the index file, removed once mapped if built from a CSV file).
+        """
+        return {
+            name: {"size": dataset.size, "path": dataset.path, "bloom_filter": dataset.bloom_filter is not None}
+            for name, dataset in self._datasets.items()
+        }
+
+    def window_info(self) -> dict[str, dict[str, Any]]:
+        """Return the state of the sliding windows of the configuration (see 'sliding_windows').
+
+        Returns:
+            A dictionary as: {name: {'duration': float, 'keys': int, 'evicted_keys': int, 'dropped_events': int}}
+            ('evicted_keys' and 'dropped_events' count what has been removed before expiring: max_keys, max_events).
+        """
+        return {name: {"duration": window.duration, **window.info()} for name, window in self._windows.items()}
+
+    @property
+    def is_frozen(self) -> bool:
+        """True if the rules engine has been frozen (see freeze())."""
+        return self._frozen
+
+    def _get_function_cache(self, function: Callable | None, force: bool = False) -> FunctionCache | None:
+        """(Protected)
+        Return the memoization cache of a function if it is pure (one cache per function).
+
+        Args:
+            function: A validation or action function.
+            force: Memoize the function even if not decorated with @pure (e.g., 'pure: true' in the configuration).
+
+        Returns:
+            The function cache or None if the function is not pure.
+        """
+        if function is None or not (force or is_pure(function)):
+            return None
+
+        name: str = FunctionCache.get_function_name(function)
+
+        # A cache of another function with the same name (e.g., reloaded module) is replaced
+        if name not in self._function_caches or self._function_caches[name].function is not function:
+            maxsize: int | None = getattr(function, PURE_ATTRIBUTE, None)
+            self._function_caches[name] = (
+                FunctionCache(function, maxsize) if maxsize is not None else FunctionCache(function)
+            )
+
+        return self._function_caches[name]
+
+    def _load_source_modules(
+        self, module_list: list[str], previous_state: BuildState | None, state: BuildState
+    ) -> dict[str, Any]:
+        """(Protected)
+        Collect all functions and classes defined in the list of modules (see _get_object_from_source_modules()).
+
+        With a previous build, unchanged modules are not re-imported (their objects are reused)
+        and modules whose source file has been modified are reloaded.
+
+        Args:
+            module_list: List of source module names.
+            previous_state: What the previous engine is built from (None if not incremental).
+            state: What the current engine is built from.
+
+        Returns:
+            Dictionary with objects found in the modules.
+        """
+        object_dict: dict[str, Any] = {}
+
+        for module_name in module_list:
+            if module_name not in state.modules:
+                previous_module: tuple[int | None, dict[str, Any]] | None = (
+                    previous_state.modules.get(module_name) if previous_state is not None else None
+                )
+                mod: ModuleType = importlib.import_module(module_name)
+                mtime: int | None = get_module_mtime(mod)
+
+                if previous_module is not None and previous_module[0] == mtime:
+                    # Unchanged module
+                    state.modules[module_name] = previous_module
+                else:
+                    if previous_module is not None:
+                        importlib.reload(mod)
+                        state.report["reloaded_modules"].append(module_name)
+                        logger.info(f"Source module '{module_name}' has been modified and is reloaded.")
+
+                    state.modules[module_name] = (mtime, self._get_object_from_source_modules([module_name]))
+
+            object_dict.update(state.modules[module_name][1])
+
+        return object_dict
 
     @staticmethod
     def _get_object_from_source_modules(module_list: list[str]) -> dict[str, Any]:
@@ -323,6 +885,8 @@ class RulesEngine:
         action_functions: dict[str, Callable],
         config: dict[str, Any],
         factory_mapping_classes: dict[str, type[BaseCondition]],
+        previous: RulesEngine | None = None,
+        state: BuildState | None = None,
     ) -> dict[str, dict[str, list[Any]]]:
         """(Protected)
         Return a dictionary of Rule instances built from the configuration.
@@ -332,6 +896,8 @@ class RulesEngine:
             action_functions: Dictionary of action functions (k: action name, v: Callable)
             config: Dictionary of the imported configuration from yaml files.
             factory_mapping_classes: A mapping dictionary (k: condition conf. key, v: custom class object)
+            previous: Engine built from a previous version of the configuration (its unchanged rules are reused).
+            state: What the engine is built from (updated).
 
         Returns:
             A dictionary of rules.
@@ -339,6 +905,30 @@ class RulesEngine:
         # Var init.
         rules_dict: dict[str, dict[str, list[Any]]] = {}
 
+        # Rules of the previous engine (only if the condition classes, the datasets and the windows are unchanged)
+        previous_rules: dict[tuple[str, str, str], Rule] = {}
+        previous_digests: dict[tuple[str, str, str], bytes] = {}
+
+        if (
+            previous is not None
+            and previous._build_state is not None
+            and previous._build_state.factory_mapping == factory_mapping_classes
+            and previous._build_state.datasets == (state.datasets if state is not None else {})
+            and previous._build_state.windows == (state.windows if state is not None else {})
+        ):
+            previous_digests = previous._build_state.rules
+            for previous_groups in previous.rules.values():
+                for previous_list in previous_groups.values():
+                    for old_rule in previous_list:
+                        previous_rules[(old_rule._set_id, old_rule._group_id, old_rule._rule_id)] = old_rule
+                        # Custom and simple conditions stay shared with the new rules
+                        for cond_id, condition in old_rule._condition_instances.items():
+                            if not isinstance(condition, StandardCondition):
+                                self._condition_registry.setdefault((type(condition), cond_id), condition)
+
+        if state is not None:
+            state.factory_mapping = dict(factory_mapping_classes)
+
         # Retrieve rule set ids from config
         rule_set_ids: list[str] = list(config[self.CONST_RULE_SETS_CONF_KEY].keys())
 
@@ -365,6 +955,22 @@ class RulesEngine:
 
                     action: Callable = action_functions[action_function_name]
 
+                    # Incremental rebuild: reuse the unchanged rule
+                    rule_key: tuple[str, str, str] = (set_id, group_id, rule_id)
+                    digest: bytes = get_config_digest(rule_dict) if state is not None else b""
+                    previous_rule: Rule | None = previous_rules.get(rule_key)
+
+                    if (
+                        state is not None
+                        and previous_rule is not None
+                        and previous_digests.get(rule_key) == digest
+                        and previous_rule.uses(action, std_condition_instances)
+                    ):
+                        state.rules[rule_key] = digest
+                        state.report["reused_rules"] += 1
+                        rule_set_dict[group_id].append(previous_rule)
+                        continue
+
                     # Look for condition conf. keys inside the rule
                     condition_conf_keys: set[str] = set(rule_dict.keys()) - {
                         self.CONST_ACTION_CONF_KEY,
@@ -386,13 +992,34 @@ class RulesEngine:
                         condition_exprs=condition_exprs,
                         std_condition_instances=std_condition_instances,
                         condition_factory_mapping=factory_mapping_classes,
+                        action_cache=self._get_function_cache(action),
+                        intern_pool=self._intern_pool,
+                        condition_registry=self._condition_registry,
+                        datasets=self._datasets,
+                        windows=self._windows,
                     )
+
+                    if state is not None:
+                        state.report["built_rules"] += 1
+
+                    if rule.is_never_activated():
+                        # Constant folding: conditions are always False
+                        logger.debug(f"Rule '{rule_id}' of group '{group_id}' is pruned (conditions are always False).")
+                        continue
+
+                    if state is not None:
+                        state.rules[rule_key] = digest
+
                     rule_set_dict[group_id].append(rule)
 
         return rules_dict
 
     def _build_std_conditions(
-        self, config: dict[str, Any], condition_functions_dict: dict[str, Callable]
+        self,
+        config: dict[str, Any],
+        condition_functions_dict: dict[str, Callable],
+        previous_state: BuildState | None = None,
+        state: BuildState | None = None,
     ) -> dict[str, StandardCondition]:
         """(Protected)
         Return a dictionary of Condition instances built from the configuration file.
@@ -400,6 +1027,8 @@ class RulesEngine:
         Args:
             config: Dictionary of the imported configuration from yaml files.
             condition_functions_dict: A dictionary where k:condition id, v:Callable (validation function).
+            previous_state: What the previous engine is built from (its unchanged conditions are reused).
+            state: What the engine is built from (updated).
 
         Returns:
             A dictionary of StandardCondition instances (k: condition id, v: StandardCondition instance).
@@ -423,17 +1052,62 @@ class RulesEngine:
             # Get Callable from function name
             validation_function: Callable = condition_functions_dict[validation_function_name]
 
+            # Incremental rebuild: reuse the unchanged condition
+            digest: bytes = get_config_digest(condition_params) if state is not None else b""
+            previous_condition: tuple[bytes, StandardCondition] | None = (
+                previous_state.conditions.get(condition_id) if previous_state is not None else None
+            )
+
+            if (
+                state is not None
+                and previous_condition is not None
+                and previous_condition[0] == digest
+                and previous_condition[1]._validation_function is validation_function
+            ):
+                conditions_dict[condition_id] = previous_condition[1]
+                state.conditions[condition_id] = previous_condition
+                state.report["reused_conditions"] += 1
+                continue
+
             # Create Condition instance
             condition_instance: StandardCondition = StandardCondition(
                 condition_id=condition_id,
                 description=condition_params[self.CONST_CONDITION_DESCRIPTION_CONF_KEY],
                 validation_function=validation_function,
                 validation_function_parameters=condition_params[self.CONST_CONDITION_VALIDATION_PARAMETERS_CONF_KEY],
+                validation_function_cache=self._get_function_cache(
+                    validation_function, force=bool(condition_params.get(self.CONST_CONDITION_PURE_CONF_KEY))
+                ),
             )
             conditions_dict[condition_id] = condition_instance
 
+            if state is not None:
+                state.conditions[condition_id] = (digest, condition_instance)
+                state.report["built_conditions"] += 1
+
         return conditions_dict
 
+    def _get_rule_set_windows(self) -> dict[str, tuple[SlidingWindow, ...]]:
+        """(Protected)
+        Return the sliding windows used by the simple conditions of each rule set (k: rule set, v: windows).
+        """
+        rule_set_windows: dict[str, tuple[SlidingWindow, ...]] = {}
+
+        for rule_set, rule_set_dict in self.rules.items():
+            # Aggregates of the windows are methods of the windows (see compile_simple_condition())
+            used: set[SlidingWindow] = {
+                helper.__self__
+                for rules_list in rule_set_dict.values()
+                for rule in rules_list
+                for condition in rule._condition_instances.values()
+                if isinstance(condition, SimpleCondition)
+                for helper in condition._helpers.values()
+                if isinstance(getattr(helper, "__self__", None), SlidingWindow)
+            }
+            rule_set_windows[rule_set] = tuple(window for window in self._windows.values() if window in used)
+
+        return rule_set_windows
+
     def _adapt_user_rules_dict(self, rules_dict: dict[str, dict[str, Any]]) -> dict[str, dict[str, list[Any]]]:
         """(Protected)
         Return a dictionary of Rule's instances built from user's rules dictionary.
@@ -476,10 +1150,22 @@ class RulesEngine:
                             validation_function_parameters=rule_dict.get(
                                 self.CONST_CONDITION_VALIDATION_PARAMETERS_CONF_KEY
                             ),
+                            validation_function_cache=self._get_function_cache(
+                                rule_dict.get(self.CONST_STD_RULE_CONDITION_CONF_KEY)
+                            ),
                         )
                     },
                     condition_factory_mapping=self.BUILTIN_FACTORY_MAPPING,
+                    action_cache=self._get_function_cache(action),
+                    intern_pool=self._intern_pool,
+                    condition_registry=self._condition_registry,
                 )
+
+                if rule.is_never_activated():
+                    # Constant folding: conditions are always False
+                    logger.debug(f"Rule '{rule_id}' of group '{group_id}' is pruned (conditions are always False).")
+                    continue
+
                 rules_dict_formatted[group_id].append(rule)
 
         return {self.CONST_DFLT_RULE_SET_ID: rules_dict_formatted}
@@ -0,0 +1,265 @@
+"""Memoization of pure validation and action functions, interning of shared structures.
+
+Functions: pure, is_pure, make_hashable, is_frozen
+Classes: CacheInfo, FunctionCache, InternPool
+"""
+
+from __future__ import annotations
+
+import copy
+import sys
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Callable, NamedTuple, TypeVar, cast, overload
+
+from arta.utils import is_immutable
+
+T = TypeVar("T")
+
+# Attribute set on functions decorated with @pure (value: LRU cache max size)
+PURE_ATTRIBUTE: str = "__arta_pure__"
+
+DEFAULT_CACHE_MAXSIZE: int = 1024
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a function cache (same fields as functools' CacheInfo, plus 'uncacheable')."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    uncacheable: int
+
+
+@overload
+def pure(function: Callable, *, maxsize: int = DEFAULT_CACHE_MAXSIZE) -> Callable: ...
+
+
+@overload
+def pure(function: None = None, *, maxsize: int = DEFAULT_CACHE_MAXSIZE) -> Callable[[Callable], Callable]: ...
+
+
+def pure(function: Callable | None = None, *, maxsize: int = DEFAULT_CACHE_MAXSIZE) -> Any:
+    """Mark a validation or action function as pure (decorator).
+
+    A pure function only depends on its parameters, so the rules engine can memoize its results.
+    Pure functions do not receive 'input_data' and user extra arguments through their '**kwargs'.
+
+    Usage: '@pure' or '@pure(maxsize=128)'.
+
+    Args:
+        function: The decorated function.
+        maxsize: Maximum number of results kept in the LRU cache.
+
+    Returns:
+        The function itself (flagged) or a decorator.
+
+    Raises:
+        ValueError: Wrong maxsize.
+    """
+    if maxsize <= 0:
+        raise ValueError(f"'maxsize' must be a positive integer, not '{maxsize}'.")
+
+    def decorator(func: Callable) -> Callable:
+        setattr(func, PURE_ATTRIBUTE, maxsize)
+        return func
+
+    if function is not None:
+        return decorator(function)
+
+    return decorator
+
+
+def is_pure(function: Callable | None) -> bool:
+    """Return True if the function has been marked as pure with the @pure decorator."""
+    return function is not None and getattr(function, PURE_ATTRIBUTE, None) is not None
+
+
+def make_hashable(value: Any) -> Any:
+    """Return a canonical hashable representation of a value.
+
+    Containers are recursively converted (list -> tuple, dict -> frozenset of items, set -> frozenset)
+    and every value is tagged with its type, so that e.g. [1] and (1,) or 1 and True give different keys.
+
+    Args:
+        value: Any value (e.g., a resolved parameter).
+
+    Returns:
+        A hashable key.
+
+    Raises:
+        TypeError: The value (or one of its elements) can't be hashed.
+    """
+    value_type: type = type(value)
+
+    if value_type is list or value_type is tuple:
+        return value_type, tuple(make_hashable(element) for element in value)
+    if value_type is dict:
+        return value_type, frozenset((key, make_hashable(val)) for key, val in value.items())
+    if value_type is set or value_type is frozenset:
+        return value_type, frozenset(make_hashable(element) for element in value)
+    if value_type is MappingProxyType:
+        return value_type, frozenset((key, make_hashable(val)) for key, val in value.items())
+
+    # Raise a TypeError if not hashable
+    hash(value)
+    return value_type, value
+
+
+class FunctionCache:
+    """Thread-safe bounded LRU cache of a pure function results.
+
+    Keys are built from the resolved parameters (see make_hashable()). Results which can be modified
+    (e.g., dictionaries) are stored and returned as deep copies, so that a caller modifying a result
+    never modifies the cache.
+
+    Attributes:
+        function: The memoized function.
+        maxsize: Maximum number of cached results.
+    """
+
+    def __init__(self, function: Callable, maxsize: int = DEFAULT_CACHE_MAXSIZE) -> None:
+        """Initialize attributes.
+
+        Args:
+            function: The memoized function.
+            maxsize: Maximum number of cached results.
+        """
+        self.function = function
+        self.maxsize = maxsize
+        # k: parameters key, v: (result, True if the result is immutable)
+        self._results: OrderedDict[Any, tuple[Any, bool]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._uncacheable = 0
+
+    def __call__(self, parameters: dict[str, Any]) -> Any:
+        """Return the function result for the given parameters (from the cache if available).
+
+        Args:
+            parameters: Keyword arguments of the function.
+
+        Returns:
+            The function result.
+        """
+        try:
+            key: Any = make_hashable(parameters)
+        except TypeError:
+            # Not hashable parameters => no memoization
+            with self._lock:
+                self._uncacheable += 1
+            return self.function(**parameters)
+
+        with self._lock:
+            cached: tuple[Any, bool] | None = self._results.get(key)
+            if cached is not None:
+                self._hits += 1
+                self._results.move_to_end(key)
+            else:
+                self._misses += 1
+
+        if cached is not None:
+            return cached[0] if cached[1] else copy.deepcopy(cached[0])
+
+        # Computed outside of the lock (concurrent misses of the same key are harmless)
+        result: Any = self.function(**parameters)
+
+        # The caller gets the result, the cache keeps its own copy
+        immutable: bool = is_immutable(result)
+        try:
+            stored: Any = result if immutable else copy.deepcopy(result)
+        except Exception:
+            # Result which can't be copied => no memoization
+            with self._lock:
+                self._uncacheable += 1
+            return result
+
+        with self._lock:
+            self._results[key] = (stored, immutable)
+            self._results.move_to_end(key)
+            if len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+
+        return result
+
+    def info(self) -> CacheInfo:
+        """Return the cache statistics."""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._results), self._uncacheable)
+
+    def clear(self) -> None:
+        """Clear the cache and its statistics."""
+        with self._lock:
+            self._results.clear()
+            self._hits = 0
+            self._misses = 0
+            self._uncacheable = 0
+
+    @staticmethod
+    def get_function_name(function: Callable) -> str:
+        """Return the qualified name used for reporting the statistics of a function."""
+        return f"{function.__module__}.{function.__qualname__}"
+
+
+def is_frozen(value: Any) -> bool:
+    """Return True if the value can't be modified: no list, dictionary or set, at any depth.
+
+    Tuples, frozensets and read-only mappings (MappingProxyType) are frozen if their elements are.
+    Other objects (e.g., strings, numbers, functions, condition instances) are shared by reference.
+
+    Args:
+        value: Any value.
+
+    Returns:
+        True if the value can be shared.
+    """
+    if isinstance(value, (list, dict, set, bytearray)):
+        return False
+    if isinstance(value, (tuple, frozenset)):
+        return all(is_frozen(element) for element in value)
+    if isinstance(value, MappingProxyType):
+        return all(is_frozen(key) and is_frozen(val) for key, val in value.items())
+    return True
+
+
+class InternPool:
+    """Pool of interned values: equal frozen values (e.g., read-only parameters mappings) are shared by a single object.
+
+    Only frozen values are interned (see is_frozen()): a shared value can't be modified by a rule (or a tenant).
+    """
+
+    def __init__(self) -> None:
+        """Initialize attributes."""
+        self._values: dict[Any, Any] = {}
+
+    def intern(self, value: T) -> T:
+        """Return the shared object equal to the given value (the value itself if first seen).
+
+        Strings are interned with sys.intern(), values which can be modified (see is_frozen()) or which
+        can't be hashed (see make_hashable()) are not interned.
+
+        Args:
+            value: Value to intern.
+
+        Returns:
+            The interned value.
+        """
+        if isinstance(value, str) and type(value) is str:
+            return cast(T, sys.intern(value))
+
+        if not is_frozen(value):
+            return value
+
+        try:
+            key: Any = make_hashable(value)
+        except TypeError:
+            return value
+
+        return self._values.setdefault(key, value)
+
+    def __len__(self) -> int:
+        """Return the number of interned values (strings excluded)."""
+        return len(self._values)
@@ -0,0 +1,119 @@
+"""Categorical membership tests of the simple conditions, encoded as bit sets.
+
+E.g., 'any_of(input.powers, ["fly", "strength"])': the categories of the condition are mapped to bit positions
+when the rules engine is built. The categories of a value (a list of categories or a single one) are encoded
+into an integer once per distinct value, so that intersection and subset tests are a single integer operation.
+
+Class: CategoryTest
+Constant: CATEGORY_FUNCTIONS
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterable
+from typing import Any
+
+# Functions of the simple conditions (k: name, v: meaning)
+CATEGORY_FUNCTIONS: dict[str, str] = {
+    "any_of": "at least one of the categories",
+    "all_of": "all the categories",
+    "none_of": "none of the categories",
+}
+
+# Maximum number of distinct values whose bit set is stored
+_MEMO_SIZE: int = 1024
+
+
+class CategoryTest:
+    """Test of the categories of a value against the categories of a simple condition.
+
+    Attributes:
+        kind: Test (see CATEGORY_FUNCTIONS), e.g., 'any_of'.
+        categories: Categories of the condition.
+    """
+
+    __slots__ = ("kind", "categories", "_bits", "_mask", "_memo")
+
+    def __init__(self, kind: str, categories: Iterable[Hashable]) -> None:
+        """Map the categories to bit positions.
+
+        Args:
+            kind: Test (see CATEGORY_FUNCTIONS).
+            categories: Categories of the condition (hashable literals).
+
+        Raises:
+            ValueError: Unknown test.
+        """
+        if kind not in CATEGORY_FUNCTIONS:
+            raise ValueError(f"Unknown categorical test '{kind}'.")
+
+        self.kind = kind
+        self.categories: frozenset[Any] = frozenset(categories)
+
+        # Sorted: same bit positions whatever the hash seed
+        self._bits: dict[Any, int] = {
+            category: 1 << idx for idx, category in enumerate(sorted(self.categories, key=repr))
+        }
+        self._mask: int = (1 << len(self._bits)) - 1
+        self._memo: dict[Any, int] = {}
+
+    def __call__(self, value: Any) -> bool:
+        """Return True if the categories of the value pass the test.
+
+        Args:
+            value: A list (tuple, set) of categories or a single category.
+
+        Raises:
+            TypeError: The value is None or not hashable (the simple condition is ignored).
+        """
+        value_bits: int = self.encode(value)
+
+        if self.kind == "any_of":
+            return value_bits != 0
+        if self.kind == "all_of":
+            return value_bits == self._mask
+        return value_bits == 0
+
+    def __eq__(self, other: object) -> bool:
+        """Return True if the tests are the same (same kind and categories)."""
+        return isinstance(other, CategoryTest) and (self.kind, self.categories) == (other.kind, other.categories)
+
+    def __hash__(self) -> int:
+        """Return the hash of the kind and the categories."""
+        return hash((self.kind, self.categories))
+
+    def __repr__(self) -> str:
+        """Return the kind and the sorted categories."""
+        return f"CategoryTest({self.kind!r}, {sorted(self.categories, key=repr)!r})"
+
+    def encode(self, value: Any) -> int:
+        """Return the bit set of the categories of a value (categories unknown to the condition are ignored).
+
+        Raises:
+            TypeError: The value is None or not hashable.
+        """
+        if value is None:
+            raise TypeError("Categories can't be None.")
+
+        # Hashable key of the value (same categories --> same key)
+        key: Any
+        if isinstance(value, list):
+            key = tuple(value)
+        elif isinstance(value, set):
+            key = frozenset(value)
+        else:
+            key = value
+
+        value_bits: int | None = self._memo.get(key)
+        if value_bits is not None:
+            return value_bits
+
+        bits: dict[Any, int] = self._bits
+        value_bits = 0
+        for category in key if isinstance(key, (tuple, frozenset)) else (key,):
+            value_bits |= bits.get(category, 0)
+
+        if len(self._memo) >= _MEMO_SIZE:
+            self._memo.clear()
+        self._memo[key] = value_bits
+        return value_bits
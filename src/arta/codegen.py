@@ -0,0 +1,633 @@
+"""Ahead-of-time code generation: export rule sets of a rules engine into a standalone Python module.
+
+The generated module has one straight-line function per rule set (inlined path lookups, compiled boolean expressions,
+direct calls of the validation and action functions). It only imports the source modules of these functions
+(neither arta, nor its dependencies).
+
+Functions: generate_code, write_module
+"""
+
+from __future__ import annotations
+
+import ast
+import importlib
+import keyword
+import re
+from pathlib import Path
+from typing import Any, Callable
+
+from arta._engine import RulesEngine
+from arta.categorical import CategoryTest
+from arta.condition import BaseCondition, SimpleCondition, StandardCondition
+from arta.expression import BOOLEAN_EXPRESSION_NODES, SIMPLE_CONDITION_NODES, parse_expression
+from arta.path import compile_path
+from arta.rule import Rule
+from arta.utils import ParsingErrorStrategy, RuleActivationMode, check_parsing_error_strategy_override
+
+# Local names of the generated functions (imported functions are renamed if needed)
+_RESERVED_NAMES: frozenset[str] = frozenset(
+    {
+        "collections",
+        "copy",
+        "re",
+        "len",
+        "data",
+        "output",
+        "results",
+        "cache",
+        "ignored",
+        "verbose",
+        "kwargs",
+        "result",
+        "error",
+    }
+)
+_LOCAL_NAME_PATTERN: re.Pattern[str] = re.compile(r"^[cp][0-9]+$")
+
+_PRELUDE: str = '''\
+import collections.abc
+import copy
+import re
+
+try:
+    from arta.exceptions import ConditionExecutionError, RuleExecutionError
+    from arta.path import get_item as _get_item
+except ImportError:  # arta (or one of its dependencies) is not installed
+
+    class RuleExecutionError(Exception):
+        """Rule fails during its execution."""
+
+    class ConditionExecutionError(Exception):
+        """Condition fails during its execution."""
+
+    def _get_item(value, key):
+        """Return the value of a key of a mapping or an object (see arta.path.get_item(), without accessors)."""
+        if isinstance(value, collections.abc.Mapping) or type(value).__module__ == "builtins":
+            return value[key]
+        if key.startswith("_"):
+            raise KeyError(f"Private attribute '{key}' of '{type(value).__name__}' can't be read.")
+        try:
+            return getattr(value, key)
+        except AttributeError as error:
+            raise KeyError(key) from error
+
+
+_UNSET = object()
+
+
+class _InputNamespace(dict):
+    """Data of a request whose input data is not a dictionary (see arta.utils.InputNamespace)."""
+
+    __slots__ = ("input_object",)
+
+    def __init__(self, input_object):
+        super().__init__(output={})
+        self.input_object = input_object
+
+    def __missing__(self, key):
+        return _get_item(self.input_object, key)
+
+    def __contains__(self, key):
+        if not isinstance(key, str):
+            return super().__contains__(key)
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
+def _lookup(data, path, strategy, default):
+    """Return the value of a path (slow path: missing keys and parsing error strategies)."""
+    value = data
+    try:
+        for key in path.split("."):
+            if value is None:
+                raise KeyError(f"Key {value} of path {path} not found in input data.")
+            value = value[key] if isinstance(value, dict) else _get_item(value, key)
+    except KeyError as error:
+        if strategy == "ignore":
+            return None
+        if strategy == "default_value":
+            return default
+        raise KeyError(f"Could not find path '{path}' in the input data: {error}") from error
+    return value
+
+
+class _LiteralSet(frozenset):
+    """Literals of a membership test (see arta.expression.LiteralSet)."""
+
+    __slots__ = ()
+
+    def __contains__(self, value):
+        try:
+            return frozenset.__contains__(self, value)
+        except TypeError:
+            return any(item is value or item == value for item in self)
+
+
+def _category_test(kind, categories):
+    """Return the test of the categories of a value (see arta.categorical.CategoryTest)."""
+
+    def test(value):
+        if value is None:
+            raise TypeError("Categories can't be None.")
+        found = categories.intersection(value if isinstance(value, (list, tuple, set, frozenset)) else (value,))
+        if kind == "any_of":
+            return len(found) > 0
+        if kind == "all_of":
+            return len(found) == len(categories)
+        return len(found) == 0
+
+    return test
+'''
+
+_DISPATCHER: str = '''
+
+def apply_rules(input_data, *, rule_set=None, ignored_rules=None, verbose=False, copy_input=None, **kwargs):
+    """Apply the rules and return results (same as RulesEngine.apply_rules(), without hooks and statistics)."""
+    if not isinstance(input_data, collections.abc.Mapping) and type(input_data).__module__ == "builtins":
+        raise TypeError(
+            f"'input_data' must be a dictionary or an object (e.g., a dataclass), not '{type(input_data)}'."
+        )
+    elif isinstance(input_data, dict) and len(input_data) == 0:
+        raise KeyError("'input_data' couldn't be empty.")
+
+    if isinstance(input_data, dict):
+        data = copy.deepcopy(input_data) if copy_input is not False else dict(input_data)
+        data["output"] = {}
+    else:
+        # Objects are read without conversion nor copy (see arta.path.get_item())
+        data = _InputNamespace(copy.deepcopy(input_data) if copy_input else input_data)
+
+    if rule_set is None and len(RULE_SETS) == 1 and "default_rule_set" in RULE_SETS:
+        rule_set = "default_rule_set"
+
+    if rule_set is None or rule_set not in RULE_SETS:
+        raise KeyError(
+            f"Rule set '{rule_set}' not found in the rules, available rule sets are : {list(RULE_SETS.keys())}."
+        )
+
+    return RULE_SETS[rule_set](data, ignored_rules if ignored_rules is not None else set(), verbose, kwargs)
+'''
+
+
+class _CodeWriter:
+    """Lines of generated code with the current indentation."""
+
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+        self.indent: int = 0
+
+    def write(self, line: str) -> None:
+        self.lines.append("    " * self.indent + line if line != "" else "")
+
+
+class _Generator:
+    """Generate the code of the rule sets of an engine."""
+
+    def __init__(self, engine: RulesEngine) -> None:
+        self.engine = engine
+        self.strategy: ParsingErrorStrategy = engine._parsing_error_strategy
+        self.one_by_group: bool = engine._rule_activation_mode is RuleActivationMode.ONE_BY_GROUP
+        self.imports: dict[tuple[str, str], str] = {}
+        self.function_names: dict[int, str] = {}
+        self.condition_keys: dict[int, int] = {}
+        self.temp_count: int = 0
+        # Precompiled values of the simple conditions (k: code, v: module-level name), e.g., frozensets
+        self.helpers: dict[str, str] = {}
+
+    def generate(self, rule_sets: list[str]) -> str:
+        """Return the source code of the module."""
+        functions: list[str] = []
+
+        for idx, rule_set in enumerate(rule_sets):
+            functions.append(self._rule_set_function(f"_apply_rule_set_{idx}", rule_set))
+
+        import_lines: list[str] = [
+            f"from {module} import {name}" if alias == name else f"from {module} import {name} as {alias}"
+            for (module, name), alias in sorted(self.imports.items())
+        ]
+        helper_lines: list[str] = [f"{name} = {code}" for code, name in self.helpers.items()]
+        rule_sets_map: str = ", ".join(f"{rule_set!r}: _apply_rule_set_{idx}" for idx, rule_set in enumerate(rule_sets))
+
+        return "\n".join(
+            [
+                '"""Rule sets generated by arta (do not edit): ' + ", ".join(rule_sets) + '."""',
+                "",
+                _PRELUDE.rstrip("\n"),
+                "",
+                "",
+                *import_lines,
+                *([""] if len(import_lines) > 0 and len(helper_lines) > 0 else []),
+                *helper_lines,
+                *functions,
+                "",
+                f"RULE_SETS = {{{rule_sets_map}}}",
+                _DISPATCHER.rstrip("\n"),
+                "",
+            ]
+        )
+
+    def _rule_set_function(self, function_name: str, rule_set: str) -> str:
+        """Return the code of the function of a rule set."""
+        writer: _CodeWriter = _CodeWriter()
+        writer.write("")
+        writer.write("")
+        writer.write(f"def {function_name}(data, ignored, verbose, kwargs):")
+        writer.indent += 1
+        writer.write(f'"""Rule set {rule_set!r}."""')
+        writer.write(f'results = {{"verbosity": {{"rule_set": {rule_set!r}, "results": []}}}} if verbose else {{}}')
+        writer.write('output = data["output"]')
+        writer.write("# Condition results shared by the rules (forgotten when an action is triggered)")
+        writer.write("cache = {}")
+
+        for group_id, rules in self.engine.rules[rule_set].items():
+            writer.write("")
+            writer.write(f"# Group {group_id!r}")
+            writer.write(f"results[{group_id!r}] = None")
+
+            if self.one_by_group and len(rules) > 0:
+                # Breakable block: the group ends with its first activated rule
+                writer.write("while True:")
+                writer.indent += 1
+
+            for rule in rules:
+                self._rule(writer, group_id, rule)
+
+            if self.one_by_group and len(rules) > 0:
+                writer.write("break")
+                writer.indent -= 1
+
+        writer.write("")
+        writer.write("return results")
+        return "\n".join(writer.lines)
+
+    def _rule(self, writer: _CodeWriter, group_id: str, rule: Rule) -> None:
+        """Write the code of a rule."""
+        base_indent: int = writer.indent
+        writer.write(f"# Rule {rule._rule_id!r}")
+        writer.write(f"if {rule._rule_id!r} not in ignored:")
+        writer.indent += 1
+
+        verified_conditions: list[str] = []
+
+        for conf_key, expr in rule._condition_exprs.items():
+            if expr is None:
+                verified_conditions.append(f'{conf_key!r}: {{"expression": None, "values": {{}}}}')
+                continue
+
+            condition_class: type[BaseCondition] = rule._condition_factory_mapping[conf_key]
+            plan = rule._expression_plans.get((condition_class, expr)) or rule._build_expression_plan(
+                condition_class, expr
+            )
+
+            # Conditions of the expression are all verified (same order as the interpreter)
+            bool_expr: str = expr
+            values: list[str] = []
+            variables: set[str] = set()
+
+            for cond_id, condition, id_pattern in plan.conditions:
+                var: str = self._condition(writer, condition)
+                values.append(f"{cond_id!r}: {var}")
+                variables.add(var)
+                bool_expr = id_pattern.sub(var, bool_expr)
+
+            compiled_expr: str = self._compile_expression(bool_expr, variables, BOOLEAN_EXPRESSION_NODES, expr)
+            verified_conditions.append(f'{conf_key!r}: {{"expression": {expr!r}, "values": {{{", ".join(values)}}}}}')
+
+            writer.write(f"if {compiled_expr}:")
+            writer.indent += 1
+
+        # Action
+        writer.write("try:")
+        writer.indent += 1
+        writer.write(f"result = {self._action_call(writer, rule)}")
+        writer.indent -= 1
+        writer.write("except Exception as error:")
+        writer.indent += 1
+        writer.write(
+            f"raise RuleExecutionError(f\"Error while executing rule '{self._escape(rule._rule_id)}': {{error}}\") "
+            "from error"
+        )
+        writer.indent -= 1
+        writer.write(f"results[{group_id!r}] = result")
+        writer.write("if verbose:")
+        writer.indent += 1
+        writer.write(
+            'results["verbosity"]["results"].append('
+            f'{{"rule_group": {group_id!r}, "verified_conditions": {{{", ".join(verified_conditions)}}}, '
+            f'"activated_rule": {rule._rule_id!r}, "action_result": result}})'
+        )
+        writer.indent -= 1
+        writer.write(f"output[{group_id!r}] = copy.deepcopy(result)")
+        writer.write("cache.clear()")
+
+        if self.one_by_group:
+            writer.write("break")
+
+        writer.indent = base_indent
+
+    def _condition(self, writer: _CodeWriter, condition: BaseCondition) -> str:
+        """Write the verification of a condition and return the name of its result variable."""
+        if type(condition) not in (StandardCondition, SimpleCondition):
+            raise ValueError(
+                f"Condition '{condition._condition_id}' of class '{type(condition).__name__}' can't be generated "
+                "(custom conditions are not supported)."
+            )
+
+        key: int = self.condition_keys.setdefault(id(condition), len(self.condition_keys))
+        var: str = f"c{key}"
+        cacheable: bool = condition.is_request_cacheable()
+
+        if cacheable:
+            writer.write(f"{var} = cache.get({key}, _UNSET)")
+            writer.write(f"if {var} is _UNSET:")
+            writer.indent += 1
+
+        writer.write("try:")
+        writer.indent += 1
+
+        if isinstance(condition, StandardCondition):
+            self._standard_condition(writer, condition, var)
+        elif isinstance(condition, SimpleCondition):
+            self._simple_condition(writer, condition, var)
+
+        writer.indent -= 1
+        writer.write("except Exception as error:")
+        writer.indent += 1
+        writer.write(
+            "raise ConditionExecutionError("
+            f"f\"Error while executing condition '{self._escape(condition._condition_id)}': {{error}}\") from error"
+        )
+        writer.indent -= 1
+
+        if cacheable:
+            writer.write(f"cache[{key}] = {var}")
+            writer.indent -= 1
+        else:
+            # Value sharing: input data may have changed (same as EvaluationContext.invalidate())
+            writer.write("cache.clear()")
+
+        return var
+
+    def _standard_condition(self, writer: _CodeWriter, condition: StandardCondition, var: str) -> None:
+        """Write the verification of a standard condition."""
+        if condition._validation_function is None or condition._validation_function_parameters is None:
+            writer.write('raise AttributeError("Validation function and its parameters should not be None")')
+            return
+
+        if condition.folded_result is not None:
+            writer.write(f"{var} = {condition.folded_result!r}")
+            return
+
+        parameters: dict[str, str] = {key: self._literal(value) for key, value in condition._static_parameters.items()}
+        for key, value in condition._dynamic_parameters.items():
+            parameters[key] = self._parameter(writer, value)
+
+        # Pure functions don't receive input_data and user extra arguments
+        value_sharing: bool = condition._validation_function_cache is None and condition._accepts_kwargs
+        writer.write(f"{var} = {self._call(condition._validation_function, parameters, value_sharing)}")
+
+    def _simple_condition(self, writer: _CodeWriter, condition: SimpleCondition, var: str) -> None:
+        """Write the verification of a simple condition (see SimpleCondition.verify())."""
+        if len(condition._data_paths) == 0:
+            if self.strategy == ParsingErrorStrategy.RAISE:
+                msg: str = f"Error when verifying simple condition: '{condition._condition_id}'"
+                writer.write(f"raise ConditionExecutionError({msg!r})")
+            else:
+                writer.write(f"{var} = False")
+            return
+
+        # Data paths are replaced by variables in the condition expression (e.g., 'data_0>=100')
+        names: dict[str, str] = {
+            f"data_{idx}": self._parameter(writer, path) for idx, path in enumerate(condition._data_paths)
+        }
+        helpers: dict[str, str] = {name: self._helper(value) for name, value in condition._helpers.items()}
+
+        compiled_expr: str = self._compile_expression(
+            condition._data_expr,
+            {*names, *helpers},
+            SIMPLE_CONDITION_NODES,
+            condition._condition_id,
+            {**names, **helpers},
+            functions=set(helpers),
+        )
+
+        # Type errors are ignored: the condition is not verified
+        writer.write("try:")
+        writer.write(f"    {var} = {compiled_expr}")
+        writer.write("except TypeError:")
+        writer.write(f"    {var} = False")
+
+    def _action_call(self, writer: _CodeWriter, rule: Rule) -> str:
+        """Write the parsing of the action parameters and return the action call."""
+        parameters: dict[str, str] = {
+            key: self._literal(value) for key, value in rule._static_action_parameters.items()
+        }
+        for key, value in rule._dynamic_action_parameters.items():
+            parameters[key] = self._parameter(writer, value)
+
+        value_sharing: bool = rule._action_cache is None and (
+            rule._action_accepts_kwargs or rule._action_takes_input_data
+        )
+        return self._call(rule._action, parameters, value_sharing)
+
+    def _parameter(self, writer: _CodeWriter, value: Any) -> str:
+        """Write the parsing of a dynamic parameter and return its expression (see parse_dynamic_parameter())."""
+        if isinstance(value, list):
+            return "[" + ", ".join(self._parameter(writer, element) for element in value) + "]"
+
+        if not (isinstance(value, str) and value.startswith(("input.", "output."))):
+            return self._literal(value)
+
+        default_value, param_path, strategy = check_parsing_error_strategy_override(
+            re.sub(r"^input\.", r"", value), self.strategy
+        )
+        if compile_path(param_path) is not None:
+            raise ValueError(f"Data path '{value}' (list indexes or wildcards) can't be written in the generated code.")
+        var: str = f"p{self.temp_count}"
+        self.temp_count += 1
+
+        # Inlined lookup, the slow path handles missing keys (same errors and default values as the interpreter)
+        fast_path: str = "data" + "".join(f"[{key!r}]" for key in param_path.split("."))
+        writer.write("try:")
+        writer.write(f"    {var} = {fast_path}")
+        writer.write("except Exception:")
+        writer.write(
+            f"    {var} = _lookup(data, {param_path!r}, {ParsingErrorStrategy(strategy).value!r}, "
+            f"{self._literal(default_value)})"
+        )
+        return var
+
+    def _call(self, function: Callable, parameters: dict[str, str], value_sharing: bool) -> str:
+        """Return the call of a validation or action function."""
+        name: str = self._import(function)
+
+        items: list[str] = [f"{key!r}: {value}" for key, value in parameters.items()]
+
+        if value_sharing:
+            # Same as the interpreter: input_data and user extra arguments are added, then may override parameters
+            items += ['"input_data": data', "**kwargs"]
+            return name + "(**{" + ", ".join(items) + "})"
+
+        if all(key.isidentifier() and not keyword.iskeyword(key) for key in parameters):
+            return name + "(" + ", ".join(f"{key}={value}" for key, value in parameters.items()) + ")"
+
+        return name + "(**{" + ", ".join(items) + "})"
+
+    def _import(self, function: Callable) -> str:
+        """Return the name of a function in the generated module (imported from its source module)."""
+        if id(function) in self.function_names:
+            return self.function_names[id(function)]
+
+        module_name: str = getattr(function, "__module__", None) or ""
+        qualname: str = getattr(function, "__qualname__", "")
+
+        if module_name in ("", "__main__") or "." in qualname or "<" in qualname:
+            raise ValueError(f"Function '{qualname}' can't be imported by the generated code (not a module function).")
+
+        if getattr(importlib.import_module(module_name), qualname, None) is not function:
+            raise ValueError(f"Function '{qualname}' is not defined in module '{module_name}'.")
+
+        alias: str = qualname
+        used: set[str] = set(self.imports.values())
+        if alias in used or alias in _RESERVED_NAMES or alias.startswith("_") or _LOCAL_NAME_PATTERN.match(alias):
+            alias = f"fn{len(self.imports)}_{qualname.lstrip('_')}"
+
+        self.imports[(module_name, qualname)] = alias
+        self.function_names[id(function)] = alias
+        return alias
+
+    def _helper(self, value: Any) -> str:
+        """Return the module-level name of a precompiled value of a simple condition (see compile_simple_condition()).
+
+        Raises:
+            ValueError: The value can't be written in the generated code.
+        """
+        if value is len:
+            return "len"
+
+        if isinstance(value, frozenset):
+            # Sorted elements: the generated code doesn't depend on the hash seed
+            code: str = f"_LiteralSet({self._literal(tuple(sorted(value, key=repr)))})"
+        elif isinstance(value, CategoryTest):
+            code = (
+                f"_category_test({value.kind!r}, frozenset({self._literal(tuple(sorted(value.categories, key=repr)))}))"
+            )
+        elif isinstance(getattr(value, "__self__", None), re.Pattern) and value.__name__ == "search":
+            # Compiled without flags (inline flags are part of the pattern)
+            code = f"re.compile({self._literal(value.__self__.pattern)}).search"
+        else:
+            raise ValueError(f"Value {value!r} of a simple condition can't be written in the generated code.")
+
+        if code not in self.helpers:
+            self.helpers[code] = f"_HELPER_{len(self.helpers)}"
+        return self.helpers[code]
+
+    @staticmethod
+    def _literal(value: Any) -> str:
+        """Return the Python literal of a static value.
+
+        Raises:
+            ValueError: The value has no literal representation.
+        """
+        text: str = repr(value)
+
+        try:
+            is_literal: bool = ast.literal_eval(text) == value
+        except (ValueError, SyntaxError, TypeError, MemoryError, RecursionError):
+            is_literal = False
+
+        if not is_literal:
+            raise ValueError(f"Parameter value {text} can't be written in the generated code.")
+
+        return text
+
+    @staticmethod
+    def _compile_expression(
+        expr: str,
+        names: set[str],
+        allowed_nodes: tuple[type[ast.AST], ...],
+        source: str,
+        renaming: dict[str, str] | None = None,
+        functions: set[str] | None = None,
+    ) -> str:
+        """Return the Python code of a boolean expression after checking its constructs.
+
+        Args:
+            expr: Expression whose conditions (or data paths) are replaced by variable names.
+            names: Allowed variable names.
+            allowed_nodes: Allowed Python constructs.
+            source: Original expression (error messages).
+            renaming: Variables to rename (k: name in the expression, v: name in the generated code).
+            functions: Names which can be called.
+
+        Returns:
+            The Python code.
+
+        Raises:
+            UnsupportedExpressionError: Unsupported expression.
+        """
+        tree: ast.Expression = parse_expression(expr, names, allowed_nodes, source, functions or ())
+
+        if renaming is not None:
+            for node in ast.walk(tree):
+                if isinstance(node, ast.Name):
+                    node.id = renaming[node.id]
+
+        return ast.unparse(tree)
+
+    @staticmethod
+    def _escape(value: str) -> str:
+        """Escape a value written inside a double-quoted f-string."""
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace("{", "{{").replace("}", "}}")
+
+
+def generate_code(engine: RulesEngine, rule_sets: list[str] | None = None) -> str:
+    """Return the source code of a standalone Python module applying rule sets of a rules engine.
+
+    The module exposes apply_rules(input_data, *, rule_set=None, ignored_rules=None, verbose=False, **kwargs)
+    with the same results (and verbosity) as RulesEngine.apply_rules(). Hooks, statistics and diagnostics
+    are not generated.
+
+    Args:
+        engine: A rules engine.
+        rule_sets: Rule sets to generate (default: all of them).
+
+    Returns:
+        The source code.
+
+    Raises:
+        KeyError: Unknown rule set.
+        ValueError: A rule can't be generated (e.g., custom condition, function which can't be imported).
+    """
+    selected: list[str] = list(engine.rules.keys()) if rule_sets is None else list(rule_sets)
+
+    for rule_set in selected:
+        if rule_set not in engine.rules:
+            raise KeyError(f"Rule set '{rule_set}' not found in the rules.")
+
+    return _Generator(engine).generate(selected)
+
+
+def write_module(engine: RulesEngine, path: Path | str, rule_sets: list[str] | None = None) -> Path:
+    """Write the generated module of rule sets of a rules engine (see generate_code()).
+
+    Args:
+        engine: A rules engine.
+        path: Path of the Python file.
+        rule_sets: Rule sets to generate (default: all of them).
+
+    Returns:
+        The path of the written file.
+    """
+    path = Path(path)
+    path.write_text(generate_code(engine, rule_sets), encoding="utf-8")
+    return path
@@ -9,10 +9,20 @@ import inspect
 import logging
 import re
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from typing import Any, Callable
 
+from arta.cache import FunctionCache
+from arta.diagnostics import EventCounter
 from arta.exceptions import ConditionExecutionError
-from arta.utils import ParsingErrorStrategy, parse_dynamic_parameter
+from arta.expression import CompiledCondition, compile_simple_condition, split_simple_conditions
+from arta.utils import (
+    ParsingErrorStrategy,
+    copy_static_parameters,
+    is_immutable,
+    parse_dynamic_parameter,
+    split_static_parameters,
+)
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -29,6 +39,8 @@ class BaseCondition(ABC):
         validation_function_parameters: Arguments of the validation function.
     """
 
+    __slots__ = ("_condition_id", "_description", "_validation_function", "_validation_function_parameters")
+
     # Class constants
     CONDITION_DATA_LABEL: str = "Undefined condition data (not needed)"
     CONDITION_ID_PATTERN: str = r"\b[A-Z_0-9]+\b"
@@ -69,6 +81,17 @@ class BaseCondition(ABC):
         """
         raise NotImplementedError
 
+    def is_request_cacheable(self) -> bool:
+        """Return True if the condition result can be shared by all the rules evaluated during one request.
+
+        False by default: custom conditions may read or modify anything (e.g., the input data).
+        Can be overridden by custom conditions whose result only depends on the input data.
+
+        Returns:
+            True if the condition is evaluated once per request.
+        """
+        return False
+
     def get_sanitized_id(self) -> str:
         """Return the sanitized (regex) condition id.
 
@@ -109,11 +132,109 @@ class StandardCondition(BaseCondition):
         description: Description of a condition.
         validation_function: Validation function of a condition.
         validation_function_parameters: Arguments of the validation function.
+        validation_function_cache: Memoization cache of the validation function (only if pure).
+        folded_result: Result computed at build time (pure function with static parameters only), otherwise None.
     """
 
+    __slots__ = (
+        "_validation_function_cache",
+        "_static_parameters",
+        "_mutable_keys",
+        "_dynamic_parameters",
+        "_accepts_kwargs",
+        "_folded_result",
+    )
+
     # Class constants
     CONDITION_DATA_LABEL: str = "Standard condition (will be overwritten)"
 
+    def __init__(
+        self,
+        condition_id: str,
+        description: str,
+        validation_function: Callable | None = None,
+        validation_function_parameters: dict[str, Any] | None = None,
+        validation_function_cache: FunctionCache | None = None,
+    ) -> None:
+        """
+        Initialize attributes.
+
+        Args:
+            condition_id: Id of a condition.
+            description: Description of a condition.
+            validation_function: Validation function of a condition.
+            validation_function_parameters: Arguments of the validation function.
+            validation_function_cache: Memoization cache of the validation function (only if pure).
+        """
+        super().__init__(
+            condition_id=condition_id,
+            description=description,
+            validation_function=validation_function,
+            validation_function_parameters=validation_function_parameters,
+        )
+        self._validation_function_cache = validation_function_cache
+
+        # Static parameters are resolved once, only dynamic ones are parsed on each verification
+        self._static_parameters: dict[str, Any] = {}
+        self._dynamic_parameters: dict[str, Any] = {}
+        if validation_function_parameters is not None:
+            self._static_parameters, self._dynamic_parameters = split_static_parameters(validation_function_parameters)
+        # Mutable static values are copied on each verification
+        self._mutable_keys: tuple[str, ...] = tuple(
+            key for key, value in self._static_parameters.items() if not is_immutable(value)
+        )
+
+        # Value sharing is only possible if the validation function accepts **kwargs
+        self._accepts_kwargs: bool = (
+            validation_function is not None and inspect.getfullargspec(validation_function).varkw is not None
+        )
+
+        # Constant folding
+        self._folded_result: bool | None = self._fold()
+
+    def is_request_cacheable(self) -> bool:
+        """Return True if the condition result can be shared by all the rules evaluated during one request.
+
+        Validation functions accepting '**kwargs' (value sharing) may modify the input data:
+        they are evaluated each time they are used, unless they are pure.
+
+        Returns:
+            True if the condition is evaluated once per request.
+        """
+        return self._validation_function_cache is not None or not self._accepts_kwargs
+
+    @property
+    def folded_result(self) -> bool | None:
+        """Result computed at build time (pure function with static parameters only), otherwise None."""
+        return self._folded_result
+
+    def _fold(self) -> bool | None:
+        """(Protected)
+        Evaluate the condition at build time when its result can't change (constant folding).
+
+        Only pure validation functions with static parameters (no 'input.' or 'output.' path) are folded.
+
+        Returns:
+            The condition result or None if the condition can't be folded.
+        """
+        if (
+            self._validation_function_cache is None
+            or self._validation_function_parameters is None
+            or len(self._dynamic_parameters) > 0
+        ):
+            return None
+
+        try:
+            result: bool = self._validation_function_cache(
+                copy_static_parameters(self._static_parameters, self._mutable_keys)
+            )
+        except Exception:
+            # Errors are raised at evaluation time (like other conditions)
+            return None
+
+        logger.debug("'%s' is folded at build time, result is: %s", self._condition_id, result)
+        return result
+
     def verify(self, input_data: dict[str, Any], parsing_error_strategy: ParsingErrorStrategy, **kwargs: Any) -> bool:
         """Return True if the condition is verified.
 
@@ -140,23 +261,36 @@ class StandardCondition(BaseCondition):
             logger.error(msg)
             raise AttributeError(msg)
 
-        # Parse dynamic parameters
-        parameters: dict[str, Any] = {}
+        result: bool
+
+        if self._folded_result is not None:
+            result = self._folded_result
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("'%s' verification result is: %s", self._condition_id, result)
+            return result
 
-        for key, value in self._validation_function_parameters.items():
+        # Static parameters are already resolved, parse dynamic ones
+        parameters: dict[str, Any] = copy_static_parameters(self._static_parameters, self._mutable_keys)
+
+        for key, value in self._dynamic_parameters.items():
             parameters[key] = parse_dynamic_parameter(
                 parameter=value, input_data=input_data, parsing_error_strategy=parsing_error_strategy
             )
 
-        # Pass input_data for value sharing if validation function can accept it
-        arg_spec: inspect.FullArgSpec = inspect.getfullargspec(self._validation_function)
-        if arg_spec.varkw is not None:
-            parameters["input_data"] = input_data
-            parameters.update(kwargs)
+        if self._validation_function_cache is not None:
+            # Pure validation function: memoized, no value sharing
+            result = self._validation_function_cache(parameters)
+        else:
+            # Pass input_data for value sharing if validation function can accept it
+            if self._accepts_kwargs:
+                parameters["input_data"] = input_data
+                parameters.update(kwargs)
+
+            # Run validation_function
+            result = self._validation_function(**parameters)
 
-        # Run validation_function
-        result: bool = self._validation_function(**parameters)
-        logger.debug(f"'{self._condition_id}' verification result is: {result}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("'%s' verification result is: %s", self._condition_id, result)
         return result
 
 
@@ -170,11 +304,71 @@ class SimpleCondition(BaseCondition):
         validation_function_parameters: Arguments of the validation function.
     """
 
+    __slots__ = ("_ignored_events", "_data_paths", "_shared_paths", "_data_expr", "_helpers", "_evaluate")
+
     # Class constants
     CONDITION_DATA_LABEL: str = "Simple condition data (not needed)"
+    # Deprecated: no longer used, simple conditions are split with ast (see extract_condition_ids_from_expression())
     CONDITION_ID_PATTERN: str = r"(?:input\.|output\.)(?:[a-zA-Z0-9!=<>\"NTF\.\*\+\-_/]*)(?:[a-zA-Z\s\-_]*\"|)"
 
-    def verify(self, input_data: dict[str, Any], parsing_error_strategy: ParsingErrorStrategy, **kwargs: Any) -> bool:
+    def __init__(
+        self,
+        condition_id: str,
+        description: str,
+        validation_function: Callable | None = None,
+        validation_function_parameters: dict[str, Any] | None = None,
+        datasets: Mapping[str, Any] | None = None,
+        windows: Mapping[str, Any] | None = None,
+    ) -> None:
+        """
+        Initialize attributes.
+
+        Args:
+            condition_id: Id of a condition.
+            description: Description of a condition.
+            validation_function: Validation function of a condition.
+            validation_function_parameters: Arguments of the validation function.
+            datasets: Reference datasets of the configuration (k: name, v: ReferenceDataset).
+            windows: Sliding windows of the configuration (k: name, v: SlidingWindow).
+
+        Raises:
+            UnsupportedExpressionError: The condition is not a valid expression (e.g., function call, unknown name).
+        """
+        super().__init__(condition_id, description, validation_function, validation_function_parameters)
+
+        # Evaluations ignored because of the parameter's type (logged once)
+        self._ignored_events: EventCounter = EventCounter()
+
+        # Compiled once (no eval() at evaluation time): distinct data paths, replaced by variables in the expression
+        # (e.g., 'input.age>=100' -> 'data_0>=100'), and precompiled helpers (frozensets, regex patterns)
+        compiled: CompiledCondition = compile_simple_condition(condition_id, datasets, windows)
+        self._data_paths: tuple[str, ...] = compiled.data_paths
+        # Extended data paths (lists), read once per request for all the simple conditions (e.g., 'input.items[*].x')
+        self._shared_paths: frozenset[str] = frozenset(path for path in compiled.data_paths if "[" in path)
+        self._data_expr: str = compiled.source
+        self._helpers: dict[str, Any] = compiled.helpers
+        self._evaluate: Callable[..., Any] | None = compiled.evaluate
+
+    @property
+    def ignored_events(self) -> EventCounter:
+        """Counter of the evaluations ignored because of the parameter's type."""
+        return self._ignored_events
+
+    def is_request_cacheable(self) -> bool:
+        """Return True: simple conditions only read the input data (evaluated once per request).
+
+        Returns:
+            True if the condition is evaluated once per request.
+        """
+        return True
+
+    def verify(
+        self,
+        input_data: dict[str, Any],
+        parsing_error_strategy: ParsingErrorStrategy,
+        path_values: dict[tuple[str, Any], Any] | None = None,
+        **kwargs: Any,
+    ) -> bool:
         """Return True if the condition is verified.
 
         Example of a unitary simple condition to be verified: 'input.age>=100'
@@ -182,6 +376,8 @@ class SimpleCondition(BaseCondition):
         Args:
             input_data: Request or input data to apply rules on.
             parsing_error_strategy: Error handling strategy for parameter parsing.
+            path_values: Values of the extended data paths already read during the request
+                (see EvaluationContext.path_values).
             **kwargs: For user extra arguments.
 
         Returns:
@@ -191,37 +387,29 @@ class SimpleCondition(BaseCondition):
             AttributeError: Check the validation function or its parameters.
         """
         bool_var: bool = False
-        unitary_expr: str = self._condition_id
-
-        data_path_patt: str = r"(?:input\.|output\.)(?:[a-zA-Z_\.]*)"
-
-        # Retrieve only the data path
-        path_matches: list[str] = re.findall(data_path_patt, unitary_expr)
 
-        if len(path_matches) > 0:
-            locals_ns: dict[str, Any] = {}
-
-            # Regular case: we have a data paths
-            for idx, path in enumerate(path_matches):
-                # Read data from the path
-                locals_ns[f"data_{idx}"] = parse_dynamic_parameter(
+        if self._evaluate is not None:
+            # Regular case: we have data paths, read data from them
+            values: list[Any] = [
+                parse_dynamic_parameter(
                     parameter=path, input_data=input_data, parsing_error_strategy=parsing_error_strategy
                 )
+                if path_values is None or path not in self._shared_paths
+                else self._get_shared_value(path, input_data, parsing_error_strategy, path_values)
+                for path in self._data_paths
+            ]
 
-                # Replace with the variable name in the expression
-                unitary_expr = unitary_expr.replace(path, f"data_{idx}")
-
-            # Evaluate the expression
+            # Evaluate the compiled expression
             try:
-                bool_var = eval(unitary_expr, None, locals_ns)  # noqa
+                bool_var = self._evaluate(*values)
             except TypeError:
-                # Ignore evaluation --> False
-                logger.warning(f"Condition '{self._condition_id}' is ignored because of the parameter's type.")
-                pass
+                # Ignore evaluation --> False (logged once, then only counted)
+                if self._ignored_events.increment():
+                    logger.warning("Condition '%s' is ignored because of the parameter's type.", self._condition_id)
 
         elif parsing_error_strategy == ParsingErrorStrategy.RAISE:
             # Raise an error because of no match for a data path
-            msg = f"Error when verifying simple condition: '{unitary_expr}'"
+            msg = f"Error when verifying simple condition: '{self._condition_id}'"
             logger.error(msg)
             raise ConditionExecutionError(msg)
 
@@ -229,9 +417,47 @@ class SimpleCondition(BaseCondition):
             # Other case: ignore, default value => return False
             pass
 
-        logger.debug(f"'{self._condition_id}' verification result is: {bool_var}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("'%s' verification result is: %s", self._condition_id, bool_var)
         return bool_var
 
+    @staticmethod
+    def _get_shared_value(
+        path: str,
+        input_data: dict[str, Any],
+        parsing_error_strategy: ParsingErrorStrategy,
+        path_values: dict[tuple[str, Any], Any],
+    ) -> Any:
+        """(Protected)
+        Return the value of an extended data path, read once per request.
+        """
+        key: tuple[str, Any] = (path, parsing_error_strategy)
+        if key not in path_values:
+            path_values[key] = parse_dynamic_parameter(
+                parameter=path, input_data=input_data, parsing_error_strategy=parsing_error_strategy
+            )
+        return path_values[key]
+
+    @classmethod
+    def extract_condition_ids_from_expression(cls, condition_expr: str | None = None) -> set[str]:
+        """Get the unitary simple conditions from a boolean expression (operands of 'and', 'or', 'not').
+
+        E.g., 'input.age>=18 and not input.country in ["FR", "BE"]' --> {'input.age>=18', 'input.country in ["FR", "BE"]'}
+
+        Args:
+            condition_expr: A boolean expression (string).
+
+        Returns:
+            A set of extracted condition ids.
+
+        Raises:
+            UnsupportedExpressionError: Syntax error.
+        """
+        if condition_expr is None:
+            return set()
+
+        return set(split_simple_conditions(condition_expr))
+
     def get_sanitized_id(self) -> str:
         """Return the sanitized (regex) condition id.
 
@@ -8,6 +8,23 @@ from typing import Any, cast
 from omegaconf import DictConfig, ListConfig, OmegaConf
 
 
+def get_config_files(config_dir_path: Path | str) -> list[Path]:
+    """Return the YAML files of a configuration directory (and its subdirectories) in loading order.
+
+    Args:
+        config_dir_path: Path to a directory containing YAML files.
+
+    Returns:
+        The sorted list of the YAML file paths.
+    """
+    conf_files: list[Path] = [f for patt in ["*.yml", "*.yaml"] for f in Path(config_dir_path).rglob(patt)]
+
+    # Alphabetical sorting of the file names, it enables splitting the rule sets over different files
+    conf_files.sort()
+
+    return conf_files
+
+
 def load_config(config_dir_path: Path | str) -> dict[str, Any]:
     """Load a configuration dictionary from all the yaml files in a given directory (and its subdirectories).
 
@@ -19,10 +36,7 @@ def load_config(config_dir_path: Path | str) -> dict[str, Any]:
     Returns:
         config: Loaded config dictionary.
     """
-    conf_files: list[Path] = [f for patt in ["*.yml", "*.yaml"] for f in Path(config_dir_path).rglob(patt)]
-
-    # Alphabetical sorting of the file names, it enables splitting the rule sets over different files
-    conf_files.sort()
+    conf_files: list[Path] = get_config_files(config_dir_path)
 
     omega_config: DictConfig | ListConfig = OmegaConf.unsafe_merge(*[OmegaConf.load(file) for file in conf_files])
     config: dict[str, Any] = cast(dict[str, Any], OmegaConf.to_object(omega_config))
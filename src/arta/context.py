@@ -0,0 +1,94 @@
+"""Per-request evaluation state.
+
+Class: EvaluationContext
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from arta.stats import ACTION_RECORD, CONDITION_RECORD, RULE_RECORD
+
+if TYPE_CHECKING:
+    from arta.hooks import EngineHook
+
+
+class EvaluationContext:
+    """Evaluation state of one call of RulesEngine.apply_rules() (never shared between calls).
+
+    Results of the conditions and condition expressions are stored once computed, so that each distinct
+    condition (or expression) is evaluated once per request, whatever the number of rules using it.
+
+    Execution statistics and hooks are only fed when the context is instrumented: callers must check
+    the 'instrumented' attribute before measuring anything, so that the default path stays free of timing calls.
+
+    Attributes:
+        condition_results: Results of unitary conditions (k: condition instance, v: result).
+        expression_results: Results of condition expressions
+            (k: (expression, condition instances), v: (result, unitary results)), see ExpressionPlan.key.
+        path_values: Values of the extended data paths shared by simple conditions
+            (k: (path, parsing error strategy), v: value), e.g., 'input.items[*].price'.
+        stats_records: Execution statistics records of the request as (kind, item id, duration in ns, positive),
+            None if the request is not recorded.
+        hooks: Execution hooks called during the request.
+        instrumented: True if statistics are recorded or hooks are registered.
+    """
+
+    __slots__ = ("condition_results", "expression_results", "path_values", "stats_records", "hooks", "instrumented")
+
+    def __init__(self, record_stats: bool = False, hooks: tuple[EngineHook, ...] = ()) -> None:
+        """Initialize attributes.
+
+        Args:
+            record_stats: If True, execution statistics of the request are recorded.
+            hooks: Execution hooks called during the request.
+        """
+        self.condition_results: dict[Any, bool] = {}
+        self.expression_results: dict[tuple[Any, ...], tuple[bool, dict[str, bool]]] = {}
+        self.path_values: dict[tuple[str, Any], Any] = {}
+        self.stats_records: list[tuple[str, str, int, bool]] | None = [] if record_stats else None
+        self.hooks: tuple[EngineHook, ...] = hooks
+        self.instrumented: bool = record_stats or len(hooks) > 0
+
+    def invalidate(self) -> None:
+        """Forget the stored results (e.g., input data or outputs have changed after an action)."""
+        self.condition_results.clear()
+        self.expression_results.clear()
+        self.path_values.clear()
+
+    def record_rule(
+        self, rule_set: str, group_id: str, rule_id: str, activated: bool, start_ns: int, duration_ns: int
+    ) -> None:
+        """Record the evaluation of a rule (statistics and hooks)."""
+        if self.stats_records is not None:
+            self.stats_records.append((RULE_RECORD, f"{rule_set}/{group_id}/{rule_id}", duration_ns, activated))
+
+        for hook in self.hooks:
+            hook.on_rule_evaluated(rule_set, group_id, rule_id, activated, start_ns, duration_ns)
+
+    def record_condition(
+        self,
+        rule_set: str,
+        group_id: str,
+        rule_id: str,
+        condition_id: str,
+        result: bool,
+        start_ns: int,
+        duration_ns: int,
+    ) -> None:
+        """Record the verification of a condition (statistics and hooks)."""
+        if self.stats_records is not None:
+            self.stats_records.append((CONDITION_RECORD, condition_id, duration_ns, result))
+
+        for hook in self.hooks:
+            hook.on_condition_verified(rule_set, group_id, rule_id, condition_id, result, start_ns, duration_ns)
+
+    def record_action(
+        self, rule_set: str, group_id: str, rule_id: str, action: str, start_ns: int, duration_ns: int
+    ) -> None:
+        """Record the execution of an action (statistics and hooks)."""
+        if self.stats_records is not None:
+            self.stats_records.append((ACTION_RECORD, action, duration_ns, True))
+
+        for hook in self.hooks:
+            hook.on_action_executed(rule_set, group_id, rule_id, action, start_ns, duration_ns)
@@ -0,0 +1,290 @@
+"""Reference datasets: large sets of values (e.g., sanctioned ids, postcodes) used by the simple conditions.
+
+E.g., 'input.customer_id in @sanctioned_ids'
+
+The values are stored in a binary index file (sorted 64-bit hashes, offsets and values) which is memory-mapped:
+its pages are only read when needed and are shared by the processes (e.g., the workers forked from a master
+process). A lookup is a binary search of the hash followed by the comparison of the value. An optional Bloom
+filter (in memory) answers most of the negative lookups without reading the index.
+
+Classes: ReferenceDataset, BloomFilter
+Functions: write_index, load_datasets
+"""
+
+from __future__ import annotations
+
+import bisect
+import csv
+import hashlib
+import logging
+import mmap
+import os
+import tempfile
+from array import array
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import Any
+
+from arta.incremental import get_config_digest
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# Header of the index files, followed by the number of values, hashes, offsets and values (native byte order)
+INDEX_MAGIC: bytes = b"ARTAIDX1"
+_HEADER_SIZE: int = len(INDEX_MAGIC) + 8
+
+
+def _hash(data: bytes) -> int:
+    """(Protected)
+    Return the 64-bit hash of a value (stable between processes, unlike hash()).
+    """
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+
+
+def write_index(values: Iterable[Any], path: Path | str) -> int:
+    """Write the index file of a reference dataset.
+
+    Args:
+        values: Values of the dataset (compared as strings, duplicates are removed).
+        path: Path of the index file.
+
+    Returns:
+        The number of distinct values.
+    """
+    entries: list[tuple[int, bytes]] = sorted(
+        {(_hash(data), data) for data in (str(value).encode() for value in values)}
+    )
+
+    offsets: array[int] = array("Q", [0])
+    for _, data in entries:
+        offsets.append(offsets[-1] + len(data))
+
+    with open(path, "wb") as file:
+        file.write(INDEX_MAGIC)
+        file.write(array("Q", [len(entries)]).tobytes())
+        file.write(array("Q", [value_hash for value_hash, _ in entries]).tobytes())
+        file.write(offsets.tobytes())
+        for _, data in entries:
+            file.write(data)
+
+    return len(entries)
+
+
+class BloomFilter:
+    """Bloom filter of 64-bit hashes (about 1% of false positives with the default settings).
+
+    Attributes:
+        bit_count: Size of the filter (bits).
+        hash_count: Number of bits set per value.
+    """
+
+    __slots__ = ("bit_count", "hash_count", "_bits")
+
+    def __init__(self, hashes: Iterable[int], count: int, bits_per_value: int = 10, hash_count: int = 7) -> None:
+        """Build the filter.
+
+        Args:
+            hashes: 64-bit hashes of the values.
+            count: Number of values.
+            bits_per_value: Size of the filter per value.
+            hash_count: Number of bits set per value.
+        """
+        self.bit_count: int = max(64, count * bits_per_value)
+        self.hash_count: int = hash_count
+        self._bits: bytearray = bytearray((self.bit_count + 7) // 8)
+
+        for value_hash in hashes:
+            for position in self._positions(value_hash):
+                self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, value_hash: int) -> bool:
+        """Return False if the hash has never been added (True may be a false positive)."""
+        bits: bytearray = self._bits
+        bit_count: int = self.bit_count
+        position: int = value_hash & 0xFFFFFFFF
+        step: int = (value_hash >> 32) | 1
+
+        # Same positions as _positions(), stops at the first unset bit (most of the absent values)
+        for _ in range(self.hash_count):
+            position %= bit_count
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+            position += step
+
+        return True
+
+    def _positions(self, value_hash: int) -> Iterable[int]:
+        """(Protected)
+        Return the positions of the bits of a hash (double hashing).
+        """
+        low: int = value_hash & 0xFFFFFFFF
+        high: int = (value_hash >> 32) | 1
+        return ((low + idx * high) % self.bit_count for idx in range(self.hash_count))
+
+
+class ReferenceDataset:
+    """Set of values stored in a memory-mapped index file.
+
+    Attributes:
+        name: Name of the dataset (e.g., 'sanctioned_ids' for '@sanctioned_ids').
+        path: Path of the index file.
+        size: Number of distinct values.
+        bloom_filter: Bloom filter of the values (None if disabled).
+    """
+
+    __slots__ = ("name", "path", "size", "bloom_filter", "_mmap", "_hashes", "_offsets", "_values_start")
+
+    def __init__(self, name: str, path: Path | str, bloom_filter: bool = False) -> None:
+        """Map an index file (see write_index()).
+
+        Args:
+            name: Name of the dataset.
+            path: Path of the index file.
+            bloom_filter: If True, a Bloom filter is built (one pass over the values).
+
+        Raises:
+            ValueError: Not an index file.
+        """
+        self.name = name
+        self.path = str(path)
+
+        with open(path, "rb") as file:
+            if os.fstat(file.fileno()).st_size < _HEADER_SIZE or file.read(len(INDEX_MAGIC)) != INDEX_MAGIC:
+                raise ValueError(f"File '{path}' of dataset '{name}' is not an index file (see write_index()).")
+            # The mapping stays valid after the file is closed
+            self._mmap: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self.size: int = memoryview(self._mmap)[len(INDEX_MAGIC) : _HEADER_SIZE].cast("Q")[0]
+        hashes_end: int = _HEADER_SIZE + 8 * self.size
+        self._hashes: memoryview = memoryview(self._mmap)[_HEADER_SIZE:hashes_end].cast("Q")
+        self._offsets: memoryview = memoryview(self._mmap)[hashes_end : hashes_end + 8 * (self.size + 1)].cast("Q")
+        self._values_start: int = hashes_end + 8 * (self.size + 1)
+
+        self.bloom_filter: BloomFilter | None = BloomFilter(self._hashes, self.size) if bloom_filter else None
+
+    @classmethod
+    def from_csv(
+        cls,
+        name: str,
+        path: Path | str,
+        column: str | None = None,
+        index_path: Path | str | None = None,
+        bloom_filter: bool = False,
+    ) -> ReferenceDataset:
+        """Build the index of a column of a CSV file (with a header row) and map it.
+
+        Args:
+            name: Name of the dataset.
+            path: Path of the CSV file.
+            column: Column of the values (default: the first one).
+            index_path: Path of the index file (default: a temporary file, removed once mapped).
+            bloom_filter: If True, a Bloom filter is built.
+
+        Raises:
+            KeyError: Unknown column.
+        """
+        with open(path, newline="", encoding="utf-8") as file:
+            reader: csv.DictReader = csv.DictReader(file)
+            fields: list[str] = list(reader.fieldnames or [])
+            if column is None and len(fields) > 0:
+                column = fields[0]
+            if column not in fields:
+                raise KeyError(f"Column '{column}' of dataset '{name}' not found in '{path}'.")
+
+            if index_path is not None:
+                write_index((row[column] for row in reader), index_path)
+                return cls(name, index_path, bloom_filter)
+
+            fd, temp_path = tempfile.mkstemp(prefix=f"arta_{name}_", suffix=".idx")
+            os.close(fd)
+            try:
+                write_index((row[column] for row in reader), temp_path)
+                return cls(name, temp_path, bloom_filter)
+            finally:
+                try:
+                    os.remove(temp_path)
+                except OSError:  # pragma: no cover (mapped files can't be removed on Windows)
+                    logger.warning("Temporary index file '%s' of dataset '%s' can't be removed.", temp_path, name)
+
+    def __contains__(self, value: Any) -> bool:
+        """Return True if the value is in the dataset (integers are compared as strings, None is never in it).
+
+        Raises:
+            TypeError: The value is not a string or an integer (the simple condition is ignored).
+        """
+        if value is None:
+            return False
+        if isinstance(value, bool) or not isinstance(value, (str, int)):
+            raise TypeError(f"Dataset '{self.name}' contains strings, not '{type(value).__name__}'.")
+
+        data: bytes = (value if isinstance(value, str) else str(value)).encode()
+        value_hash: int = _hash(data)
+
+        if self.bloom_filter is not None and value_hash not in self.bloom_filter:
+            return False
+
+        hashes: memoryview = self._hashes
+        offsets: memoryview = self._offsets
+        idx: int = bisect.bisect_left(hashes, value_hash)
+
+        # Same hash: values are compared
+        while idx < self.size and hashes[idx] == value_hash:
+            if self._mmap[self._values_start + offsets[idx] : self._values_start + offsets[idx + 1]] == data:
+                return True
+            idx += 1
+
+        return False
+
+    def __len__(self) -> int:
+        """Return the number of distinct values."""
+        return self.size
+
+    def __repr__(self) -> str:
+        """Return the name and the size of the dataset."""
+        return f"ReferenceDataset({self.name!r}, size={self.size})"
+
+
+def load_datasets(
+    definitions: Mapping[str, Mapping[str, Any]],
+    base_dir: Path | str,
+    previous: Mapping[str, tuple[bytes, ReferenceDataset]] | None = None,
+) -> dict[str, tuple[bytes, ReferenceDataset]]:
+    """Load the reference datasets of a configuration.
+
+    Args:
+        definitions: Datasets of the configuration (k: name, v: {'path': str, 'column': str, 'bloom_filter': bool}).
+        base_dir: Directory of the relative paths (e.g., the configuration directory).
+        previous: Datasets of a previous build, reused if their definition and file are unchanged.
+
+    Returns:
+        The datasets (k: name, v: (signature, dataset)).
+
+    Raises:
+        FileNotFoundError: Missing file.
+        ValueError: Not an index file.
+    """
+    datasets: dict[str, tuple[bytes, ReferenceDataset]] = {}
+
+    for name, definition in definitions.items():
+        path: Path = Path(base_dir) / definition["path"]
+        stat: os.stat_result = os.stat(path)
+        signature: bytes = get_config_digest(
+            {**definition, "path": str(path), "mtime": stat.st_mtime_ns, "size": stat.st_size}
+        )
+
+        if previous is not None and name in previous and previous[name][0] == signature:
+            datasets[name] = previous[name]
+            continue
+
+        bloom_filter: bool = bool(definition.get("bloom_filter"))
+        if path.suffix.lower() == ".csv":
+            dataset: ReferenceDataset = ReferenceDataset.from_csv(
+                name, path, column=definition.get("column"), bloom_filter=bloom_filter
+            )
+        else:
+            dataset = ReferenceDataset(name, path, bloom_filter=bloom_filter)
+
+        logger.info("Reference dataset '%s' is loaded (%s values).", name, dataset.size)
+        datasets[name] = (signature, dataset)
+
+    return datasets
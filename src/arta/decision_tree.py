@@ -0,0 +1,492 @@
+"""Decision trees of rule groups made of simple conditions (ONE_BY_GROUP mode).
+
+A group is compiled into a decision DAG splitting on its data fields: a request finds the first rule which can be
+activated in O(tree depth) instead of verifying the rules one by one. The rules are then applied as usual from
+this rule, so results, verbosity and errors are unchanged.
+
+Class: DecisionTree
+Exception: UnsupportedGroupError
+"""
+
+from __future__ import annotations
+
+import ast
+import bisect
+import operator
+import re
+from collections.abc import Sequence
+from typing import Any, Callable, Union, cast
+
+from arta.condition import SimpleCondition
+from arta.path import get_item
+from arta.rule import Rule
+from arta.utils import ParsingErrorStrategy
+
+# Boolean expression over atoms: True, False, atom index, ("not", expr), ("and", exprs) or ("or", exprs)
+Expr = Union[bool, int, tuple[Any, ...]]
+
+
+def _is_in(value: Any, values: frozenset[Any]) -> bool:
+    """Membership test of the simple conditions ('input.country in ["FR", "BE"]')."""
+    return value in values
+
+
+def _is_not_in(value: Any, values: frozenset[Any]) -> bool:
+    """Negated membership test of the simple conditions ('input.country not in ["FR", "BE"]')."""
+    return value not in values
+
+
+_OPERATORS: dict[type[ast.cmpop], Callable[[Any, Any], bool]] = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.In: _is_in,
+    ast.NotIn: _is_not_in,
+}
+# Operators of a constant on the left side (e.g., '18 <= data_0' --> 'data_0 >= 18')
+_FLIPPED_OPERATORS: dict[type[ast.cmpop], Callable[[Any, Any], bool]] = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.gt,
+    ast.LtE: operator.ge,
+    ast.Gt: operator.lt,
+    ast.GtE: operator.le,
+}
+_ORDERING_OPERATORS: tuple[Callable[[Any, Any], bool], ...] = (operator.lt, operator.le, operator.gt, operator.ge)
+
+
+class UnsupportedGroupError(Exception):
+    """The rule group can't be compiled into a decision tree."""
+
+    pass
+
+
+class _Field:
+    """A data path tested by the simple conditions of a group, and the regions of its values.
+
+    Ordered fields (tested with <, <=, >, >=) are split into intervals between their sorted constants (bounds),
+    other fields are split on their distinct constants (hash lookup) plus one region for the other values.
+    """
+
+    __slots__ = ("path", "keys", "constants", "ordered", "numeric", "bounds", "lookup")
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.keys: tuple[str, ...] = tuple(re.sub(r"^input\.", "", path).split("."))
+        self.constants: list[Any] = []
+        self.ordered: bool = False
+        self.numeric: bool = False
+        self.bounds: list[Any] = []
+        self.lookup: dict[Any, int] = {}
+
+        if any(key == "" or "[" in key for key in self.keys):
+            # Empty keys and list indexes or wildcards (e.g., 'input.items[*].price')
+            raise UnsupportedGroupError(f"Data path '{path}' is not supported.")
+
+    def prepare(self) -> None:
+        """Compute the regions once all the constants are known."""
+        if self.ordered:
+            if all(isinstance(const, (int, float)) and not isinstance(const, bool) for const in self.constants):
+                self.numeric = True
+            elif not all(isinstance(const, str) for const in self.constants):
+                raise UnsupportedGroupError(f"Constants of '{self.path}' can't be ordered.")
+
+            self.bounds = sorted(set(self.constants))
+        else:
+            for const in self.constants:
+                if const not in self.lookup:
+                    self.lookup[const] = len(self.bounds)
+                    self.bounds.append(const)
+
+    @property
+    def region_count(self) -> int:
+        """Number of regions of the field's values."""
+        return 2 * len(self.bounds) + 1 if self.ordered else len(self.bounds) + 1
+
+    def region(self, value: Any) -> int:
+        """Return the region of a value (values are checked by DecisionTree._resolve())."""
+        if self.ordered:
+            idx: int = bisect.bisect_left(self.bounds, value)
+            if idx < len(self.bounds) and self.bounds[idx] == value:
+                return 2 * idx + 1
+            return 2 * idx
+
+        return self.lookup.get(value, len(self.bounds))
+
+    def is_valid(self, value: Any) -> bool:
+        """Return True if the comparisons of the value can't raise an error (same results as the simple conditions)."""
+        if not self.ordered:
+            # Builtin types only: their equality is consistent with their hash
+            return value is None or type(value) in (bool, int, float, str)
+
+        if self.numeric:
+            # NaN is excluded: it is never ordered
+            return type(value) in (int, float, bool) and value == value
+
+        return type(value) is str
+
+    def truth(self, compare: Callable[[Any, Any], bool], const: Any, region: int) -> bool:
+        """Return the result of 'value <compare> const' for all the values of a region."""
+        if not self.ordered:
+            if region == len(self.bounds):
+                # None of the constants
+                return compare in (operator.ne, _is_not_in)
+            return bool(compare(self.bounds[region], const))
+
+        if region % 2 == 1:
+            return bool(compare(self.bounds[region // 2], const))
+
+        # Open interval between bounds[idx - 1] and bounds[idx] (none of the constants)
+        if compare in (operator.eq, _is_in):
+            return False
+        if compare in (operator.ne, _is_not_in):
+            return True
+        idx: int = region // 2
+        const_idx: int = bisect.bisect_left(self.bounds, const)
+        if compare in (operator.lt, operator.le):
+            return idx <= const_idx
+        return idx > const_idx
+
+
+class _Node:
+    """Split on the region of a field."""
+
+    __slots__ = ("field", "children")
+
+    def __init__(self, field: int, children: tuple[Any, ...]) -> None:
+        self.field = field
+        self.children = children
+
+
+class DecisionTree:
+    """Decision DAG of a rule group, giving the first rule whose conditions are verified.
+
+    Attributes:
+        rule_count: Number of rules of the group.
+        node_count: Number of split nodes.
+        depth: Maximum number of splits to reach a rule.
+    """
+
+    def __init__(self, rules: Sequence[Rule], parsing_error_strategy: ParsingErrorStrategy, max_nodes: int) -> None:
+        """Compile the rules of a group.
+
+        Args:
+            rules: Rules of the group (in their evaluation order).
+            parsing_error_strategy: Parsing error strategy of the engine.
+            max_nodes: Maximum number of split nodes.
+
+        Raises:
+            UnsupportedGroupError: The group can't be compiled.
+        """
+        self.rule_count: int = len(rules)
+        self._strategy = parsing_error_strategy
+        self._fields: list[_Field] = []
+        self._field_ids: dict[str, int] = {}
+        self._atoms: list[tuple[int, Callable[[Any, Any], bool], Any]] = []
+        self._atom_ids: dict[tuple[Any, ...], int] = {}
+        self._condition_exprs: dict[str, Expr] = {}
+
+        predicates: list[Expr] = [self._parse_rule(rule) for rule in rules]
+
+        for field in self._fields:
+            field.prepare()
+
+        # Truth of each atom in each region of its field
+        self._truths: list[list[bool]] = [
+            [self._fields[field].truth(compare, const, region) for region in range(self._fields[field].region_count)]
+            for field, compare, const in self._atoms
+        ]
+
+        self._max_nodes = max_nodes
+        self.node_count: int = 0
+        self._memo: dict[tuple[tuple[int, Expr], ...], Any] = {}
+        self._root: Any = self._build(tuple(enumerate(predicates)))
+        self.depth: int = self._get_depth(self._root, {})
+        self._memo = {}
+
+    def find_first_match(self, input_data: dict[str, Any]) -> int | None:
+        """Return the index of the first rule whose conditions are verified (the rule count if none).
+
+        Args:
+            input_data: Input data (with the 'output' key).
+
+        Returns:
+            The rule index, or None if the tree can't decide (e.g., missing key or unexpected type):
+            the rules must be verified one by one.
+        """
+        values: list[Any] | None = self._resolve(input_data)
+        if values is None:
+            return None
+
+        node: Any = self._root
+        while type(node) is _Node:
+            node = node.children[self._fields[node.field].region(values[node.field])]
+
+        return self.rule_count if node is None else node
+
+    def _resolve(self, input_data: dict[str, Any]) -> list[Any] | None:
+        """(Protected)
+        Return the values of all the fields, None if the simple conditions could raise an error or ignore a value.
+        """
+        values: list[Any] = []
+
+        for field in self._fields:
+            value: Any = input_data
+            try:
+                for key in field.keys:
+                    if value is None:
+                        raise KeyError(key)
+                    value = value[key] if isinstance(value, dict) else get_item(value, key)
+            except KeyError:
+                if self._strategy is ParsingErrorStrategy.RAISE:
+                    return None
+                value = None
+            except Exception:
+                return None
+
+            if not field.is_valid(value):
+                return None
+
+            values.append(value)
+
+        return values
+
+    def _parse_rule(self, rule: Rule) -> Expr:
+        """(Protected)
+        Return the predicate of a rule over the atoms (comparisons of a field with a constant).
+        """
+        predicate: list[Expr] = []
+
+        for conf_key, expr in rule._condition_exprs.items():
+            if expr is None:
+                continue
+
+            condition_class: type = rule._condition_factory_mapping[conf_key]
+            if condition_class is not SimpleCondition:
+                raise UnsupportedGroupError(f"Rule '{rule._rule_id}' uses '{conf_key}' (only simple conditions).")
+
+            plan = rule._expression_plans.get((condition_class, expr)) or rule._build_expression_plan(
+                condition_class, expr
+            )
+            names: dict[str, Expr] = {}
+            bool_expr: str = expr
+
+            for _, condition, id_pattern in plan.conditions:
+                name: str = f"atom_{len(names)}"
+                names[name] = self._parse_atom(cast(SimpleCondition, condition))
+                bool_expr = id_pattern.sub(name, bool_expr)
+
+            try:
+                tree: ast.Expression = ast.parse(bool_expr.strip(), mode="eval")
+            except SyntaxError as error:
+                raise UnsupportedGroupError(f"Expression '{expr}' can't be parsed.") from error
+
+            predicate.append(self._to_expr(tree.body, names, expr))
+
+        return ("and", tuple(predicate)) if len(predicate) > 1 else predicate[0] if len(predicate) == 1 else True
+
+    def _parse_atom(self, condition: SimpleCondition) -> Expr:
+        """(Protected)
+        Return the expression of a simple condition comparing one data path with constants (atoms).
+        """
+        cond_id: str = condition._condition_id
+        if cond_id in self._condition_exprs:
+            return self._condition_exprs[cond_id]
+
+        paths: tuple[str, ...] = condition._data_paths
+        unsupported: str = f"Simple condition '{cond_id}' is not a comparison of a data path with a constant."
+
+        if len(paths) != 1:
+            raise UnsupportedGroupError(unsupported)
+
+        # Already checked when the condition was built
+        node: ast.expr = ast.parse(condition._data_expr.strip(), mode="eval").body
+
+        if not isinstance(node, ast.Compare):
+            raise UnsupportedGroupError(unsupported)
+
+        # Chained comparisons are conjunctions (e.g., 'between(input.age, 18, 65)' --> '18 <= data_0 <= 65')
+        atoms: list[Expr] = []
+        operands: list[ast.expr] = [node.left, *node.comparators]
+
+        for idx, cmpop in enumerate(node.ops):
+            left, right = operands[idx], operands[idx + 1]
+
+            if isinstance(left, ast.Name) and left.id == "data_0":
+                compare: Callable[[Any, Any], bool] | None = _OPERATORS.get(type(cmpop))
+                const_node: ast.expr = right
+            elif isinstance(right, ast.Name) and right.id == "data_0":
+                compare = _FLIPPED_OPERATORS.get(type(cmpop))
+                const_node = left
+            else:
+                raise UnsupportedGroupError(unsupported)
+
+            if compare is None:
+                raise UnsupportedGroupError(unsupported)
+
+            if compare in (_is_in, _is_not_in):
+                # Literal collections are precompiled frozensets
+                if not (
+                    isinstance(const_node, ast.Name) and isinstance(condition._helpers.get(const_node.id), frozenset)
+                ):
+                    raise UnsupportedGroupError(unsupported)
+                const: Any = condition._helpers[const_node.id]
+                constants: list[Any] = sorted(const, key=repr)
+            else:
+                try:
+                    const = ast.literal_eval(const_node)
+                except ValueError as error:
+                    raise UnsupportedGroupError(unsupported) from error
+                constants = [const]
+
+            if not all(value is None or isinstance(value, (bool, int, float, str)) for value in constants):
+                raise UnsupportedGroupError(unsupported)
+
+            atoms.append(self._get_atom(paths[0], compare, const, constants))
+
+        self._condition_exprs[cond_id] = ("and", tuple(atoms)) if len(atoms) > 1 else atoms[0]
+        return self._condition_exprs[cond_id]
+
+    def _get_atom(self, path: str, compare: Callable[[Any, Any], bool], const: Any, constants: list[Any]) -> int:
+        """(Protected)
+        Return the index of the atom 'value <compare> const' of a data path (shared by the simple conditions).
+        """
+        field_id: int = self._field_ids.get(path, len(self._fields))
+        if field_id == len(self._fields):
+            self._field_ids[path] = field_id
+            self._fields.append(_Field(path))
+
+        key: tuple[Any, ...] = (field_id, compare, type(const), const)
+        if key not in self._atom_ids:
+            field: _Field = self._fields[field_id]
+            field.constants.extend(constants)
+            field.ordered = field.ordered or compare in _ORDERING_OPERATORS
+
+            self._atom_ids[key] = len(self._atoms)
+            self._atoms.append((field_id, compare, const))
+
+        return self._atom_ids[key]
+
+    def _to_expr(self, node: ast.expr, names: dict[str, Expr], source: str) -> Expr:
+        """(Protected)
+        Convert a boolean expression of atoms.
+        """
+        if isinstance(node, ast.Name) and node.id in names:
+            return names[node.id]
+        if isinstance(node, ast.Constant) and isinstance(node.value, bool):
+            return node.value
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            return ("not", self._to_expr(node.operand, names, source))
+        if isinstance(node, ast.BoolOp):
+            kind: str = "and" if isinstance(node.op, ast.And) else "or"
+            return (kind, tuple(self._to_expr(value, names, source) for value in node.values))
+
+        raise UnsupportedGroupError(f"Expression '{source}' is not a boolean expression of simple conditions.")
+
+    def _simplify(self, expr: Expr, field: int, region: int) -> Expr:
+        """(Protected)
+        Return the expression once the region of a field is known.
+        """
+        if isinstance(expr, bool):
+            return expr
+
+        if isinstance(expr, int):
+            if self._atoms[expr][0] == field:
+                return self._truths[expr][region]
+            return expr
+
+        if expr[0] == "not":
+            operand: Expr = self._simplify(expr[1], field, region)
+            return (not operand) if isinstance(operand, bool) else ("not", operand)
+
+        is_and: bool = expr[0] == "and"
+        operands: list[Expr] = []
+
+        for sub_expr in expr[1]:
+            value: Expr = self._simplify(sub_expr, field, region)
+            if isinstance(value, bool):
+                if value is not is_and:
+                    # False in a conjunction, True in a disjunction
+                    return value
+                continue
+            operands.append(value)
+
+        if len(operands) == 0:
+            return is_and
+        if len(operands) == 1:
+            return operands[0]
+        return (expr[0], tuple(operands))
+
+    def _get_fields(self, expr: Expr, fields: dict[int, int]) -> None:
+        """(Protected)
+        Count the fields used by an expression.
+        """
+        if isinstance(expr, bool):
+            return
+        if isinstance(expr, int):
+            field: int = self._atoms[expr][0]
+            fields[field] = fields.get(field, 0) + 1
+            return
+        for sub_expr in expr[1] if expr[0] != "not" else (expr[1],):
+            self._get_fields(sub_expr, fields)
+
+    def _build(self, candidates: tuple[tuple[int, Expr], ...]) -> Any:
+        """(Protected)
+        Return the (shared) sub-tree of the candidate rules (in order): a rule index, None or a split node.
+        """
+        # Unreachable rules (after a rule which is always verified) and never verified rules are removed
+        remaining: list[tuple[int, Expr]] = []
+        for rule_idx, expr in candidates:
+            if expr is False:
+                continue
+            remaining.append((rule_idx, expr))
+            if expr is True:
+                break
+
+        if len(remaining) == 0:
+            return None
+        if remaining[0][1] is True:
+            return remaining[0][0]
+
+        key: tuple[tuple[int, Expr], ...] = tuple(remaining)
+        if key in self._memo:
+            return self._memo[key]
+
+        # Split on a field of the first rule, the most used one by the remaining rules
+        first_fields: dict[int, int] = {}
+        self._get_fields(remaining[0][1], first_fields)
+        usage: dict[int, int] = {}
+        for _, expr in remaining:
+            self._get_fields(expr, usage)
+        field: int = max(first_fields, key=lambda field_id: (usage[field_id], -field_id))
+
+        children: list[Any] = [
+            self._build(tuple((rule_idx, self._simplify(expr, field, region)) for rule_idx, expr in remaining))
+            for region in range(self._fields[field].region_count)
+        ]
+
+        node: Any
+        if all(child is children[0] for child in children):
+            # The field doesn't matter
+            node = children[0]
+        else:
+            self.node_count += 1
+            if self.node_count > self._max_nodes:
+                raise UnsupportedGroupError(f"The decision tree has more than {self._max_nodes} nodes.")
+            node = _Node(field, tuple(children))
+
+        self._memo[key] = node
+        return node
+
+    def _get_depth(self, node: Any, depths: dict[int, int]) -> int:
+        """(Protected)
+        Return the maximum number of splits from a node to a rule.
+        """
+        if type(node) is not _Node:
+            return 0
+        if id(node) not in depths:
+            depths[id(node)] = 1 + max(self._get_depth(child, depths) for child in node.children)
+        return depths[id(node)]
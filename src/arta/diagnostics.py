@@ -0,0 +1,46 @@
+"""Counters of the diagnostic events raised on the execution path (deprecations, ignored conditions).
+
+Events are reported (warning or log) only once per rule or condition, then only counted.
+
+Class: EventCounter
+"""
+
+from __future__ import annotations
+
+import threading
+
+# Kinds of events (see RulesEngine.diagnostics())
+DEPRECATED_INPUT_DATA: str = "deprecated_input_data"
+IGNORED_CONDITION: str = "ignored_condition"
+
+# Events are rare: a single lock is shared by all the counters
+_lock: threading.Lock = threading.Lock()
+
+
+class EventCounter:
+    """Thread-safe counter of a diagnostic event of one rule or condition.
+
+    Attributes:
+        count: Number of occurrences.
+    """
+
+    __slots__ = ("count",)
+
+    def __init__(self) -> None:
+        """Initialize attributes."""
+        self.count: int = 0
+
+    def increment(self) -> bool:
+        """Count an occurrence of the event.
+
+        Returns:
+            True if it is the first occurrence (i.e., the event has to be reported).
+        """
+        with _lock:
+            self.count += 1
+            return self.count == 1
+
+    def reset(self) -> None:
+        """Reset the counter (the next occurrence will be reported again)."""
+        with _lock:
+            self.count = 0
@@ -11,3 +11,9 @@ class ConditionExecutionError(Exception):
     """Condition fails during its execution."""
 
     pass
+
+
+class UnsupportedExpressionError(ValueError):
+    """Condition expression uses a Python construct which is not allowed (raised when the rules are built)."""
+
+    pass
@@ -0,0 +1,533 @@
+"""Restricted compiler of the condition expressions (no eval() of the configuration at evaluation time).
+
+Expressions are parsed once with ast and checked against a whitelist of Python constructs: comparisons,
+boolean and arithmetic operators, literals and variables (data paths or condition results). Then, they are
+compiled into functions without builtins. Unsupported constructs (function calls, attributes, subscripts,
+unknown names...) raise an error when the rules engine is built.
+
+Simple conditions also support membership tests ('input.country in ["FR", "BE"]'), regular expressions
+('input.email matches /@example\\.com$/'), substrings ('input.comment contains "refund"'),
+categories ('any_of(input.powers, ["fly", "strength"])', 'all_of', 'none_of'), 'between(input.age, 18, 65)'
+and 'len(input.items)>3': they are compiled into precompiled helpers (frozensets, compiled patterns, bit sets)
+or plain comparisons. Reference datasets of the configuration are searched with 'input.customer_id in @sanctioned_ids'
+and sliding windows are aggregated with 'count(@claims_10m)>5' ('sum', 'avg', 'min', 'max'). Data paths may have
+list indexes and wildcards ('input.items[0].price', 'input.items[*].price'), whose lists are aggregated with
+'sum(input.items[*].price)>100' ('count', 'avg', 'min', 'max', 'any', 'all').
+
+Functions: parse_expression, compile_expression, split_simple_conditions, compile_simple_condition
+Classes: CompiledCondition, LiteralSet
+"""
+
+from __future__ import annotations
+
+import ast
+import functools
+import re
+from collections.abc import Collection, Mapping
+from types import CodeType
+from typing import Any, Callable, NamedTuple
+
+from arta.categorical import CATEGORY_FUNCTIONS, CategoryTest
+from arta.exceptions import UnsupportedExpressionError
+from arta.path import PATH_AGGREGATES
+from arta.window import AGGREGATE_FUNCTIONS
+
+# Python constructs of the simple conditions (e.g., 'data_0*data_1<=data_2', 'data_0=="english"')
+SIMPLE_CONDITION_NODES: tuple[type[ast.AST], ...] = (
+    ast.Expression,
+    ast.BoolOp,
+    ast.And,
+    ast.Or,
+    ast.UnaryOp,
+    ast.Not,
+    ast.USub,
+    ast.UAdd,
+    ast.BinOp,
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.FloorDiv,
+    ast.Mod,
+    ast.MatMult,
+    ast.Compare,
+    ast.Eq,
+    ast.NotEq,
+    ast.Lt,
+    ast.LtE,
+    ast.Gt,
+    ast.GtE,
+    ast.In,
+    ast.NotIn,
+    ast.Is,
+    ast.IsNot,
+    ast.Name,
+    ast.Load,
+    ast.Constant,
+    ast.List,
+    ast.Tuple,
+    ast.Set,
+    ast.Call,
+)
+
+# Functions of the simple conditions (e.g., 'len(input.items)>3', 'between(input.age, 18, 65)')
+SIMPLE_CONDITION_FUNCTIONS: frozenset[str] = frozenset(
+    {"len", "between", *CATEGORY_FUNCTIONS, *AGGREGATE_FUNCTIONS, *PATH_AGGREGATES}
+)
+
+# Python constructs of the condition expressions of the rules (e.g., 'c_0 and not c_1')
+BOOLEAN_EXPRESSION_NODES: tuple[type[ast.AST], ...] = (
+    ast.Expression,
+    ast.BoolOp,
+    ast.And,
+    ast.Or,
+    ast.UnaryOp,
+    ast.Not,
+    ast.Name,
+    ast.Load,
+    ast.Constant,
+)
+
+
+# Tokens of the simple conditions: string literals (unchanged), regex literals, data paths and reference datasets
+_SIMPLE_CONDITION_TOKENS: re.Pattern[str] = re.compile(
+    r"(?P<string>\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*')"
+    r"|\bmatches[ \t]*/(?P<regex>(?:\\.|[^/\\])*)/"
+    r"|\bcontains[ \t]*(?P<contains>\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*')"
+    r"|(?P<path>\b(?:input|output)(?:\.[A-Za-z0-9_]+(?:\[(?:-?[0-9]+|\*)\])*)+)"
+    r"|@(?P<dataset>[A-Za-z_][A-Za-z0-9_]*)"
+)
+
+
+class LiteralSet(frozenset[Any]):
+    """Literals of a membership test (e.g., 'input.country in ["FR", "BE"]'), searched with their hash.
+
+    Unhashable values (e.g., a list) are compared with each literal, like the list of the expression:
+    they are never part of the literals (no TypeError).
+    """
+
+    __slots__ = ()
+
+    def __contains__(self, value: object) -> bool:
+        """Return True if the value is one of the literals."""
+        try:
+            return frozenset.__contains__(self, value)
+        except TypeError:
+            return any(item is value or item == value for item in self)
+
+
+class CompiledCondition(NamedTuple):
+    """Simple condition compiled into a function of its data values.
+
+    Attributes:
+        data_paths: Distinct data paths of the condition (e.g., 'input.age').
+        source: Python expression of the values ('data_0' is the value of the first path) and the helpers.
+        helpers: Precompiled values used by the expression
+            (k: name, v: frozenset, regex search method, CategoryTest, ReferenceDataset, SlidingWindow method or len).
+        evaluate: Compiled function of the values (None if there is no data path).
+    """
+
+    data_paths: tuple[str, ...]
+    source: str
+    helpers: dict[str, Any]
+    evaluate: Callable[..., Any] | None
+
+
+def parse_expression(
+    expr: str,
+    names: Collection[str],
+    allowed_nodes: tuple[type[ast.AST], ...],
+    source: str | None = None,
+    functions: Collection[str] = (),
+) -> ast.Expression:
+    """Parse an expression and check its constructs.
+
+    Args:
+        expr: Python expression whose variables are in 'names'.
+        names: Allowed variable names.
+        allowed_nodes: Allowed Python constructs (e.g., SIMPLE_CONDITION_NODES).
+        source: Original expression (error messages), 'expr' if None.
+        functions: Names which can be called (positional arguments only), if ast.Call is allowed.
+
+    Returns:
+        The syntax tree of the expression.
+
+    Raises:
+        UnsupportedExpressionError: Syntax error or unsupported construct.
+    """
+    source = expr if source is None else source
+
+    try:
+        tree: ast.Expression = ast.parse(expr.strip(), mode="eval")
+    except SyntaxError as error:
+        raise UnsupportedExpressionError(f"Expression '{source}' is not valid: {error.msg}") from error
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and node.id not in names:
+            raise UnsupportedExpressionError(f"Expression '{source}' is not valid: unknown name '{node.id}'.")
+
+        if isinstance(node, ast.Call) and not (isinstance(node.func, ast.Name) and node.func.id in functions):
+            raise UnsupportedExpressionError(f"Expression '{source}' is not valid: unknown function.")
+
+        if not isinstance(node, allowed_nodes):
+            raise UnsupportedExpressionError(
+                f"Expression '{source}' is not valid: '{type(node).__name__}' is not supported."
+            )
+
+    return tree
+
+
+def compile_expression(
+    expr: str,
+    names: tuple[str, ...],
+    allowed_nodes: tuple[type[ast.AST], ...],
+    source: str | None = None,
+    helpers: Mapping[str, Any] | None = None,
+    engine_helpers: Collection[str] = (),
+) -> Callable[..., Any]:
+    """Compile an expression into a function taking its variables as positional arguments.
+
+    E.g., 'data_0>=18 and data_1!=None' with names ('data_0', 'data_1') --> lambda data_0, data_1: ...
+
+    The function has no access to the builtins. Identical expressions share the same function,
+    unless they use helpers owned by a rules engine.
+
+    Args:
+        expr: Python expression whose variables are in 'names' (or 'helpers').
+        names: Variable names (argument order).
+        allowed_nodes: Allowed Python constructs (e.g., SIMPLE_CONDITION_NODES).
+        source: Original expression (error messages), 'expr' if None.
+        helpers: Values (or functions) available to the expression (k: name, v: hashable value).
+        engine_helpers: Names of the helpers owned by a rules engine (e.g., reference datasets, sliding windows):
+            they are bound to a new function and never kept by the process-wide cache (released with the engine).
+
+    Returns:
+        The compiled function.
+
+    Raises:
+        UnsupportedExpressionError: Syntax error or unsupported construct.
+    """
+    helpers_dict: dict[str, Any] = dict(helpers) if helpers is not None else {}
+    parse_expression(expr, (*names, *helpers_dict), allowed_nodes, source, helpers_dict)
+
+    if len(engine_helpers) > 0:
+        code: CodeType = _compile_code(expr.strip(), names, allowed_nodes, tuple(sorted(helpers_dict)))
+        function: Callable[..., Any] = eval(code, {"__builtins__": {}, **helpers_dict})  # noqa: S307
+        return function
+
+    return _compile(expr.strip(), names, allowed_nodes, tuple(sorted(helpers_dict.items())))
+
+
+@functools.lru_cache(maxsize=65_536)
+def _compile(
+    expr: str,
+    names: tuple[str, ...],
+    allowed_nodes: tuple[type[ast.AST], ...],
+    helper_items: tuple[tuple[str, Any], ...],
+) -> Callable[..., Any]:
+    """(Protected)
+    Compile an expression already checked by parse_expression() (cached: rules share the same expressions).
+    """
+    code: CodeType = _compile_code(expr, names, allowed_nodes, tuple(name for name, _ in helper_items))
+
+    # Only whitelisted constructs: no names other than the arguments and the helpers, no attributes or subscripts
+    function: Callable[..., Any] = eval(code, {"__builtins__": {}, **dict(helper_items)})  # noqa: S307
+    return function
+
+
+@functools.lru_cache(maxsize=65_536)
+def _compile_code(
+    expr: str,
+    names: tuple[str, ...],
+    allowed_nodes: tuple[type[ast.AST], ...],
+    helper_names: tuple[str, ...],
+) -> CodeType:
+    """(Protected)
+    Return the code object of the function of an expression already checked by parse_expression()
+    (cached by names only: the helpers are bound when the function is built).
+    """
+    body: ast.expr = parse_expression(expr, (*names, *helper_names), allowed_nodes, functions=helper_names).body
+    arguments: ast.arguments = ast.arguments(
+        posonlyargs=[], args=[ast.arg(arg=name) for name in names], kwonlyargs=[], kw_defaults=[], defaults=[]
+    )
+    tree: ast.Expression = ast.fix_missing_locations(ast.Expression(body=ast.Lambda(args=arguments, body=body)))
+    return compile(tree, "<expression>", "eval")
+
+
+@functools.lru_cache(maxsize=65_536)
+def split_simple_conditions(expr: str) -> tuple[str, ...]:
+    """Return the unitary simple conditions of a boolean expression (operands of 'and', 'or', 'not').
+
+    E.g., 'input.age>=18 and not input.country in ["FR", "BE"]' --> ('input.age>=18', 'input.country in ["FR", "BE"]')
+
+    Args:
+        expr: A boolean expression of simple conditions.
+
+    Returns:
+        The unitary simple conditions (as written in the expression).
+
+    Raises:
+        UnsupportedExpressionError: Syntax error.
+    """
+
+    def mask(match: re.Match[str]) -> str:
+        # Same size (UTF-8 bytes) as the token: node positions are the same in the original expression
+        size: int = len(match.group(0).encode())
+        if match.group("regex") is not None or match.group("contains") is not None:
+            return '@"' + "x" * (size - 3) + '"'
+        if match.group("path") is not None:
+            return "p" + "_" * (size - 1)
+        if match.group("dataset") is not None:
+            return "d" + "_" * (size - 1)
+        return match.group(0)
+
+    # Parentheses: leading whitespaces and line breaks are allowed
+    source: str = f"({expr})"
+
+    try:
+        tree: ast.Expression = ast.parse(_SIMPLE_CONDITION_TOKENS.sub(mask, source), mode="eval")
+    except SyntaxError as error:
+        raise UnsupportedExpressionError(f"Expression '{expr}' is not valid: {error.msg}") from error
+
+    conditions: list[str] = []
+    nodes: list[ast.expr] = [tree.body]
+
+    while len(nodes) > 0:
+        node: ast.expr = nodes.pop()
+
+        if isinstance(node, ast.BoolOp):
+            nodes.extend(reversed(node.values))
+        elif isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            nodes.append(node.operand)
+        else:
+            conditions.append(ast.get_source_segment(source, node) or "")
+
+    return tuple(conditions)
+
+
+def compile_simple_condition(
+    condition_id: str, datasets: Mapping[str, Any] | None = None, windows: Mapping[str, Any] | None = None
+) -> CompiledCondition:
+    """Compile a unitary simple condition (e.g., 'input.age>=18', 'input.email matches /@example\\.com$/').
+
+    Args:
+        condition_id: A unitary simple condition.
+        datasets: Reference datasets of the configuration (k: name, v: ReferenceDataset), e.g., 'input.id in @ids'.
+        windows: Sliding windows of the configuration (k: name, v: SlidingWindow), e.g., 'count(@claims_10m)>5'.
+
+    Returns:
+        The compiled condition.
+
+    Raises:
+        UnsupportedExpressionError: Syntax error or unsupported construct.
+    """
+    data_paths: list[str] = []
+    dataset_helpers: dict[str, Any] = {}
+    window_helpers: dict[str, tuple[Any, str]] = {}
+
+    def translate(match: re.Match[str]) -> str:
+        if match.group("regex") is not None:
+            # Regex literal --> string operand of '@' (compiled below), '\\/' is an escaped slash
+            pattern: str = match.group("regex").replace("\\/", "/")
+            return f"@ {pattern!r}"
+        if match.group("contains") is not None:
+            # Substring --> escaped regex literal (same helper)
+            try:
+                substring: str = re.escape(ast.literal_eval(match.group("contains")))
+            except (ValueError, SyntaxError) as error:
+                raise UnsupportedExpressionError(f"Expression '{condition_id}' is not valid: {error}") from error
+            return f"@ {substring!r}"
+        if match.group("path") is not None:
+            # Data path --> variable (one per distinct path)
+            if match.group(0) not in data_paths:
+                data_paths.append(match.group(0))
+            return f"data_{data_paths.index(match.group(0))}"
+        if match.group("dataset") is not None:
+            # Reference dataset --> helper (only the right operand of 'in' and 'not in', see _HelperLowering)
+            dataset_name: str = match.group("dataset")
+            if windows is not None and dataset_name in windows:
+                # Sliding window --> helper and variable of its key (only the argument of an aggregate function)
+                key_path: str = windows[dataset_name].key_path
+                if key_path not in data_paths:
+                    data_paths.append(key_path)
+                window_helpers[f"_window_{dataset_name}"] = (
+                    windows[dataset_name],
+                    f"data_{data_paths.index(key_path)}",
+                )
+                return f"_window_{dataset_name}"
+            if datasets is None or dataset_name not in datasets:
+                raise UnsupportedExpressionError(
+                    f"Expression '{condition_id}' is not valid: unknown dataset '@{dataset_name}'."
+                )
+            dataset_helpers[f"_dataset_{dataset_name}"] = datasets[dataset_name]
+            return f"_dataset_{dataset_name}"
+        return match.group(0)
+
+    python_expr: str = _SIMPLE_CONDITION_TOKENS.sub(translate, f"({condition_id})")
+    names: tuple[str, ...] = tuple(f"data_{idx}" for idx in range(len(data_paths)))
+
+    tree: ast.Expression = parse_expression(
+        python_expr,
+        (*names, *SIMPLE_CONDITION_FUNCTIONS, *dataset_helpers, *window_helpers),
+        SIMPLE_CONDITION_NODES,
+        condition_id,
+        SIMPLE_CONDITION_FUNCTIONS,
+    )
+    lowering: _HelperLowering = _HelperLowering(condition_id, dataset_helpers, window_helpers)
+    source: str = ast.unparse(ast.fix_missing_locations(lowering.visit(tree)))
+
+    evaluate: Callable[..., Any] | None = None
+    if len(names) > 0:
+        evaluate = compile_expression(
+            source, names, SIMPLE_CONDITION_NODES, condition_id, lowering.helpers, lowering.engine_helpers
+        )
+
+    return CompiledCondition(tuple(data_paths), source, lowering.helpers, evaluate)
+
+
+class _HelperLowering(ast.NodeTransformer):
+    """Replace the extended operators of a simple condition by precompiled helpers or plain comparisons."""
+
+    def __init__(
+        self,
+        source: str,
+        datasets: dict[str, Any] | None = None,
+        windows: dict[str, tuple[Any, str]] | None = None,
+    ) -> None:
+        self.source = source
+        self.datasets: dict[str, Any] = datasets or {}
+        self.windows: dict[str, tuple[Any, str]] = windows or {}
+        self.helpers: dict[str, Any] = {}
+        # Helpers owned by the rules engine (datasets and windows, see compile_expression())
+        self.engine_helpers: set[str] = set()
+
+    def visit_Name(self, node: ast.Name) -> ast.expr:  # noqa: N802
+        if node.id in SIMPLE_CONDITION_FUNCTIONS:
+            # Functions can only be called
+            raise UnsupportedExpressionError(f"Expression '{self.source}' is not valid: '{node.id}' must be called.")
+        if node.id in self.datasets:
+            # Datasets can only be searched
+            raise UnsupportedExpressionError(
+                f"Expression '{self.source}' is not valid: datasets can only be used with 'in' and 'not in'."
+            )
+        if node.id in self.windows:
+            # Windows can only be aggregated
+            raise UnsupportedExpressionError(
+                f"Expression '{self.source}' is not valid: windows can only be used with "
+                f"{', '.join(repr(name) for name in AGGREGATE_FUNCTIONS)}."
+            )
+        return node
+
+    def visit_Call(self, node: ast.Call) -> ast.expr:  # noqa: N802
+        name: str = node.func.id if isinstance(node.func, ast.Name) else ""
+
+        if (
+            name in AGGREGATE_FUNCTIONS
+            and len(node.args) == 1
+            and isinstance(node.args[0], ast.Name)
+            and node.args[0].id in self.windows
+        ):
+            # Aggregate of a sliding window (e.g., 'count(@claims_10m)') --> method of the window, called with the key
+            window, key_name = self.windows[node.args[0].id]
+            method_name: str = f"{node.args[0].id}_{name}"
+            self.helpers[method_name] = getattr(window, name)
+            self.engine_helpers.add(method_name)
+            return ast.Call(
+                func=ast.Name(id=method_name, ctx=ast.Load()), args=[ast.Name(id=key_name, ctx=ast.Load())], keywords=[]
+            )
+
+        node.args = [self.visit(arg) for arg in node.args]
+
+        if name == "between" and len(node.args) == 3:
+            # between(value, low, high) --> low <= value <= high
+            value, low, high = node.args
+            return ast.Compare(left=low, ops=[ast.LtE(), ast.LtE()], comparators=[value, high])
+
+        if name == "len" and len(node.args) == 1:
+            self.helpers["len"] = len
+            return node
+
+        if (
+            name in PATH_AGGREGATES
+            and len(node.args) == 1
+            and isinstance(node.args[0], ast.Name)
+            and node.args[0].id.startswith("data_")
+        ):
+            # Aggregate of a list (e.g., 'sum(input.items[*].price)') --> helper raising TypeError for other values
+            self.helpers[f"_aggregate_{name}"] = PATH_AGGREGATES[name]
+            return ast.Call(func=ast.Name(id=f"_aggregate_{name}", ctx=ast.Load()), args=node.args, keywords=[])
+
+        if (
+            name in CATEGORY_FUNCTIONS
+            and len(node.args) == 2
+            and isinstance(node.args[1], (ast.List, ast.Tuple, ast.Set))
+        ):
+            # Categories --> bit set test (e.g., 'any_of(input.powers, ["fly", "strength"])')
+            try:
+                test: CategoryTest = CategoryTest(name, (ast.literal_eval(elt) for elt in node.args[1].elts))
+            except (ValueError, TypeError) as error:
+                raise UnsupportedExpressionError(
+                    f"Expression '{self.source}' is not valid: categories of '{name}' must be literals."
+                ) from error
+
+            helper_name: str = f"_categories_{len(self.helpers)}"
+            self.helpers[helper_name] = test
+            return ast.Call(func=ast.Name(id=helper_name, ctx=ast.Load()), args=[node.args[0]], keywords=[])
+
+        raise UnsupportedExpressionError(f"Expression '{self.source}' is not valid: wrong arguments of '{name}'.")
+
+    def visit_BinOp(self, node: ast.BinOp) -> ast.expr:  # noqa: N802
+        self.generic_visit(node)
+
+        if not isinstance(node.op, ast.MatMult):
+            return node
+
+        # Regex literal --> search method of the compiled pattern (found anywhere in the value)
+        if not (isinstance(node.right, ast.Constant) and isinstance(node.right.value, str)):
+            raise UnsupportedExpressionError(f"Expression '{self.source}' is not valid: 'matches' needs a /regex/.")
+
+        try:
+            pattern: re.Pattern[str] = re.compile(node.right.value)
+        except re.error as error:
+            raise UnsupportedExpressionError(f"Expression '{self.source}' is not valid: {error}") from error
+
+        name: str = f"_regex_{len(self.helpers)}"
+        self.helpers[name] = pattern.search
+        return ast.Compare(
+            left=ast.Call(func=ast.Name(id=name, ctx=ast.Load()), args=[node.left], keywords=[]),
+            ops=[ast.IsNot()],
+            comparators=[ast.Constant(value=None)],
+        )
+
+    def visit_Compare(self, node: ast.Compare) -> ast.expr:  # noqa: N802
+        if (
+            len(node.ops) == 1
+            and isinstance(node.ops[0], (ast.In, ast.NotIn))
+            and isinstance(node.comparators[0], ast.Name)
+            and node.comparators[0].id in self.datasets
+        ):
+            # Reference dataset (e.g., 'input.id in @ids') --> lookup in its index
+            self.helpers[node.comparators[0].id] = self.datasets[node.comparators[0].id]
+            self.engine_helpers.add(node.comparators[0].id)
+            node.left = self.visit(node.left)
+            return node
+
+        self.generic_visit(node)
+
+        if (
+            len(node.ops) == 1
+            and isinstance(node.ops[0], (ast.In, ast.NotIn))
+            and isinstance(node.comparators[0], (ast.List, ast.Tuple, ast.Set))
+        ):
+            # Literal collection --> frozenset (hash lookup, see LiteralSet)
+            try:
+                values: LiteralSet = LiteralSet(ast.literal_eval(elt) for elt in node.comparators[0].elts)
+            except (ValueError, TypeError):
+                # Not only hashable literals (e.g., a data path)
+                return node
+
+            name: str = f"_set_{len(self.helpers)}"
+            self.helpers[name] = values
+            node.comparators = [ast.Name(id=name, ctx=ast.Load())]
+
+        return node
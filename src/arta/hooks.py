@@ -0,0 +1,329 @@
+"""Execution hooks and tracing spans of the rules engine.
+
+Classes: EngineHook, Span, SpanExporter, InMemorySpanExporter, JsonLinesSpanExporter, TracingHook
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, NamedTuple
+
+
+class EngineHook:
+    """Base class of the execution hooks (register them with RulesEngine.add_hook()).
+
+    All callbacks do nothing: override the ones you need. Timings are given in nanoseconds,
+    start times come from time.perf_counter_ns(). Callbacks of one request are called by the thread
+    running RulesEngine.apply_rules().
+    """
+
+    def on_rule_set_start(self, rule_set: str, start_ns: int) -> None:
+        """Called before evaluating a rule set.
+
+        Args:
+            rule_set: Id of the rule set.
+            start_ns: Start time.
+        """
+
+    def on_rule_set_end(self, rule_set: str, start_ns: int, duration_ns: int, error: BaseException | None) -> None:
+        """Called after evaluating a rule set (even if an error is raised).
+
+        Args:
+            rule_set: Id of the rule set.
+            start_ns: Start time.
+            duration_ns: Duration of the evaluation.
+            error: The raised exception, None if the evaluation succeeded.
+        """
+
+    def on_group_start(self, rule_set: str, group_id: str, start_ns: int) -> None:
+        """Called before evaluating a rule group.
+
+        Args:
+            rule_set: Id of the rule set.
+            group_id: Id of the rule group.
+            start_ns: Start time.
+        """
+
+    def on_group_end(self, rule_set: str, group_id: str, start_ns: int, duration_ns: int) -> None:
+        """Called after evaluating a rule group (not called if an error is raised).
+
+        Args:
+            rule_set: Id of the rule set.
+            group_id: Id of the rule group.
+            start_ns: Start time.
+            duration_ns: Duration of the evaluation.
+        """
+
+    def on_rule_evaluated(
+        self, rule_set: str, group_id: str, rule_id: str, activated: bool, start_ns: int, duration_ns: int
+    ) -> None:
+        """Called after evaluating a rule (conditions and action if activated).
+
+        Args:
+            rule_set: Id of the rule set.
+            group_id: Id of the rule group.
+            rule_id: Id of the rule.
+            activated: True if the action has been triggered.
+            start_ns: Start time.
+            duration_ns: Duration of the evaluation.
+        """
+
+    def on_condition_verified(
+        self,
+        rule_set: str,
+        group_id: str,
+        rule_id: str,
+        condition_id: str,
+        result: bool,
+        start_ns: int,
+        duration_ns: int,
+    ) -> None:
+        """Called after verifying a condition (not called when its result is shared from another rule).
+
+        Args:
+            rule_set: Id of the rule set.
+            group_id: Id of the rule group.
+            rule_id: Id of the rule.
+            condition_id: Id of the condition.
+            result: Result of the condition.
+            start_ns: Start time.
+            duration_ns: Duration of the verification.
+        """
+
+    def on_action_executed(
+        self, rule_set: str, group_id: str, rule_id: str, action: str, start_ns: int, duration_ns: int
+    ) -> None:
+        """Called after executing an action.
+
+        Args:
+            rule_set: Id of the rule set.
+            group_id: Id of the rule group.
+            rule_id: Id of the rule.
+            action: Name of the action function.
+            start_ns: Start time.
+            duration_ns: Duration of the execution.
+        """
+
+
+class Span(NamedTuple):
+    """A timed operation of a trace (one trace per rule set evaluation)."""
+
+    trace_id: str
+    span_id: int
+    parent_id: int | None
+    kind: str
+    name: str
+    start_time_ns: int
+    duration_ns: int
+    attributes: dict[str, Any]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the span as a dictionary."""
+        return self._asdict()
+
+
+class SpanExporter:
+    """Base class of the span exporters."""
+
+    def export(self, spans: list[Span]) -> None:
+        """Export the spans of one trace.
+
+        Args:
+            spans: Spans of a trace (the root span first).
+        """
+        raise NotImplementedError
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Keep the spans of the last traces in memory (e.g., for tests or debugging).
+
+    Attributes:
+        max_traces: Maximum number of traces kept.
+    """
+
+    def __init__(self, max_traces: int = 1000) -> None:
+        """Initialize attributes.
+
+        Args:
+            max_traces: Maximum number of traces kept.
+        """
+        self.max_traces = max_traces
+        self._traces: deque[list[Span]] = deque(maxlen=max_traces)
+        self._lock = threading.Lock()
+
+    def export(self, spans: list[Span]) -> None:
+        """Store the spans of one trace."""
+        with self._lock:
+            self._traces.append(spans)
+
+    def get_traces(self) -> list[list[Span]]:
+        """Return the stored traces (oldest first)."""
+        with self._lock:
+            return list(self._traces)
+
+    def get_spans(self) -> list[Span]:
+        """Return all the stored spans."""
+        with self._lock:
+            return [span for trace in self._traces for span in trace]
+
+    def clear(self) -> None:
+        """Forget the stored traces."""
+        with self._lock:
+            self._traces.clear()
+
+
+class JsonLinesSpanExporter(SpanExporter):
+    """Append the spans to a JSON lines file (one span per line).
+
+    Attributes:
+        path: Path of the file.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        """Initialize attributes.
+
+        Args:
+            path: Path of the file.
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def export(self, spans: list[Span]) -> None:
+        """Write the spans of one trace."""
+        lines: str = "".join(json.dumps(span.to_dict(), default=str) + "\n" for span in spans)
+
+        with self._lock, self.path.open("a", encoding="utf-8") as file:
+            file.write(lines)
+
+
+class _Trace:
+    """Spans of the trace being recorded by the current thread."""
+
+    __slots__ = ("trace_id", "origin_ns", "wall_origin_ns", "spans", "group_span_id", "pending_children")
+
+    def __init__(self, start_ns: int) -> None:
+        self.trace_id: str = os.urandom(8).hex()
+        self.origin_ns: int = start_ns
+        self.wall_origin_ns: int = time.time_ns()
+        self.spans: list[Span] = []
+        self.group_span_id: int | None = None
+        # Indexes of the condition and action spans waiting for their rule span
+        self.pending_children: list[int] = []
+
+    def add(self, parent_id: int | None, kind: str, name: str, start_ns: int, duration_ns: int, **attrs: Any) -> int:
+        span_id: int = len(self.spans) + 1
+        wall_start_ns: int = self.wall_origin_ns + start_ns - self.origin_ns
+        self.spans.append(Span(self.trace_id, span_id, parent_id, kind, name, wall_start_ns, duration_ns, attrs))
+        return span_id
+
+
+class TracingHook(EngineHook):
+    """Record a trace of spans (rule set > groups > rules > conditions/actions) for each request.
+
+    Spans are recorded when their operation ends (conditions and actions are attached to their rule afterwards).
+    The root span (rule set) is always the first span of an exported trace.
+
+    Attributes:
+        exporter: Destination of the traces.
+        slow_threshold_ms: Only the traces lasting at least this duration are exported (None: all of them).
+    """
+
+    def __init__(self, exporter: SpanExporter, slow_threshold_ms: float | None = None) -> None:
+        """Initialize attributes.
+
+        Args:
+            exporter: Destination of the traces.
+            slow_threshold_ms: Only the traces lasting at least this duration are exported (None: all of them).
+        """
+        self.exporter = exporter
+        self.slow_threshold_ms = slow_threshold_ms
+        self._local = threading.local()
+
+    def _current(self) -> _Trace | None:
+        return getattr(self._local, "trace", None)
+
+    def on_rule_set_start(self, rule_set: str, start_ns: int) -> None:
+        """Start a new trace."""
+        self._local.trace = _Trace(start_ns)
+
+    def on_rule_set_end(self, rule_set: str, start_ns: int, duration_ns: int, error: BaseException | None) -> None:
+        """Close and export the trace."""
+        trace: _Trace | None = self._current()
+        self._local.trace = None
+
+        if trace is None:
+            return
+        if self.slow_threshold_ms is not None and duration_ns < self.slow_threshold_ms * 1e6:
+            return
+
+        attrs: dict[str, Any] = {"rule_set": rule_set}
+        if error is not None:
+            attrs["error"] = repr(error)
+
+        root: Span = Span(trace.trace_id, 0, None, "rule_set", rule_set, trace.wall_origin_ns, duration_ns, attrs)
+
+        # Spans without parent (i.e., groups) are attached to the root span
+        spans: list[Span] = [root] + [
+            span if span.parent_id is not None else span._replace(parent_id=0) for span in trace.spans
+        ]
+        self.exporter.export(spans)
+
+    def on_group_start(self, rule_set: str, group_id: str, start_ns: int) -> None:
+        """Reserve the group span (its children are recorded before it ends)."""
+        trace: _Trace | None = self._current()
+        if trace is not None:
+            trace.group_span_id = trace.add(None, "group", group_id, start_ns, 0, rule_set=rule_set)
+
+    def on_group_end(self, rule_set: str, group_id: str, start_ns: int, duration_ns: int) -> None:
+        """Set the group span duration."""
+        trace: _Trace | None = self._current()
+        if trace is not None and trace.group_span_id is not None:
+            idx: int = trace.group_span_id - 1
+            trace.spans[idx] = trace.spans[idx]._replace(duration_ns=duration_ns)
+
+    def on_rule_evaluated(
+        self, rule_set: str, group_id: str, rule_id: str, activated: bool, start_ns: int, duration_ns: int
+    ) -> None:
+        """Record the rule span and attach the condition and action spans to it."""
+        trace: _Trace | None = self._current()
+        if trace is None:
+            return
+
+        rule_span_id: int = trace.add(
+            trace.group_span_id, "rule", rule_id, start_ns, duration_ns, group_id=group_id, activated=activated
+        )
+
+        # Children of the rule have been recorded before it
+        for idx in trace.pending_children:
+            trace.spans[idx] = trace.spans[idx]._replace(parent_id=rule_span_id)
+        trace.pending_children.clear()
+
+    def on_condition_verified(
+        self,
+        rule_set: str,
+        group_id: str,
+        rule_id: str,
+        condition_id: str,
+        result: bool,
+        start_ns: int,
+        duration_ns: int,
+    ) -> None:
+        """Record a condition span."""
+        trace: _Trace | None = self._current()
+        if trace is not None:
+            trace.pending_children.append(len(trace.spans))
+            trace.add(None, "condition", condition_id, start_ns, duration_ns, rule_id=rule_id, result=result)
+
+    def on_action_executed(
+        self, rule_set: str, group_id: str, rule_id: str, action: str, start_ns: int, duration_ns: int
+    ) -> None:
+        """Record an action span."""
+        trace: _Trace | None = self._current()
+        if trace is not None:
+            trace.pending_children.append(len(trace.spans))
+            trace.add(None, "action", action, start_ns, duration_ns, rule_id=rule_id)
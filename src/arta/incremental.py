@@ -0,0 +1,77 @@
+"""Incremental rebuild of a rules engine (reuse of the objects of a previous version of the configuration).
+
+Functions: get_config_digest, get_module_mtime
+Class: BuildState
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from arta.condition import StandardCondition
+
+
+def get_config_digest(value: Any) -> bytes:
+    """Return a digest of a configuration item (e.g., a rule or a condition definition).
+
+    Args:
+        value: A configuration item (JSON like: dict, list, str, numbers, booleans, None).
+
+    Returns:
+        A 16 bytes digest.
+    """
+    dump: str = json.dumps(value, sort_keys=True, default=repr)
+    return hashlib.blake2b(dump.encode(), digest_size=16).digest()
+
+
+def get_module_mtime(module: ModuleType) -> int | None:
+    """Return the modification time (ns) of the source file of a module, None if it has no source file."""
+    path: str | None = getattr(module, "__file__", None)
+
+    if path is None:
+        return None
+
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+class BuildState:
+    """What a rules engine has been built from, kept to rebuild it incrementally (see RulesEngine 'previous').
+
+    Only digests are kept (not the configuration itself).
+
+    Attributes:
+        modules: Source modules (k: module name, v: (source modification time, collected objects)).
+        conditions: Standard conditions (k: condition id, v: (definition digest, instance)).
+        rules: Rules (k: (rule set id, group id, rule id), v: definition digest).
+        factory_mapping: Condition classes (k: condition conf. key, v: class object).
+        datasets: Reference datasets (k: name, v: (definition and file digest, dataset)).
+        windows: Sliding windows (k: name, v: (definition digest, window)).
+        report: Counters of the last build (reused and built objects, reloaded modules).
+    """
+
+    __slots__ = ("modules", "conditions", "rules", "factory_mapping", "datasets", "windows", "report")
+
+    def __init__(self) -> None:
+        """Initialize attributes."""
+        self.modules: dict[str, tuple[int | None, dict[str, Any]]] = {}
+        self.conditions: dict[str, tuple[bytes, StandardCondition]] = {}
+        self.rules: dict[tuple[str, str, str], bytes] = {}
+        self.factory_mapping: dict[str, type] = {}
+        self.datasets: dict[str, tuple[bytes, Any]] = {}
+        self.windows: dict[str, tuple[bytes, Any]] = {}
+        self.report: dict[str, Any] = {
+            "incremental": False,
+            "reused_rules": 0,
+            "built_rules": 0,
+            "reused_conditions": 0,
+            "built_conditions": 0,
+            "reloaded_modules": [],
+        }
@@ -45,6 +45,28 @@ if not PYDANTIC_V1:
         description: str
         validation_function: str
         condition_parameters: Optional[dict[str, Any]] = None
+        pure: Optional[bool] = None
+
+    class ReferenceDataset(pydantic.BaseModel):
+        """Pydantic model for validating a reference dataset."""
+
+        path: str
+        column: Optional[str] = None
+        bloom_filter: Optional[bool] = None
+
+        model_config = pydantic.ConfigDict(extra="forbid")
+
+    class SlidingWindow(pydantic.BaseModel):
+        """Pydantic model for validating a sliding window."""
+
+        duration: float
+        key: str
+        value: Optional[str] = None
+        timestamp: Optional[str] = None
+        max_keys: Optional[int] = None
+        max_events: Optional[int] = None
+
+        model_config = pydantic.ConfigDict(extra="forbid")
 
     class RulesConfig(pydantic.BaseModel):
         """Pydantic model for validating a rule group from config file."""
@@ -67,6 +89,8 @@ if not PYDANTIC_V1:
         rules: dict[str, dict[str, dict[Annotated[str, pydantic.StringConstraints(to_upper=True)], RulesConfig]]]
         parsing_error_strategy: Optional[ParsingErrorStrategy] = None
         rule_activation_mode: Optional[RuleActivationMode] = None
+        reference_datasets: Optional[dict[str, ReferenceDataset]] = None
+        sliding_windows: Optional[dict[str, SlidingWindow]] = None
 
 else:
     # Pydantic V1
@@ -121,6 +145,30 @@ else:
         description: str
         validation_function: str
         condition_parameters: Optional[dict[str, Any]]
+        pure: Optional[bool]
+
+    class ReferenceDataset(BaseModelV2):  # type: ignore[no-redef]
+        """Pydantic model for validating a reference dataset."""
+
+        path: str
+        column: Optional[str]
+        bloom_filter: Optional[bool]
+
+        class Config:
+            extra = "forbid"
+
+    class SlidingWindow(BaseModelV2):  # type: ignore[no-redef]
+        """Pydantic model for validating a sliding window."""
+
+        duration: float
+        key: str
+        value: Optional[str]
+        timestamp: Optional[str]
+        max_keys: Optional[int]
+        max_events: Optional[int]
+
+        class Config:
+            extra = "forbid"
 
     class RulesConfig(BaseModelV2):  # type: ignore[no-redef]
         """Pydantic model for validating a rule group from config file."""
@@ -144,3 +192,5 @@ else:
         rules: dict[str, dict[str, dict[pydantic.constr(to_upper=True), RulesConfig]]]  # type: ignore
         parsing_error_strategy: Optional[ParsingErrorStrategy] = None
         rule_activation_mode: Optional[RuleActivationMode] = None
+        reference_datasets: Optional[dict[str, ReferenceDataset]] = None
+        sliding_windows: Optional[dict[str, SlidingWindow]] = None
@@ -0,0 +1,244 @@
+"""Data paths with list indexes and wildcards, compiled once into accessors.
+
+E.g., 'items[0].price', 'items[-1]', 'items[*].price' (list of the prices of all the items),
+'orders[*].items[*].price' (flattened list). Elements of a wildcard without the next keys (or which are not
+dictionaries) are skipped.
+
+The simple conditions aggregate these lists with 'sum(input.items[*].price)>100' (see PATH_AGGREGATES).
+
+Keys are read in dictionaries and other mappings, and in the attributes of the other objects (e.g., dataclasses,
+Pydantic models), without converting them (see get_item() and register_accessor()).
+
+Functions: compile_path, get_item, register_accessor
+Class: PathAccessor
+Constant: PATH_AGGREGATES
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+from collections.abc import Mapping, Sequence
+from typing import Any, Callable
+
+# Extended path: dot-separated keys, each one followed by list indexes or wildcards (e.g., 'items[*].price')
+_PATH_PATTERN: re.Pattern[str] = re.compile(
+    r"[^.\[\]]+(?:\[(?:-?[0-9]+|\*)\])*(?:\.[^.\[\]]+(?:\[(?:-?[0-9]+|\*)\])*)*"
+)
+_STEP_PATTERN: re.Pattern[str] = re.compile(r"([^.\[\]]+)|\[(-?[0-9]+|\*)\]")
+
+# Kinds of steps
+_KEY: int = 0
+_INDEX: int = 1
+_WILDCARD: int = 2
+
+# Accessors of the keys of the registered classes (k: class, v: function(value, key) raising KeyError)
+_ACCESSORS: dict[type, Callable[[Any, str], Any]] = {}
+# Accessors found for the classes of the values (k: class, v: accessor or None)
+_FOUND_ACCESSORS: dict[type, Callable[[Any, str], Any] | None] = {}
+
+
+def register_accessor(cls: type, accessor: Callable[[Any, str], Any]) -> None:
+    """Register how the keys of a data path are read in the instances of a class (and its subclasses).
+
+    E.g., register_accessor(Row, lambda row, key: row.get_field(key))
+
+    Args:
+        cls: Class of the values.
+        accessor: Function returning the value of a key, raising KeyError if it is missing.
+    """
+    _ACCESSORS[cls] = accessor
+    _FOUND_ACCESSORS.clear()
+
+
+def _find_accessor(cls: type) -> Callable[[Any, str], Any] | None:
+    """(Protected)
+    Return the registered accessor of a class (the closest one in its MRO), None if there is none.
+    """
+    if cls not in _FOUND_ACCESSORS:
+        _FOUND_ACCESSORS[cls] = next((_ACCESSORS[base] for base in cls.__mro__ if base in _ACCESSORS), None)
+    return _FOUND_ACCESSORS[cls]
+
+
+def get_item(value: Any, key: str) -> Any:
+    """Return the value of a key of a data path (dictionaries are read directly by the callers, faster).
+
+    The registered accessor of the class is used first, then mappings are read with value[key] and other objects
+    (e.g., dataclasses, Pydantic models) with their public attributes. Built-in types (e.g., lists, strings)
+    keep the behavior of value[key].
+
+    Args:
+        value: Mapping or object.
+        key: Key of the data path.
+
+    Raises:
+        KeyError: Missing key or attribute (private attributes are never read).
+    """
+    accessor: Callable[[Any, str], Any] | None = _find_accessor(type(value))
+    if accessor is not None:
+        return accessor(value, key)
+
+    if isinstance(value, Mapping) or type(value).__module__ == "builtins":
+        return value[key]
+
+    if key.startswith("_"):
+        raise KeyError(f"Private attribute '{key}' of '{type(value).__name__}' can't be read.")
+    try:
+        return getattr(value, key)
+    except AttributeError as error:
+        raise KeyError(key) from error
+
+
+class PathAccessor:
+    """Accessor of an extended data path (a single pass over the input data, lists included).
+
+    Attributes:
+        path: Data path (e.g., 'items[*].price').
+        has_wildcard: True if the value is a list of the values of all the elements.
+    """
+
+    __slots__ = ("path", "has_wildcard", "_steps", "_flatten")
+
+    def __init__(self, path: str) -> None:
+        """Parse the path into steps.
+
+        Args:
+            path: Data path (see compile_path()).
+        """
+        self.path = path
+        self._steps: tuple[tuple[int, Any], ...] = tuple(
+            (_KEY, key) if key else (_WILDCARD, None) if index == "*" else (_INDEX, int(index))
+            for key, index in _STEP_PATTERN.findall(path)
+        )
+        self.has_wildcard: bool = any(kind == _WILDCARD for kind, _ in self._steps)
+
+        # Wildcards followed by another wildcard: their values are flattened
+        self._flatten: tuple[bool, ...] = tuple(
+            any(kind == _WILDCARD for kind, _ in self._steps[idx + 1 :]) for idx in range(len(self._steps))
+        )
+
+    def __call__(self, data: Any) -> Any:
+        """Return the value of the path.
+
+        Raises:
+            KeyError: Missing key or index (outside of a wildcard), or a wildcard on a value which is not a list.
+        """
+        return self._walk(data, 0)
+
+    def _walk(self, value: Any, start: int) -> Any:
+        """(Protected)
+        Return the value of the steps of the path from 'start'.
+        """
+        steps: tuple[tuple[int, Any], ...] = self._steps
+
+        for idx in range(start, len(steps)):
+            kind, arg = steps[idx]
+
+            if value is None:
+                raise KeyError(f"Key {value} of path {self.path} not found in input data.")
+
+            if kind == _KEY:
+                value = value[arg] if isinstance(value, dict) else get_item(value, arg)
+                continue
+
+            if not isinstance(value, (list, tuple)) and (
+                not isinstance(value, Sequence) or isinstance(value, (str, bytes))
+            ):
+                raise KeyError(f"Value of path {self.path} is not a list.")
+
+            if kind == _INDEX:
+                try:
+                    value = value[arg]
+                except IndexError as error:
+                    raise KeyError(f"Index {arg} of path {self.path} not found in input data.") from error
+                continue
+
+            # Wildcard: the remaining steps are applied to each element (missing ones are skipped)
+            values: list[Any] = []
+            for element in value:
+                try:
+                    element_value: Any = self._walk(element, idx + 1)
+                except (KeyError, TypeError):
+                    continue
+                if self._flatten[idx]:
+                    values.extend(element_value)
+                else:
+                    values.append(element_value)
+            return values
+
+        return value
+
+
+@functools.lru_cache(maxsize=4_096)
+def compile_path(path: str) -> PathAccessor | None:
+    """Return the accessor of an extended data path, None if the path has no list index or wildcard.
+
+    Args:
+        path: Data path without the 'input.' prefix (e.g., 'items[*].price').
+    """
+    if "[" not in path or _PATH_PATTERN.fullmatch(path) is None:
+        return None
+    return PathAccessor(path)
+
+
+def _count(values: Sequence[Any]) -> int:
+    """(Protected)
+    Return the number of values of a list.
+    """
+    if not isinstance(values, (list, tuple)):
+        raise TypeError(f"'{type(values).__name__}' is not a list.")
+    return len(values)
+
+
+def _sum(values: Sequence[Any]) -> Any:
+    """(Protected)
+    Return the sum of the values of a list (0 if empty).
+    """
+    return sum(values) if _count(values) > 0 else 0
+
+
+def _avg(values: Sequence[Any]) -> Any:
+    """(Protected)
+    Return the average of the values of a list (None if empty).
+    """
+    return sum(values) / len(values) if _count(values) > 0 else None
+
+
+def _min(values: Sequence[Any]) -> Any:
+    """(Protected)
+    Return the minimum of the values of a list (None if empty).
+    """
+    return min(values) if _count(values) > 0 else None
+
+
+def _max(values: Sequence[Any]) -> Any:
+    """(Protected)
+    Return the maximum of the values of a list (None if empty).
+    """
+    return max(values) if _count(values) > 0 else None
+
+
+def _any(values: Sequence[Any]) -> bool:
+    """(Protected)
+    Return True if at least one value of a list is true.
+    """
+    return _count(values) > 0 and any(values)
+
+
+def _all(values: Sequence[Any]) -> bool:
+    """(Protected)
+    Return True if all the values of a list are true (True if empty).
+    """
+    return _count(values) == 0 or all(values)
+
+
+# Aggregates of the simple conditions over a list (k: name, v: function raising TypeError if it is not a list)
+PATH_AGGREGATES: dict[str, Callable[[Any], Any]] = {
+    "count": _count,
+    "sum": _sum,
+    "avg": _avg,
+    "min": _min,
+    "max": _max,
+    "any": _any,
+    "all": _all,
+}
@@ -0,0 +1,341 @@
+"""Pattern indexes of rule groups testing a text field against many substrings or regular expressions.
+
+The simple conditions of a group matching the same data path ('input.comment contains "refund"',
+'input.email matches /@example\\.com$/') are indexed together: an Aho-Corasick automaton finds all the
+literal patterns in one pass over the text, and a combined alternation of the other regular expressions
+skips them all when none of them matches. Their results are stored in the request's condition results
+before the rules of the group are evaluated, so the rules are then applied as usual (both activation modes).
+In the ONE_BY_GROUP mode, the rules which only depend on indexed conditions are skipped when they can't be activated
+(only if no condition of the group can modify the input data).
+
+Classes: AhoCorasick, PatternIndex, GroupPatternIndex
+Function: get_literal
+"""
+
+from __future__ import annotations
+
+import re
+from collections import deque
+from collections.abc import Iterable, Sequence
+from typing import Any, cast
+
+from arta.condition import SimpleCondition
+from arta.rule import ExpressionPlan, Rule
+from arta.utils import ParsingErrorStrategy, parse_dynamic_parameter
+
+# Backreferences (numbered or named) can't be combined with other patterns
+_BACKREFERENCE_PATTERN: re.Pattern[str] = re.compile(r"\\[1-9]|\(\?P=")
+# Escaped characters of a pattern (see re.escape())
+_ESCAPED_CHAR_PATTERN: re.Pattern[str] = re.compile(r"\\(.)", re.DOTALL)
+
+
+class AhoCorasick:
+    """Aho-Corasick automaton: finds all the occurrences of many literal patterns in one pass over a text.
+
+    Attributes:
+        pattern_count: Number of patterns.
+        state_count: Number of states of the automaton.
+    """
+
+    __slots__ = ("pattern_count", "state_count", "_goto", "_fail", "_outputs", "_alphabet")
+
+    def __init__(self, patterns: Sequence[str]) -> None:
+        """Build the automaton.
+
+        Args:
+            patterns: Literal patterns (their index is returned by find()).
+        """
+        self.pattern_count: int = len(patterns)
+        goto: list[dict[str, int]] = [{}]
+        outputs: list[list[int]] = [[]]
+
+        # Trie of the patterns
+        for idx, pattern in enumerate(patterns):
+            state: int = 0
+            for char in pattern:
+                next_state: int | None = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(idx)
+
+        # Failure links (longest proper suffix which is a prefix of a pattern), breadth-first
+        fail: list[int] = [0] * len(goto)
+        queue: deque[int] = deque(goto[0].values())
+
+        while len(queue) > 0:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                if state == 0:
+                    continue
+
+                fallback: int = fail[state]
+                while fallback != 0 and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(char, 0)
+                outputs[next_state].extend(outputs[fail[next_state]])
+
+        self.state_count: int = len(goto)
+        self._goto = goto
+        self._fail = fail
+        self._outputs: list[tuple[int, ...]] = [tuple(set(output)) for output in outputs]
+        self._alphabet: frozenset[str] = frozenset(char for pattern in patterns for char in pattern)
+
+    def find(self, text: str) -> set[int]:
+        """Return the indexes of the patterns found in a text."""
+        goto: list[dict[str, int]] = self._goto
+        fail: list[int] = self._fail
+        outputs: list[tuple[int, ...]] = self._outputs
+        alphabet: frozenset[str] = self._alphabet
+
+        found: set[int] = set(outputs[0])
+        state: int = 0
+
+        for char in text:
+            if char not in alphabet:
+                # No pattern goes on with this character
+                state = 0
+                continue
+
+            while state != 0 and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            if len(outputs[state]) > 0:
+                found.update(outputs[state])
+
+        return found
+
+
+class PatternIndex:
+    """Simple conditions of a rule group matching patterns against the same data path.
+
+    Attributes:
+        path: Data path of the text (e.g., 'input.comment').
+        literal_count: Number of distinct literal patterns (Aho-Corasick automaton).
+        regex_count: Number of distinct regular expressions (combined alternation).
+    """
+
+    __slots__ = ("path", "literal_count", "regex_count", "_automaton", "_literals", "_prefilter", "_regexes")
+
+    def __init__(self, path: str, conditions: Sequence[tuple[SimpleCondition, re.Pattern[str]]]) -> None:
+        """Build the index.
+
+        Args:
+            path: Data path of the text.
+            conditions: Simple conditions and the compiled pattern they search in the text.
+        """
+        self.path = path
+
+        literals: dict[str, int] = {}
+        regexes: dict[re.Pattern[str], list[SimpleCondition]] = {}
+        self._literals: list[tuple[SimpleCondition, int]] = []
+
+        for condition, pattern in conditions:
+            literal: str | None = get_literal(pattern)
+            if literal is not None:
+                self._literals.append((condition, literals.setdefault(literal, len(literals))))
+            else:
+                regexes.setdefault(pattern, []).append(condition)
+
+        self.literal_count: int = len(literals)
+        self.regex_count: int = len(regexes)
+        self._automaton: AhoCorasick = AhoCorasick(list(literals))
+
+        # Combined into one alternation: if it doesn't match, none of these patterns matches
+        # (not combined: global flags, e.g. '(?i)', and backreferences whose group numbers would change)
+        combined: list[re.Pattern[str]] = [
+            pattern
+            for pattern in regexes
+            if pattern.flags == re.UNICODE and _BACKREFERENCE_PATTERN.search(pattern.pattern) is None
+        ]
+        self._prefilter: re.Pattern[str] | None = None
+        if len(combined) > 1:
+            try:
+                self._prefilter = re.compile("|".join(f"(?:{pattern.pattern})" for pattern in combined))
+            except re.error:
+                # E.g., same group name in two patterns
+                combined = []
+        else:
+            combined = []
+
+        self._regexes: list[tuple[re.Pattern[str], list[SimpleCondition], bool]] = [
+            (pattern, regex_conditions, pattern in combined) for pattern, regex_conditions in regexes.items()
+        ]
+
+    def match(self, input_data: dict[str, Any], parsing_error_strategy: ParsingErrorStrategy) -> dict[Any, bool] | None:
+        """Return the results of the indexed conditions (same results as SimpleCondition.verify()).
+
+        Args:
+            input_data: Input data (with the 'output' key).
+            parsing_error_strategy: Parsing error strategy of the engine.
+
+        Returns:
+            The results (k: condition instance, v: result), or None if the conditions must be verified one by one
+            (e.g., missing key, the text is not a string).
+        """
+        try:
+            text: Any = parse_dynamic_parameter(self.path, input_data, parsing_error_strategy)
+        except Exception:
+            return None
+
+        if not isinstance(text, str):
+            return None
+
+        found: set[int] = self._automaton.find(text) if self.literal_count > 0 else set()
+        results: dict[Any, bool] = {condition: idx in found for condition, idx in self._literals}
+
+        skip_combined: bool = self._prefilter is not None and self._prefilter.search(text) is None
+        for pattern, regex_conditions, is_combined in self._regexes:
+            result: bool = not (skip_combined and is_combined) and pattern.search(text) is not None
+            for condition in regex_conditions:
+                results[condition] = result
+
+        return results
+
+
+def get_literal(pattern: re.Pattern[str]) -> str | None:
+    """Return the text matched by a literal pattern (e.g., 'refund', 're\\.fund' --> 're.fund'), otherwise None."""
+    literal: str = _ESCAPED_CHAR_PATTERN.sub(r"\1", pattern.pattern)
+    return literal if re.escape(literal) == pattern.pattern else None
+
+
+def _get_search_pattern(condition: Any) -> re.Pattern[str] | None:
+    """(Protected)
+    Return the pattern of a simple condition searching a pattern in one data path (e.g., 'input.x matches /.../').
+    """
+    if not isinstance(condition, SimpleCondition) or len(condition._data_paths) != 1 or len(condition._helpers) != 1:
+        return None
+
+    name, helper = next(iter(condition._helpers.items()))
+    pattern: Any = getattr(helper, "__self__", None)
+
+    if not isinstance(pattern, re.Pattern) or condition._data_expr != f"{name}(data_0) is not None":
+        return None
+
+    return pattern
+
+
+class GroupPatternIndex:
+    """Pattern indexes of a rule group, and the rules which only depend on indexed conditions.
+
+    Attributes:
+        indexes: Pattern indexes (one per data path tested by at least 'min_patterns' conditions).
+        filterable: True if the rules which can't be activated can be skipped before the evaluation
+            (all the conditions of the group are request-cacheable: the input data can't change before an action).
+    """
+
+    __slots__ = ("indexes", "filterable", "_rule_plans")
+
+    def __init__(self, rules: Sequence[Rule], min_patterns: int) -> None:
+        """Build the indexes of a group.
+
+        Args:
+            rules: Rules of the group.
+            min_patterns: Minimum number of indexed conditions of a data path.
+        """
+        conditions: dict[str, dict[SimpleCondition, re.Pattern[str]]] = {}
+        rule_plans: dict[Rule, list[ExpressionPlan]] = {}
+
+        for rule in rules:
+            plans: list[ExpressionPlan] | None = []
+
+            for conf_key, expr in rule._condition_exprs.items():
+                if expr is None:
+                    continue
+
+                if rule._condition_factory_mapping[conf_key] is not SimpleCondition:
+                    plans = None
+                    continue
+
+                plan: ExpressionPlan = rule._expression_plans.get(
+                    (SimpleCondition, expr)
+                ) or rule._build_expression_plan(SimpleCondition, expr)
+                if plans is not None:
+                    plans.append(plan)
+
+                for _, condition, _ in plan.conditions:
+                    pattern: re.Pattern[str] | None = _get_search_pattern(condition)
+                    if pattern is not None:
+                        path: str = cast(SimpleCondition, condition)._data_paths[0]
+                        conditions.setdefault(path, {})[cast(SimpleCondition, condition)] = pattern
+
+            if plans is not None and len(plans) > 0:
+                rule_plans[rule] = plans
+
+        self.indexes: list[PatternIndex] = [
+            PatternIndex(path, list(path_conditions.items()))
+            for path, path_conditions in conditions.items()
+            if len(path_conditions) >= min_patterns
+        ]
+
+        # Conditions modifying the input data (e.g., value sharing) could change the results of the patterns
+        self.filterable: bool = all(
+            condition.is_request_cacheable() for rule in rules for condition in rule._condition_instances.values()
+        )
+
+        # Rules whose conditions are all indexed: their result is known once the patterns are matched
+        indexed: set[SimpleCondition] = {
+            condition for path in conditions for condition in conditions[path] if self._is_indexed(path)
+        }
+        self._rule_plans: dict[Rule, list[ExpressionPlan]] = {
+            rule: plans
+            for rule, plans in rule_plans.items()
+            if all(condition in indexed for plan in plans for _, condition, _ in plan.conditions)
+        }
+
+    def match(self, input_data: dict[str, Any], parsing_error_strategy: ParsingErrorStrategy) -> dict[Any, bool]:
+        """Return the results of the indexed conditions (see PatternIndex.match()).
+
+        Args:
+            input_data: Input data (with the 'output' key).
+            parsing_error_strategy: Parsing error strategy of the engine.
+
+        Returns:
+            The results (k: condition instance, v: result), without the conditions to verify one by one.
+        """
+        results: dict[Any, bool] = {}
+
+        for index in self.indexes:
+            index_results: dict[Any, bool] | None = index.match(input_data, parsing_error_strategy)
+            if index_results is not None:
+                results.update(index_results)
+
+        return results
+
+    def filter_rules(self, rules: Iterable[Rule], results: dict[Any, bool]) -> list[Rule]:
+        """Return the rules which may be activated (rules whose indexed conditions give False are removed).
+
+        Args:
+            rules: Rules of the group (in their evaluation order).
+            results: Results of the indexed conditions (see match()).
+
+        Returns:
+            The remaining rules (in the same order).
+        """
+        remaining: list[Rule] = []
+
+        for rule in rules:
+            plans: list[ExpressionPlan] | None = self._rule_plans.get(rule)
+
+            if plans is not None:
+                try:
+                    if not all(plan.evaluate(*[results[cond] for _, cond, _ in plan.conditions]) for plan in plans):
+                        continue
+                except KeyError:
+                    # Conditions verified one by one (e.g., missing key)
+                    pass
+
+            remaining.append(rule)
+
+        return remaining
+
+    def _is_indexed(self, path: str) -> bool:
+        """(Protected)
+        Return True if the conditions of a data path are indexed.
+        """
+        return any(index.path == path for index in self.indexes)
@@ -0,0 +1,326 @@
+"""Registry of rules engines (one per tenant) with LRU eviction.
+
+Function: estimate_engine_size
+Class: EngineRegistry
+"""
+
+from __future__ import annotations
+
+import gc
+import logging
+import random
+import sys
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import Any, Callable, Union
+
+from arta._engine import RulesEngine
+from arta.cache import InternPool
+from arta.stats import LatencyStats
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# Source of a tenant's configuration: a directory path or a configuration dictionary
+ConfigSource = Union[Path, str, dict[str, Any]]
+
+# Objects which don't belong to an engine (shared by the whole process)
+_SHARED_TYPES: tuple[type, ...] = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType)
+
+
+def estimate_engine_size(engine: RulesEngine) -> int:
+    """Return an estimation of the memory used by a rules engine (bytes).
+
+    Objects reachable from the rules and the pure function caches are counted once. Modules, classes and
+    functions are not counted. Structures interned in a pool shared with other engines are counted for each engine.
+
+    Args:
+        engine: A rules engine.
+
+    Returns:
+        The estimated size in bytes.
+    """
+    seen: set[int] = set()
+    stack: list[Any] = [engine.rules, engine._function_caches]
+    size: int = 0
+
+    while len(stack) > 0:
+        obj: Any = stack.pop()
+
+        if id(obj) in seen or isinstance(obj, _SHARED_TYPES):
+            continue
+
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        stack.extend(gc.get_referents(obj))
+
+    return size
+
+
+class _Entry:
+    """Engine of a tenant and its build information."""
+
+    __slots__ = ("engine", "size", "build_duration")
+
+    def __init__(self, engine: RulesEngine, size: int, build_duration: float) -> None:
+        self.engine = engine
+        self.size = size
+        self.build_duration = build_duration
+
+
+class EngineRegistry:
+    """Lazily built rules engines of many tenants, evicted under a count or a memory budget (least recently used first).
+
+    Engines of all the tenants share the same pool of interned values (parameters, expressions) and the imported
+    source modules. Thread-safe: an engine is built once, even if requested by concurrent threads.
+
+    Attributes:
+        max_engines: Maximum number of engines kept (None: no limit).
+        max_memory: Maximum estimated memory of the engines kept, in bytes (None: no limit).
+    """
+
+    def __init__(
+        self,
+        config_source: Path | str | Callable[[str], ConfigSource],
+        *,
+        max_engines: int | None = None,
+        max_memory: int | None = None,
+        prepare: Callable[[RulesEngine], None] | None = None,
+        max_interned_values: int = 100_000,
+    ) -> None:
+        """Initialize attributes.
+
+        Args:
+            config_source: Directory containing one configuration directory per tenant (named after the tenant key),
+                or a function returning the configuration of a tenant (directory path or configuration dictionary).
+            max_engines: Maximum number of engines kept (None: no limit).
+            max_memory: Maximum estimated memory of the engines kept, in bytes (None: no limit).
+            prepare: Function called with each new engine before registering it (e.g., adding hooks).
+            max_interned_values: The shared intern pool is renewed when it exceeds this number of values
+                (values of evicted engines are released).
+
+        Raises:
+            ValueError: Wrong budget.
+        """
+        if (max_engines is not None and max_engines < 1) or (max_memory is not None and max_memory < 1):
+            raise ValueError("'max_engines' and 'max_memory' must be positive integers.")
+
+        self.max_engines = max_engines
+        self.max_memory = max_memory
+        self._config_source = config_source
+        self._prepare = prepare
+        self._max_interned_values = max_interned_values
+
+        self._lock = threading.Lock()
+        self._build_locks: dict[str, threading.Lock] = {}
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._intern_pool = InternPool()
+
+        self._hits: int = 0
+        self._misses: int = 0
+        self._build_errors: int = 0
+        self._evictions: int = 0
+        self._evicted_memory: int = 0
+        self._build_latency = LatencyStats(1024, random.Random(0))  # noqa: S311
+
+    def get(self, tenant: str) -> RulesEngine:
+        """Return the rules engine of a tenant (built if not in the registry).
+
+        Args:
+            tenant: Tenant key.
+
+        Returns:
+            The rules engine.
+
+        Raises:
+            KeyError: Unknown tenant.
+            Same exceptions as RulesEngine (or the prepare function).
+        """
+        with self._lock:
+            entry: _Entry | None = self._get_entry(tenant)
+            if entry is not None:
+                return entry.engine
+
+            build_lock: threading.Lock = self._build_locks.setdefault(tenant, threading.Lock())
+
+        with build_lock:
+            with self._lock:
+                # Built by another thread meanwhile
+                entry = self._get_entry(tenant)
+                if entry is not None:
+                    return entry.engine
+
+                self._misses += 1
+                intern_pool: InternPool = self._intern_pool
+
+            try:
+                entry = self._build(tenant, intern_pool)
+            except Exception:
+                with self._lock:
+                    self._build_errors += 1
+                    self._build_locks.pop(tenant, None)
+                raise
+
+            with self._lock:
+                self._entries[tenant] = entry
+                self._build_locks.pop(tenant, None)
+                self._build_latency.add(int(entry.build_duration * 1e9), False)
+                self._evict_over_budget()
+
+                if len(self._intern_pool) > self._max_interned_values:
+                    # Values of the evicted engines are released (live engines keep their objects)
+                    self._intern_pool = InternPool()
+
+        return entry.engine
+
+    def apply_rules(self, tenant: str, input_data: Any, **kwargs: Any) -> dict[str, Any]:
+        """Apply the rules of a tenant (see RulesEngine.apply_rules()).
+
+        Args:
+            tenant: Tenant key.
+            input_data: Input data to apply rules on.
+            **kwargs: Parameters of RulesEngine.apply_rules().
+
+        Returns:
+            A dictionary containing the rule set results.
+        """
+        return self.get(tenant).apply_rules(input_data, **kwargs)
+
+    def evict(self, tenant: str) -> bool:
+        """Remove the engine of a tenant (e.g., its configuration has changed).
+
+        Args:
+            tenant: Tenant key.
+
+        Returns:
+            True if the engine was in the registry.
+        """
+        with self._lock:
+            return self._entries.pop(tenant, None) is not None
+
+    def clear(self) -> None:
+        """Remove all the engines."""
+        with self._lock:
+            self._entries.clear()
+            self._intern_pool = InternPool()
+
+    def tenants(self) -> list[str]:
+        """Return the tenant keys of the engines in the registry (least recently used first)."""
+        with self._lock:
+            return list(self._entries)
+
+    def __contains__(self, tenant: object) -> bool:
+        """Return True if the engine of the tenant is in the registry."""
+        with self._lock:
+            return tenant in self._entries
+
+    def __len__(self) -> int:
+        """Return the number of engines in the registry."""
+        with self._lock:
+            return len(self._entries)
+
+    def stats(self) -> dict[str, Any]:
+        """Return the registry statistics.
+
+        Returns:
+            A dictionary as: {'engines': int, 'memory': int (bytes), 'hits': int, 'misses': int,
+            'build_errors': int, 'evictions': int, 'evicted_memory': int (bytes),
+            'build_latency': {'evaluations': int, 'mean_ms': float, 'p95_ms': float, ...},
+            'tenants': {tenant: {'memory': int, 'build_ms': float}}}.
+        """
+        with self._lock:
+            return {
+                "engines": len(self._entries),
+                "memory": sum(entry.size for entry in self._entries.values()),
+                "hits": self._hits,
+                "misses": self._misses,
+                "build_errors": self._build_errors,
+                "evictions": self._evictions,
+                "evicted_memory": self._evicted_memory,
+                "build_latency": self._build_latency.to_dict(None),
+                "tenants": {
+                    tenant: {"memory": entry.size, "build_ms": entry.build_duration * 1e3}
+                    for tenant, entry in self._entries.items()
+                },
+            }
+
+    def _get_entry(self, tenant: str) -> _Entry | None:
+        """(Protected)
+        Return the entry of a tenant and mark it as recently used (the lock must be held).
+        """
+        entry: _Entry | None = self._entries.get(tenant)
+
+        if entry is not None:
+            self._entries.move_to_end(tenant)
+            self._hits += 1
+
+        return entry
+
+    def _build(self, tenant: str, intern_pool: InternPool) -> _Entry:
+        """(Protected)
+        Build and prepare the rules engine of a tenant.
+
+        Args:
+            tenant: Tenant key.
+            intern_pool: Pool of interned values shared by the engines.
+
+        Returns:
+            The registry entry of the new engine.
+
+        Raises:
+            KeyError: Unknown tenant.
+        """
+        source: ConfigSource = self._get_config_source(tenant)
+
+        start: float = time.perf_counter()
+
+        if isinstance(source, dict):
+            engine: RulesEngine = RulesEngine(config_dict=source, intern_pool=intern_pool)
+        else:
+            engine = RulesEngine(config_path=source, intern_pool=intern_pool)
+
+        if self._prepare is not None:
+            self._prepare(engine)
+
+        build_duration: float = time.perf_counter() - start
+        logger.info(f"Rules engine of tenant '{tenant}' built in {build_duration:.3f}s.")
+
+        return _Entry(engine, estimate_engine_size(engine), build_duration)
+
+    def _get_config_source(self, tenant: str) -> ConfigSource:
+        """(Protected)
+        Return the configuration of a tenant.
+
+        Raises:
+            KeyError: Unknown tenant.
+        """
+        if callable(self._config_source):
+            return self._config_source(tenant)
+
+        base_path: Path = Path(self._config_source).resolve()
+        path: Path = (base_path / tenant).resolve()
+
+        # The tenant key must not escape the base directory (e.g., '../')
+        if path.parent != base_path or not path.is_dir():
+            msg: str = f"Unknown tenant '{tenant}': no configuration directory in {base_path}"
+            logger.error(msg)
+            raise KeyError(msg)
+
+        return path
+
+    def _evict_over_budget(self) -> None:
+        """(Protected)
+        Evict the least recently used engines until the budget is met (the lock must be held).
+
+        The most recently used engine is always kept.
+        """
+        while len(self._entries) > 1 and (
+            (self.max_engines is not None and len(self._entries) > self.max_engines)
+            or (self.max_memory is not None and sum(entry.size for entry in self._entries.values()) > self.max_memory)
+        ):
+            tenant, entry = self._entries.popitem(last=False)
+            self._evictions += 1
+            self._evicted_memory += entry.size
+            logger.info(f"Rules engine of tenant '{tenant}' evicted ({entry.size} bytes).")
@@ -0,0 +1,220 @@
+"""Hot reload of a rules engine configuration.
+
+Class: ReloadableRulesEngine
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from arta._engine import RulesEngine
+from arta.config import get_config_files
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class ReloadableRulesEngine:
+    """Rules engine rebuilt when its configuration directory changes (YAML files are polled, no inotify).
+
+    A new version is built and validated aside, then atomically swapped with the active engine:
+    running calls of apply_rules() finish on the previous version. If the build fails, the active engine is kept
+    and the build is retried at the next check.
+    New versions are built incrementally from the active engine (see RulesEngine 'previous').
+
+    Attributes:
+        config_path: Path to the directory containing the YAML files.
+        poll_interval: Delay between two checks of the configuration files (seconds).
+        version: Hash of the active configuration (files names and contents).
+        build_duration: Build duration of the active engine (seconds).
+        reload_count: Number of successful reloads.
+        last_error: Exception raised by the last failed reload (None if the last reload succeeded).
+    """
+
+    def __init__(
+        self,
+        config_path: Path | str,
+        *,
+        poll_interval: float = 5.0,
+        prepare: Callable[[RulesEngine], None] | None = None,
+        start: bool = False,
+        incremental: bool = True,
+    ) -> None:
+        """Build the first version of the rules engine.
+
+        Args:
+            config_path: Path to the directory containing the YAML files.
+            poll_interval: Delay between two checks of the configuration files (seconds).
+            prepare: Function called with each new engine before activating it (e.g., adding hooks,
+                enabling statistics or checking results on reference inputs). If it raises an exception,
+                the new version is rejected.
+            start: If True, the background polling is started.
+            incremental: If True, unchanged rules, conditions and source modules of the active engine are reused
+                by the new versions (else each version is a full build).
+
+        Raises:
+            Same exceptions as RulesEngine.
+        """
+        self.config_path = Path(config_path)
+        self.poll_interval = poll_interval
+        self._prepare = prepare
+        self._incremental = incremental
+        self._reload_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self.reload_count: int = 0
+        self.last_error: Exception | None = None
+
+        # First build (errors are raised)
+        self._fingerprint: tuple[tuple[str, int, int], ...] = self._get_fingerprint()
+        self.version: str = self._get_version()
+        self._engine, self.build_duration = self._build(previous=None)
+
+        if start:
+            self.start()
+
+    @property
+    def engine(self) -> RulesEngine:
+        """The active rules engine."""
+        return self._engine
+
+    def apply_rules(self, input_data: Any, **kwargs: Any) -> dict[str, Any]:
+        """Apply the rules of the active engine (see RulesEngine.apply_rules())."""
+        return self._engine.apply_rules(input_data, **kwargs)
+
+    def reload(self, force: bool = False) -> bool:
+        """Rebuild and activate the rules engine if its configuration has changed.
+
+        Args:
+            force: If True, the engine is rebuilt even if the configuration has not changed.
+
+        Returns:
+            True if a new version has been activated.
+
+        Raises:
+            Same exceptions as RulesEngine (or the prepare function): the active engine is kept.
+        """
+        with self._reload_lock:
+            fingerprint: tuple[tuple[str, int, int], ...] = self._get_fingerprint()
+
+            if not force and fingerprint == self._fingerprint:
+                return False
+
+            version: str = self._get_version()
+
+            if not force and version == self.version:
+                # Files touched but not modified
+                self._fingerprint = fingerprint
+                return False
+
+            try:
+                engine, build_duration = self._build(previous=self._engine if self._incremental else None)
+            except Exception as error:
+                self.last_error = error
+                logger.error(f"Reload of the configuration version '{version}' failed: {error!r}")
+                raise
+
+            # Atomic swap: running calls keep the previous engine
+            # (the fingerprint is only updated now: a failed build is retried at the next check)
+            self._fingerprint = fingerprint
+            self._engine = engine
+            self.version = version
+            self.build_duration = build_duration
+            self.reload_count += 1
+            self.last_error = None
+
+        build_info: dict[str, Any] = engine.build_info()
+        logger.info(
+            f"Rules engine reloaded with configuration version '{version}' in {build_duration:.3f}s "
+            f"({build_info['reused_rules']} rules reused, {build_info['built_rules']} built)."
+        )
+        return True
+
+    def start(self) -> None:
+        """Start polling the configuration files in a background thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._poll, name="arta-reloader", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background polling."""
+        self._stop_event.set()
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> ReloadableRulesEngine:
+        """Start the background polling."""
+        self.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Stop the background polling."""
+        self.stop()
+
+    def _poll(self) -> None:
+        """(Protected)
+        Check the configuration files until stopped (failed reloads are logged, the active engine is kept).
+        """
+        while not self._stop_event.wait(self.poll_interval):
+            try:
+                self.reload()
+            except Exception:  # noqa: S112
+                continue
+
+    def _build(self, previous: RulesEngine | None) -> tuple[RulesEngine, float]:
+        """(Protected)
+        Build and prepare a new rules engine.
+
+        Args:
+            previous: Active engine whose unchanged objects are reused (None: full build).
+
+        Returns:
+            The new engine and its build duration (seconds).
+        """
+        start: float = time.perf_counter()
+        engine: RulesEngine = RulesEngine(config_path=self.config_path, previous=previous)
+
+        if self._prepare is not None:
+            self._prepare(engine)
+
+        return engine, time.perf_counter() - start
+
+    def _get_fingerprint(self) -> tuple[tuple[str, int, int], ...]:
+        """(Protected)
+        Return the names, modification times and sizes of the configuration files (cheap change detection).
+        """
+        fingerprint: list[tuple[str, int, int]] = []
+
+        for path in get_config_files(self.config_path):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                # Deleted meanwhile
+                continue
+            fingerprint.append((str(path), stat.st_mtime_ns, stat.st_size))
+
+        return tuple(fingerprint)
+
+    def _get_version(self) -> str:
+        """(Protected)
+        Return the hash of the configuration (relative names and contents of the files).
+        """
+        digest = hashlib.sha256()
+
+        for path in get_config_files(self.config_path):
+            digest.update(str(path.relative_to(self.config_path)).encode())
+            digest.update(b"\0")
+            digest.update(path.read_bytes())
+            digest.update(b"\0")
+
+        return digest.hexdigest()[:16]
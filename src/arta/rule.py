@@ -8,19 +8,46 @@ from __future__ import annotations
 import inspect
 import logging
 import re
-from typing import Any, Callable
+import sys
+import time
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Callable, NamedTuple
 from warnings import warn
 
-from arta.condition import BaseCondition, StandardCondition
+from arta.cache import FunctionCache, InternPool
+from arta.condition import BaseCondition, SimpleCondition, StandardCondition
+from arta.context import EvaluationContext
+from arta.diagnostics import DEPRECATED_INPUT_DATA, IGNORED_CONDITION, EventCounter
 from arta.exceptions import ConditionExecutionError, RuleExecutionError
+from arta.expression import BOOLEAN_EXPRESSION_NODES, compile_expression
 from arta.utils import (
     ParsingErrorStrategy,
+    copy_static_parameters,
+    is_immutable,
     parse_dynamic_parameter,
+    split_static_parameters,
 )
 
 logger: logging.Logger = logging.getLogger(__name__)
 
 
+class ExpressionPlan(NamedTuple):
+    """Conditions of a condition expression and its compiled boolean function.
+
+    Attributes:
+        conditions: Tuple of (condition id, condition instance, compiled id pattern).
+        evaluate: Function of the condition results (same order as the conditions).
+        key: Key of the expression results shared during a request: (expression, condition instances).
+            The same expression can be made of different instances (e.g., 'USER_CONDITION' of each rule
+            of a rules dictionary).
+    """
+
+    conditions: tuple[tuple[str, BaseCondition, re.Pattern[str]], ...]
+    evaluate: Callable[..., Any]
+    key: tuple[Any, ...]
+
+
 class Rule:
     """A rule is the combination of some conditions and one action.
 
@@ -33,8 +60,29 @@ class Rule:
                                     (k: condition conf. key, v: condition class object).
         action: Function to perform when the conditions are valid (action function).
         action_parameters: Parameters of the action function.
+        action_cache: Memoization cache of the action function (only if pure).
     """
 
+    __slots__ = (
+        "_set_id",
+        "_group_id",
+        "_rule_id",
+        "_action",
+        "_action_parameters",
+        "_action_cache",
+        "_static_action_parameters",
+        "_mutable_action_keys",
+        "_dynamic_action_parameters",
+        "_action_accepts_kwargs",
+        "_action_takes_input_data",
+        "_condition_exprs",
+        "_condition_factory_mapping",
+        "_condition_instances",
+        "_request_cacheable_exprs",
+        "_expression_plans",
+        "_input_data_warnings",
+    )
+
     def __init__(
         self,
         set_id: str,
@@ -45,36 +93,109 @@ class Rule:
         action: Callable,
         std_condition_instances: dict[str, StandardCondition],
         action_parameters: dict[str, Any] | None = None,
+        action_cache: FunctionCache | None = None,
+        intern_pool: InternPool | None = None,
+        condition_registry: dict[tuple[type[BaseCondition], str], BaseCondition] | None = None,
+        datasets: Mapping[str, Any] | None = None,
+        windows: Mapping[str, Any] | None = None,
     ) -> None:
         """Initialize attributes.
 
         Args:
             std_condition_instances: Dictionary containing the BaseCondition instances required by the Rule
                 (k: condition_id, v: StandardCondition instance).
+            action_cache: Memoization cache of the action function (only if pure).
+            intern_pool: Pool used for sharing equal parameters and expressions between rules.
+            condition_registry: Custom and simple condition instances shared between rules
+                (k: (condition class, condition id), v: condition instance).
+            datasets: Reference datasets of the simple conditions (k: name, v: ReferenceDataset).
+            windows: Sliding windows of the simple conditions (k: name, v: SlidingWindow).
         """
+        pool: InternPool = intern_pool if intern_pool is not None else InternPool()
+
         # IDs
-        self._set_id = set_id
-        self._group_id = group_id
-        self._rule_id = rule_id
+        self._set_id = pool.intern(set_id)
+        self._group_id = pool.intern(group_id)
+        self._rule_id = pool.intern(rule_id)
 
         # Action
         self._action = action
-        self._action_parameters = action_parameters or {}
+        # Read-only mappings, shared by the rules with the same values (unless they contain mutable values)
+        self._action_parameters: Mapping[str, Any] = pool.intern(MappingProxyType(dict(action_parameters or {})))
+        self._action_cache = action_cache
+
+        # Static action parameters are resolved once, only dynamic ones are parsed on each activation
+        static_action_parameters, dynamic_action_parameters = split_static_parameters(self._action_parameters)
+        self._static_action_parameters: Mapping[str, Any] = pool.intern(MappingProxyType(static_action_parameters))
+        self._dynamic_action_parameters: Mapping[str, Any] = pool.intern(MappingProxyType(dynamic_action_parameters))
+        # Mutable static values are copied on each activation
+        self._mutable_action_keys: tuple[str, ...] = tuple(
+            key for key, value in self._static_action_parameters.items() if not is_immutable(value)
+        )
+
+        # Value sharing (**kwargs) and deprecated 'input_data' parameter detection
+        arg_spec: inspect.FullArgSpec = inspect.getfullargspec(action)
+        self._action_accepts_kwargs: bool = arg_spec.varkw is not None
+        self._action_takes_input_data: bool = "input_data" in arg_spec.args or "input_data" in arg_spec.kwonlyargs
+        self._input_data_warnings: EventCounter | None = EventCounter() if self._action_takes_input_data else None
 
         # Condition expressions
-        self._condition_exprs = condition_exprs
+        self._condition_exprs: Mapping[str, str | None] = pool.intern(
+            MappingProxyType(
+                {
+                    pool.intern(key): pool.intern(expr) if expr is not None else None
+                    for key, expr in condition_exprs.items()
+                }
+            )
+        )
 
         # Factory mapping
         self._condition_factory_mapping = condition_factory_mapping
 
         # Condition instances (k: condition id (not conf key), v: instances)
-        self._condition_instances: dict[str, BaseCondition] = self._instantiate_conditions(std_condition_instances)
+        self._condition_instances: Mapping[str, BaseCondition] = pool.intern(
+            MappingProxyType(
+                self._instantiate_conditions(
+                    std_condition_instances,
+                    condition_registry if condition_registry is not None else {},
+                    datasets,
+                    windows,
+                )
+            )
+        )
+
+        # Condition expressions whose result can be shared by all the rules during one request
+        self._request_cacheable_exprs: frozenset[str] = pool.intern(
+            frozenset(
+                expr
+                for key, expr in self._condition_exprs.items()
+                if expr is not None
+                and all(
+                    self._condition_instances[cond_id].is_request_cacheable()
+                    for cond_id in self._condition_factory_mapping[key].extract_condition_ids_from_expression(expr)
+                )
+            )
+        )
+
+        # Conditions and compiled id patterns of each expression (no regex parsing at evaluation time)
+        self._expression_plans: Mapping[tuple[type[BaseCondition], str], ExpressionPlan] = pool.intern(
+            MappingProxyType(
+                {
+                    (self._condition_factory_mapping[key], expr): self._build_expression_plan(
+                        self._condition_factory_mapping[key], expr
+                    )
+                    for key, expr in self._condition_exprs.items()
+                    if expr is not None
+                }
+            )
+        )
 
     def apply(
         self,
         input_data: dict[str, Any],
         *,
         parsing_error_strategy: ParsingErrorStrategy,
+        context: EvaluationContext | None = None,
         **kwargs: Any,
     ) -> tuple[Any | None, dict[str, Any]]:
         """Apply the rule on the input data, return action output (optional).
@@ -82,6 +203,7 @@ class Rule:
         Args:
             input_data: Request or input data to apply rules on.
             parsing_error_strategy: Parsing error strategy.
+            context: Evaluation state of the current request (condition results shared between rules).
             **kwargs: For user extra arguments.
 
         Returns:
@@ -92,33 +214,118 @@ class Rule:
         """
         # If rule conditions are verified, the action is executed w/ the parameters' value
         is_conditions_ok: bool
-        rule_results: dict[str, Any]
+        rule_results: dict[str, Any] | None
 
         is_conditions_ok, rule_results = self._check_conditions(
-            input_data, parsing_error_strategy=parsing_error_strategy, **kwargs
+            input_data, parsing_error_strategy=parsing_error_strategy, context=context, **kwargs
         )
 
-        if is_conditions_ok:
+        if is_conditions_ok and rule_results is not None:
             logger.debug("Conditions are verified.")
-            try:
-                # Parse dynamic parameters
-                parameters: dict[str, Any] = {}
-                for key, value in self._action_parameters.items():
-                    parameters[key] = parse_dynamic_parameter(
-                        parameter=value, input_data=input_data, parsing_error_strategy=parsing_error_strategy
-                    )
 
-                # Track the rule id
-                rule_results["activated_rule"] = self._rule_id
+            # Track the rule id
+            rule_results["activated_rule"] = self._rule_id
+
+            # Run action
+            rule_results["action_result"] = self._execute_action(
+                input_data, parsing_error_strategy=parsing_error_strategy, context=context, **kwargs
+            )
+
+            return rule_results["action_result"], rule_results
+
+        else:
+            logger.debug("Conditions are not verified.")
+            return None, {}
+
+    def apply_lean(
+        self,
+        input_data: dict[str, Any],
+        *,
+        parsing_error_strategy: ParsingErrorStrategy,
+        context: EvaluationContext | None = None,
+        **kwargs: Any,
+    ) -> tuple[bool, Any | None]:
+        """Apply the rule on the input data without building any result details (non verbose execution path).
+
+        Args:
+            input_data: Request or input data to apply rules on.
+            parsing_error_strategy: Parsing error strategy.
+            context: Evaluation state of the current request (condition results shared between rules).
+            **kwargs: For user extra arguments.
+
+        Returns:
+            A tuple as: (True if the rule is activated, action result).
+
+        Raises:
+            RuleExecutionError: Error during the rule execution.
+        """
+        is_conditions_ok, _ = self._check_conditions(
+            input_data, parsing_error_strategy=parsing_error_strategy, context=context, verbose=False, **kwargs
+        )
 
-                # Pass input_data for value sharing if action function can accept it
-                arg_spec: inspect.FullArgSpec = inspect.getfullargspec(self._action)
-                if arg_spec.varkw is not None:
-                    parameters["input_data"] = input_data
-                    parameters.update(kwargs)
+        if not is_conditions_ok:
+            logger.debug("Conditions are not verified.")
+            return False, None
 
-                # Backward compatibility case (now deprecated)
-                if "input_data" in arg_spec.args or "input_data" in arg_spec.kwonlyargs:
+        logger.debug("Conditions are verified.")
+        return True, self._execute_action(
+            input_data, parsing_error_strategy=parsing_error_strategy, context=context, **kwargs
+        )
+
+    def _execute_action(
+        self,
+        input_data: dict[str, Any],
+        *,
+        parsing_error_strategy: ParsingErrorStrategy,
+        context: EvaluationContext | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """(Protected)
+        Run the action function with its parameters' value.
+
+        Args:
+            input_data: Request or input data to apply rules on.
+            parsing_error_strategy: Parsing error strategy.
+            context: Evaluation state of the current request (execution statistics).
+            **kwargs: For user extra arguments.
+
+        Returns:
+            The action result.
+
+        Raises:
+            RuleExecutionError: Error during the action execution.
+        """
+        recorder: EvaluationContext | None = context if context is not None and context.instrumented else None
+        start_ns: int = time.perf_counter_ns() if recorder is not None else 0
+
+        try:
+            # Static parameters are already resolved, parse dynamic ones
+            parameters: dict[str, Any] = copy_static_parameters(
+                self._static_action_parameters, self._mutable_action_keys
+            )
+            for key, value in self._dynamic_action_parameters.items():
+                parameters[key] = parse_dynamic_parameter(
+                    parameter=value, input_data=input_data, parsing_error_strategy=parsing_error_strategy
+                )
+
+            result: Any
+
+            if self._action_cache is not None:
+                # Pure action function: memoized, no value sharing
+                result = self._action_cache(parameters)
+                if recorder is not None:
+                    self._record_action(recorder, start_ns)
+                return result
+
+            # Pass input_data for value sharing if action function can accept it
+            if self._action_accepts_kwargs:
+                parameters["input_data"] = input_data
+                parameters.update(kwargs)
+
+            # Backward compatibility case (now deprecated)
+            if self._input_data_warnings is not None:
+                # Warn once per rule, then only count
+                if self._input_data_warnings.increment():
                     warn(
                         (
                             "Using 'input_data' directly as an action function parameter is deprecated. "
@@ -126,49 +333,148 @@ class Rule:
                             "at https://maif.github.io/arta/value_sharing/#between-conditions-and-actions"
                         ),
                         DeprecationWarning,
-                        stacklevel=2,
+                        stacklevel=3,
                     )
-                    parameters["input_data"] = input_data
-                    parameters.update(kwargs)
+                parameters["input_data"] = input_data
+                parameters.update(kwargs)
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Action '%s' is triggered.", self._action.__name__)
+
+            # Run action
+            result = self._action(**parameters)
+            if recorder is not None:
+                self._record_action(recorder, start_ns)
+            return result
+        except Exception as error:
+            msg: str = f"Error while executing rule '{self._rule_id}': {str(error)}"
+            logger.error(msg)
+            raise RuleExecutionError(msg) from error
+
+    def _record_action(self, recorder: EvaluationContext, start_ns: int) -> None:
+        """(Protected)
+        Record the execution of the action (statistics and hooks).
 
-                logger.debug(f"Action '{self._action.__name__}' is triggered.")
+        Args:
+            recorder: Instrumented evaluation context of the request.
+            start_ns: Start time of the execution (ns).
+        """
+        recorder.record_action(
+            self._set_id,
+            self._group_id,
+            self._rule_id,
+            self._action.__name__,
+            start_ns,
+            time.perf_counter_ns() - start_ns,
+        )
 
-                # Run action
-                rule_results["action_result"] = self._action(**parameters)
+    def get_event_counters(self) -> list[tuple[str, str, EventCounter]]:
+        """Return the counters of the diagnostic events of the rule and of its simple conditions.
 
-                return rule_results["action_result"], rule_results
-            except Exception as error:
-                msg: str = f"Error while executing rule '{self._rule_id}': {str(error)}"
-                logger.error(msg)
-                raise RuleExecutionError(msg) from error
+        Returns:
+            A list of (event kind, rule id or condition id, counter).
+        """
+        counters: list[tuple[str, str, EventCounter]] = []
 
-        else:
-            logger.debug("Conditions are not verified.")
-            return None, {}
+        if self._input_data_warnings is not None:
+            counters.append((DEPRECATED_INPUT_DATA, self._rule_id, self._input_data_warnings))
+
+        for cond_id, condition in self._condition_instances.items():
+            if isinstance(condition, SimpleCondition):
+                counters.append((IGNORED_CONDITION, cond_id, condition.ignored_events))
+
+        return counters
+
+    def uses(self, action: Callable, std_condition_instances: dict[str, StandardCondition]) -> bool:
+        """Return True if the rule uses this action function and these standard condition instances.
+
+        Used by the incremental rebuild: an unchanged rule can only be reused if the objects it refers to are the same.
+
+        Args:
+            action: Action function.
+            std_condition_instances: Standard condition instances of the new engine (k: condition id).
+
+        Returns:
+            True if the rule refers to the same objects.
+        """
+        if self._action is not action:
+            return False
+
+        return all(
+            std_condition_instances.get(cond_id) is condition
+            for cond_id, condition in self._condition_instances.items()
+            if isinstance(condition, StandardCondition)
+        )
+
+    def is_never_activated(self) -> bool:
+        """Return True if the rule conditions are known to be False at build time (constant folding).
+
+        Only the leading condition expressions made exclusively of folded conditions are taken into account,
+        so that pruning such a rule never hides an error raised by another condition at evaluation time.
+
+        Returns:
+            True if the rule can be pruned.
+        """
+        for cond_conf_key, expr in self._condition_exprs.items():
+            if expr is None:
+                continue
+
+            condition_class: type[BaseCondition] = self._condition_factory_mapping[cond_conf_key]
+            plan: ExpressionPlan = self._expression_plans[(condition_class, expr)]
+            folded_results: list[bool] = []
+
+            for _, condition, _ in plan.conditions:
+                folded_result: bool | None = getattr(condition, "folded_result", None)
+
+                if folded_result is None:
+                    # Not known at build time
+                    return False
+
+                folded_results.append(folded_result)
+
+            try:
+                if not plan.evaluate(*folded_results):
+                    return True
+            except Exception:
+                # Errors are raised at evaluation time
+                return False
+
+        return False
 
     def _check_conditions(
-        self, input_data: dict[str, Any], parsing_error_strategy: ParsingErrorStrategy, **kwargs: Any
-    ) -> tuple[bool, dict[str, Any]]:
+        self,
+        input_data: dict[str, Any],
+        parsing_error_strategy: ParsingErrorStrategy,
+        context: EvaluationContext | None = None,
+        verbose: bool = True,
+        **kwargs: Any,
+    ) -> tuple[bool, dict[str, Any] | None]:
         """(Protected)
         Return True if all conditions are verified.
 
         Args:
             input_data: Request or input data to apply rules on.
             parsing_error_strategy: Error handling strategy for parameter's parsing.
+            context: Evaluation state of the current request (condition results shared between rules).
+            verbose: If False, the condition results dictionary is not built.
             **kwargs: For user extra arguments.
 
         Returns:
-            A tuple as: (True if all conditions are verified, otherwise False, condition results dictionary).
+            A tuple as: (True if all conditions are verified, otherwise False, condition results dictionary
+            or None if not verbose).
         """
         # Var init.
         all_conditions_res: bool = True
-        condition_results: dict[str, Any] = {"rule_group": self._group_id, "verified_conditions": {}}
+        condition_results: dict[str, Any] | None = (
+            {"rule_group": self._group_id, "verified_conditions": {}} if verbose else None
+        )
 
         # Loop among condition expressions
         for cond_conf_key, expr in self._condition_exprs.items():
             condition_class: type[BaseCondition] = self._condition_factory_mapping[cond_conf_key]
 
-            logger.debug(f"Verifying '{cond_conf_key}': {expr}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Verifying '%s': %s", cond_conf_key, expr)
 
             # Evaluate the condition expression
             try:
@@ -177,6 +483,8 @@ class Rule:
                     condition_class=condition_class,
                     condition_expr=expr,
                     parsing_error_strategy=parsing_error_strategy,
+                    context=context,
+                    verbose=verbose,
                     **kwargs,
                 )
             except NameError as e:
@@ -188,9 +496,10 @@ class Rule:
             all_conditions_res = all_conditions_res and condition_res
 
             # Store condition results
-            condition_results["verified_conditions"].update(
-                {cond_conf_key: {"expression": expr, "values": unitary_res}}
-            )
+            if condition_results is not None:
+                condition_results["verified_conditions"].update(
+                    {cond_conf_key: {"expression": expr, "values": unitary_res}}
+                )
 
             if not all_conditions_res:
                 # If False, no need to go further
@@ -204,21 +513,28 @@ class Rule:
         condition_class: type[BaseCondition],
         parsing_error_strategy: ParsingErrorStrategy,
         condition_expr: str | None = None,
+        context: EvaluationContext | None = None,
+        verbose: bool = True,
         **kwargs: Any,
     ) -> tuple[bool, dict[str, bool]]:
         """(Protected)
         Evaluate the condition expr (a boolean expression) and
         return the result (a boolean).
 
+        When an evaluation context is given, each distinct condition and condition expression
+        is evaluated once per request (common subexpression elimination).
+
         Args:
             input_data: Request or input data.
             condition_class: Class object of the analyzed condition (given by its conf. key).
             parsing_error_strategy: Error handling strategy for parameter's parsing.
             condition_expr: A boolean expression (string).
+            context: Evaluation state of the current request (condition results shared between rules).
+            verbose: If False, unitary results are not stored.
             **kwargs: For user extra arguments.
 
         Returns:
-            A tuple as: (final result, unitary results (dictionary)).
+            A tuple as: (final result, unitary results (dictionary, empty if not verbose)).
 
         Raises:
             ConditionExecutionError: Error during condition execution.
@@ -230,39 +546,134 @@ class Rule:
         if condition_expr is None:
             return True, unitary_results
 
-        # The final boolean expression is formed by replacing condition IDs by their evaluated boolean values
-        bool_expr: str = condition_expr
+        # Conditions of the expression and compiled boolean function (built once)
+        plan: ExpressionPlan | None = self._expression_plans.get((condition_class, condition_expr))
+        if plan is None:
+            plan = self._build_expression_plan(condition_class, condition_expr)
+
+        # Already evaluated by another rule during this request (same expression of the same conditions)?
+        expression_cache: dict[tuple[Any, ...], tuple[bool, dict[str, bool]]] | None = (
+            context.expression_results
+            if context is not None and condition_expr in self._request_cacheable_exprs
+            else None
+        )
+        if expression_cache is not None and plan.key in expression_cache:
+            expr_result, expr_unitary_results = expression_cache[plan.key]
+            return expr_result, dict(expr_unitary_results) if verbose else expr_unitary_results
 
-        # Extract condition ids from the expression
-        condition_ids: set[str] = condition_class.extract_condition_ids_from_expression(condition_expr)
+        # Execution statistics and hooks of the request (if any)
+        recorder: EvaluationContext | None = context if context is not None and context.instrumented else None
+
+        # Results of the conditions (arguments of the compiled expression)
+        results: list[bool] = []
 
         # Loop among the conditions of the expression
         # Verify the unitary condition
-        for cond_id in condition_ids:
-            # Retrieve condition instance
-            condition: BaseCondition = self._condition_instances[cond_id]
+        for cond_id, condition, _ in plan.conditions:
+            condition_cache: dict[Any, bool] | None = (
+                context.condition_results if context is not None and condition.is_request_cacheable() else None
+            )
 
-            # Check unitary condition
-            try:
-                bool_var: bool = condition.verify(input_data, parsing_error_strategy=parsing_error_strategy, **kwargs)
+            # Check unitary condition (once per request if possible)
+            if condition_cache is not None and condition in condition_cache:
+                bool_var: bool = condition_cache[condition]
+            else:
+                start_ns: int = time.perf_counter_ns() if recorder is not None else 0
+
+                try:
+                    if context is not None and isinstance(condition, SimpleCondition):
+                        # Extended data paths (lists) shared by the simple conditions of the request
+                        bool_var = condition.verify(
+                            input_data,
+                            parsing_error_strategy=parsing_error_strategy,
+                            path_values=context.path_values,
+                            **kwargs,
+                        )
+                    else:
+                        bool_var = condition.verify(input_data, parsing_error_strategy=parsing_error_strategy, **kwargs)
+                except Exception as error:
+                    msg: str = f"Error while executing condition '{cond_id}': {str(error)}"
+                    logger.error(msg)
+                    raise ConditionExecutionError(msg) from error
+
+                if recorder is not None:
+                    recorder.record_condition(
+                        self._set_id,
+                        self._group_id,
+                        self._rule_id,
+                        cond_id,
+                        bool_var,
+                        start_ns,
+                        time.perf_counter_ns() - start_ns,
+                    )
+
+                if condition_cache is not None:
+                    condition_cache[condition] = bool_var
+                elif context is not None:
+                    # Value sharing: input data may have changed, stored results can't be shared anymore
+                    context.invalidate()
 
-                # Store unitary result
+            # Store unitary result
+            if verbose:
                 unitary_results[cond_id] = bool_var
-            except Exception as error:
-                msg: str = f"Error while executing condition '{cond_id}': {str(error)}"
-                logger.error(msg)
-                raise ConditionExecutionError(msg) from error
 
-            # Replace the result in the boolean expression
-            sanit_cond_id: str = condition.get_sanitized_id()
-            bool_expr = re.sub(rf"{sanit_cond_id}", str(bool_var), bool_expr)
+            results.append(bool_var)
+
+        # Evaluate the final boolean expression = final result
+        result: bool = plan.evaluate(*results)
+
+        if expression_cache is not None:
+            expression_cache[plan.key] = (result, dict(unitary_results) if verbose else unitary_results)
+
+        return result, unitary_results
+
+    def _build_expression_plan(self, condition_class: type[BaseCondition], condition_expr: str) -> ExpressionPlan:
+        """(Protected)
+        Return the conditions of an expression with their compiled (sanitized) id patterns,
+        and the expression compiled into a boolean function of their results.
+
+        Longest ids come first, so that an id is never replaced inside another one (e.g., simple conditions
+        'input.age>=1' and 'input.age>=10').
 
-        # Evaluate the final boolean expressions = final result
-        return eval(bool_expr), unitary_results  # noqa
+        Args:
+            condition_class: Class object of the conditions (given by the conf. key of the expression).
+            condition_expr: A boolean expression (string).
+
+        Returns:
+            The expression plan.
+
+        Raises:
+            UnsupportedExpressionError: The expression is not a boolean expression of its conditions.
+        """
+        condition_ids: list[str] = sorted(
+            condition_class.extract_condition_ids_from_expression(condition_expr),
+            key=lambda cond_id: (-len(cond_id), cond_id),
+        )
+        conditions: list[tuple[str, BaseCondition, re.Pattern[str]]] = []
+        bool_expr: str = condition_expr
+
+        for idx, cond_id in enumerate(condition_ids):
+            condition: BaseCondition = self._condition_instances[cond_id]
+            id_pattern: re.Pattern[str] = re.compile(condition.get_sanitized_id())
+            conditions.append((cond_id, condition, id_pattern))
+
+            # Condition ids are replaced by variables (e.g., 'CONDITION_1 and not CONDITION_2' -> 'c_0 and not c_1')
+            bool_expr = id_pattern.sub(f"c_{idx}", bool_expr)
+
+        evaluate: Callable[..., Any] = compile_expression(
+            bool_expr, tuple(f"c_{idx}" for idx in range(len(conditions))), BOOLEAN_EXPRESSION_NODES, condition_expr
+        )
+
+        return ExpressionPlan(
+            tuple(conditions), evaluate, (condition_expr, *(condition for _, condition, _ in conditions))
+        )
 
     def _instantiate_conditions(
         self,
         std_conditions: dict[str, StandardCondition],
+        condition_registry: dict[tuple[type[BaseCondition], str], BaseCondition],
+        datasets: Mapping[str, Any] | None = None,
+        windows: Mapping[str, Any] | None = None,
     ) -> dict[str, BaseCondition]:
         """Parse condition expressions and build corresponding instances.
 
@@ -270,9 +681,15 @@ class Rule:
         - Input : "not(CONDITION_A) and CONDITION_B"
         - Output : {"CONDITION_A": condition_A_instance, "CONDITION_B": condition_B_instance}
 
+        Custom and simple condition instances are shared through the registry (same class and same id).
+
         Args:
             std_conditions: A dictionary containing the StandardCondition instances
                 (k: cond. id, v: StandardCondition instance)
+            condition_registry: Custom and simple condition instances already instantiated
+                (k: (condition class, condition id), v: condition instance).
+            datasets: Reference datasets of the simple conditions (k: name, v: ReferenceDataset).
+            windows: Sliding windows of the simple conditions (k: name, v: SlidingWindow).
 
         Returns:
             Condition instances which are in the condition expressions (k: condition id, v: BaseCondition instance).
@@ -292,12 +709,29 @@ class Rule:
             # Is a custom condition or a simple condition?
             if self._condition_factory_mapping is not None and conf_key != "condition":
                 # Yes
+                condition_class: type[BaseCondition] = self._condition_factory_mapping[conf_key]
+
                 for cond_id in condition_ids:
-                    # Instanciate the custom (unknown) condition object
-                    cond_instances[cond_id] = self._condition_factory_mapping[conf_key](
-                        condition_id=cond_id,
-                        description=self._condition_factory_mapping[conf_key].CONDITION_DATA_LABEL,
-                    )
+                    registry_key: tuple[type[BaseCondition], str] = (condition_class, cond_id)
+
+                    if registry_key not in condition_registry:
+                        # Instanciate the custom (unknown) condition object
+                        if (datasets or windows) and issubclass(condition_class, SimpleCondition):
+                            # Simple conditions may search the reference datasets (e.g., 'input.id in @ids')
+                            # and aggregate the sliding windows (e.g., 'count(@claims_10m)>5')
+                            condition_registry[registry_key] = condition_class(
+                                condition_id=sys.intern(cond_id),
+                                description=condition_class.CONDITION_DATA_LABEL,
+                                datasets=datasets,
+                                windows=windows,
+                            )
+                        else:
+                            condition_registry[registry_key] = condition_class(
+                                condition_id=sys.intern(cond_id),
+                                description=condition_class.CONDITION_DATA_LABEL,
+                            )
+
+                    cond_instances[cond_id] = condition_registry[registry_key]
             else:
                 # Should be a standard condition
                 for cond_id in condition_ids:
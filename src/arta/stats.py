@@ -0,0 +1,195 @@
+"""Execution statistics of the rules engine (opt-in).
+
+Classes: LatencyStats, StatsCollector
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+from typing import Any
+
+# Kinds of records
+RULE_RECORD: str = "rule"
+CONDITION_RECORD: str = "condition"
+ACTION_RECORD: str = "action"
+
+
+class LatencyStats:
+    """Counters and latency distribution of one rule, condition or action.
+
+    Percentiles are computed from a bounded reservoir of latency samples (reservoir sampling).
+
+    Attributes:
+        count: Number of evaluations.
+        positive_count: Number of evaluations with a True result (conditions) or an activation (rules).
+        total_ns: Cumulative latency (nanoseconds).
+        max_ns: Maximum latency (nanoseconds).
+    """
+
+    __slots__ = ("count", "positive_count", "total_ns", "max_ns", "_samples", "_reservoir_size", "_random")
+
+    def __init__(self, reservoir_size: int, rand: random.Random) -> None:
+        """Initialize attributes.
+
+        Args:
+            reservoir_size: Maximum number of latency samples kept for the percentiles.
+            rand: Random generator used by the reservoir sampling.
+        """
+        self.count: int = 0
+        self.positive_count: int = 0
+        self.total_ns: int = 0
+        self.max_ns: int = 0
+        self._samples: list[int] = []
+        self._reservoir_size = reservoir_size
+        self._random = rand
+
+    def add(self, duration_ns: int, is_positive: bool) -> None:
+        """Add an evaluation.
+
+        Args:
+            duration_ns: Latency of the evaluation (nanoseconds).
+            is_positive: True result (conditions) or activation (rules).
+        """
+        self.count += 1
+        self.positive_count += is_positive
+        self.total_ns += duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+
+        if len(self._samples) < self._reservoir_size:
+            self._samples.append(duration_ns)
+        else:
+            idx: int = self._random.randrange(self.count)
+            if idx < self._reservoir_size:
+                self._samples[idx] = duration_ns
+
+    def percentile(self, percent: float) -> float:
+        """Return a latency percentile (nanoseconds) estimated from the samples.
+
+        Args:
+            percent: Percentile between 0 and 100.
+
+        Returns:
+            The percentile value (0.0 if no sample).
+        """
+        if len(self._samples) == 0:
+            return 0.0
+
+        samples: list[int] = sorted(self._samples)
+        idx: int = min(len(samples) - 1, int(round(percent / 100 * (len(samples) - 1))))
+        return float(samples[idx])
+
+    def to_dict(self, positive_label: str | None) -> dict[str, Any]:
+        """Return the statistics as a dictionary (latencies in milliseconds).
+
+        Args:
+            positive_label: Key of the positive counter (e.g., 'activations'), None if not relevant.
+
+        Returns:
+            A dictionary of statistics.
+        """
+        stats: dict[str, Any] = {"evaluations": self.count}
+
+        if positive_label is not None:
+            stats[positive_label] = self.positive_count
+            stats[f"{positive_label}_ratio"] = self.positive_count / self.count if self.count > 0 else 0.0
+
+        stats.update(
+            {
+                "total_ms": self.total_ns / 1e6,
+                "mean_ms": self.total_ns / self.count / 1e6 if self.count > 0 else 0.0,
+                "p50_ms": self.percentile(50) / 1e6,
+                "p95_ms": self.percentile(95) / 1e6,
+                "p99_ms": self.percentile(99) / 1e6,
+                "max_ms": self.max_ns / 1e6,
+            }
+        )
+        return stats
+
+
+class StatsCollector:
+    """Thread-safe collector of per-rule, per-condition and per-action statistics.
+
+    Records of a request are buffered in its evaluation context and merged once at the end of the request,
+    so the collector lock is only taken once per sampled request.
+
+    Attributes:
+        sample_rate: One request out of 'sample_rate' is recorded.
+    """
+
+    def __init__(self, sample_rate: int = 1, reservoir_size: int = 1024) -> None:
+        """Initialize attributes.
+
+        Args:
+            sample_rate: One request out of 'sample_rate' is recorded (1 means every request).
+            reservoir_size: Maximum number of latency samples kept per item for the percentiles.
+
+        Raises:
+            ValueError: Wrong parameters.
+        """
+        if sample_rate < 1 or reservoir_size < 1:
+            raise ValueError("'sample_rate' and 'reservoir_size' must be positive integers.")
+
+        self.sample_rate = sample_rate
+        self._reservoir_size = reservoir_size
+        self._random = random.Random(0)  # noqa: S311
+        self._lock = threading.Lock()
+        self._request_counter: int = 0
+        self._init_counters()
+
+    def _init_counters(self) -> None:
+        """(Protected)
+        Initialize (or reset) the statistics.
+        """
+        self._requests: int = 0
+        self._items: dict[str, dict[str, LatencyStats]] = {RULE_RECORD: {}, CONDITION_RECORD: {}, ACTION_RECORD: {}}
+
+    def should_sample(self) -> bool:
+        """Return True if the current request has to be recorded (1-in-N sampling)."""
+        if self.sample_rate == 1:
+            return True
+
+        # Atomic increment (also on free-threaded builds)
+        with self._lock:
+            self._request_counter += 1
+            return self._request_counter % self.sample_rate == 1
+
+    def merge(self, records: list[tuple[str, str, int, bool]]) -> None:
+        """Merge the records of one request.
+
+        Args:
+            records: List of records as: (kind, item id, duration in ns, positive result).
+        """
+        with self._lock:
+            self._requests += 1
+
+            for kind, item_id, duration_ns, is_positive in records:
+                kind_items: dict[str, LatencyStats] = self._items[kind]
+                item: LatencyStats | None = kind_items.get(item_id)
+
+                if item is None:
+                    item = kind_items[item_id] = LatencyStats(self._reservoir_size, self._random)
+
+                item.add(duration_ns, is_positive)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a consistent copy of the statistics.
+
+        Returns:
+            A dictionary as: {'sampled_requests': int, 'sample_rate': int,
+            'rules': {rule: stats}, 'conditions': {condition id: stats}, 'actions': {action: stats}}.
+        """
+        with self._lock:
+            return {
+                "sampled_requests": self._requests,
+                "sample_rate": self.sample_rate,
+                "rules": {key: val.to_dict("activations") for key, val in self._items[RULE_RECORD].items()},
+                "conditions": {key: val.to_dict("true") for key, val in self._items[CONDITION_RECORD].items()},
+                "actions": {key: val.to_dict(None) for key, val in self._items[ACTION_RECORD].items()},
+            }
+
+    def reset(self) -> None:
+        """Reset the statistics."""
+        with self._lock:
+            self._init_counters()
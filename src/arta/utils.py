@@ -5,9 +5,12 @@ from __future__ import annotations
 import copy
 import logging
 import re
+from collections.abc import Mapping
 from enum import Enum
 from typing import Any
 
+from arta.path import PathAccessor, compile_path, get_item
+
 logger: logging.Logger = logging.getLogger(__name__)
 
 
@@ -36,6 +39,11 @@ def get_value_in_nested_dict_from_path(path: str, nested_dict: dict[str, Any]) -
         path : this.is.a.path
         result : nested_dict["this"]["is"]["a"]["path"]
 
+        path : items[*].price (list indexes and wildcards, see arta.path)
+        result : [item["price"] for item in nested_dict["items"]]
+
+    Values which are not dictionaries (e.g., dataclasses, Pydantic models) are read with arta.path.get_item().
+
     Args:
         path: A dictionary path.
         nested_dict: A nested dictionary.
@@ -43,6 +51,11 @@ def get_value_in_nested_dict_from_path(path: str, nested_dict: dict[str, Any]) -
     Returns:
         Found value.
     """
+    # List indexes and wildcards (e.g., 'items[*].price')
+    accessor: PathAccessor | None = compile_path(path)
+    if accessor is not None:
+        return accessor(nested_dict)
+
     keys: list[str] = path.split(".")
 
     # Initialize value with whole nested dict
@@ -54,11 +67,59 @@ def get_value_in_nested_dict_from_path(path: str, nested_dict: dict[str, Any]) -
             msg: str = f"Key {value} of path {path} not found in input data."
             logger.debug(msg)
             raise KeyError(msg)
-        value = value[key]
+        value = value[key] if isinstance(value, dict) else get_item(value, key)
 
     return value
 
 
+class InputNamespace(dict[str, Any]):
+    """Data of a request whose input data is not a dictionary (e.g., a dataclass, a Pydantic model).
+
+    The namespace holds the 'output' key (results of the rule groups) and the values set during the request
+    (e.g., by value sharing functions): the other keys are read in the input object, which is neither converted
+    nor modified.
+
+    Attributes:
+        input_object: Input data of the request.
+    """
+
+    __slots__ = ("input_object",)
+
+    def __init__(self, input_object: Any) -> None:
+        """Initialize attributes.
+
+        Args:
+            input_object: Input data of the request.
+        """
+        super().__init__(output={})
+        self.input_object = input_object
+
+    def __missing__(self, key: str) -> Any:
+        """Return the value of a key of the input object.
+
+        Raises:
+            KeyError: Missing key (see arta.path.get_item()).
+        """
+        return get_item(self.input_object, key)
+
+    def __contains__(self, key: object) -> bool:
+        """Return True if the key is set in the namespace or in the input object."""
+        if not isinstance(key, str):
+            return super().__contains__(key)
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value of a key, or the default value if it is missing."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
 def parse_dynamic_parameter(
     parameter: Any,
     input_data: dict[str, Any],
@@ -114,6 +175,79 @@ def parse_dynamic_parameter(
     return parameter
 
 
+def is_static_parameter(parameter: Any) -> bool:
+    """Return True if the parameter has no dynamic value (i.e., no 'input.' or 'output.' path).
+
+    A static parameter can be resolved once (at build time) instead of on every evaluation.
+
+    Args:
+        parameter: A parameter configured in conditions.yaml or rules.yaml.
+
+    Returns:
+        True if the parameter is static.
+    """
+    if isinstance(parameter, list):
+        return all(is_static_parameter(element) for element in parameter)
+
+    return not (isinstance(parameter, str) and parameter.startswith(("input.", "output.")))
+
+
+def is_immutable(value: Any) -> bool:
+    """Return True if the value can't be modified (scalars, tuples and frozensets of immutable values).
+
+    Args:
+        value: A parameter value.
+
+    Returns:
+        True if the value can be shared without copying it.
+    """
+    if value is None or type(value) in (str, bytes, int, float, complex, bool):
+        return True
+
+    if type(value) in (tuple, frozenset):
+        return all(is_immutable(element) for element in value)
+
+    return False
+
+
+def copy_static_parameters(static_parameters: Mapping[str, Any], mutable_keys: tuple[str, ...]) -> dict[str, Any]:
+    """Return the static parameters of a call: mutable values (e.g., lists, dictionaries) are deep-copied,
+    so that a function modifying its parameters never modifies the configuration.
+
+    Args:
+        static_parameters: Static parameters (see split_static_parameters()).
+        mutable_keys: Keys of the mutable values (see is_immutable()).
+
+    Returns:
+        The parameters of the call.
+    """
+    parameters: dict[str, Any] = dict(static_parameters)
+    for key in mutable_keys:
+        parameters[key] = copy.deepcopy(parameters[key])
+    return parameters
+
+
+def split_static_parameters(parameters: Mapping[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Split parameters into the static ones (already resolved) and the dynamic ones (to be parsed).
+
+    Args:
+        parameters: Parameters of a validation or action function.
+
+    Returns:
+        A tuple as: (static parameters, dynamic parameters).
+    """
+    static_parameters: dict[str, Any] = {}
+    dynamic_parameters: dict[str, Any] = {}
+
+    for key, value in parameters.items():
+        if is_static_parameter(value):
+            static_parameters[key] = copy.deepcopy(value)
+        else:
+            dynamic_parameters[key] = value
+
+    return static_parameters, dynamic_parameters
+
+
 def check_parsing_error_strategy_override(
     param_path: str, parsing_error_strategy: ParsingErrorStrategy
 ) -> tuple[Any, str, ParsingErrorStrategy]:
@@ -0,0 +1,364 @@
+"""Sliding time windows of the simple conditions: aggregates of the recent events of the same key.
+
+E.g., 'count(@claims_10m)>5': more than 5 claims of this customer in the last 10 minutes.
+
+Each call of RulesEngine.apply_rules() records an event (a timestamp and an optional value) in the windows used by
+its rule set, under the key read in the input data (e.g., 'input.customer_id'), before the rules are evaluated:
+the current event is part of the aggregates (and removed if the evaluation fails). Each key keeps the events of its window in a ring buffer with running
+counters, so an aggregate only removes the expired events (no recomputation from the whole history).
+
+Memory is bounded: keys without events in the window are evicted (TTL), as well as the least recently updated keys
+beyond 'max_keys', and the oldest events of a key beyond 'max_events'.
+
+Class: SlidingWindow
+Function: build_windows
+Constant: AGGREGATE_FUNCTIONS
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Mapping
+from typing import Any, Callable
+
+from arta.incremental import get_config_digest
+from arta.path import get_item
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# Functions of the simple conditions (k: name, v: meaning)
+AGGREGATE_FUNCTIONS: dict[str, str] = {
+    "count": "number of events",
+    "sum": "sum of the values",
+    "avg": "average of the values",
+    "min": "minimum of the values",
+    "max": "maximum of the values",
+}
+
+
+def _get_value(keys: tuple[str, ...] | None, input_data: dict[str, Any]) -> Any:
+    """(Protected)
+    Return the value of a data path (None if there is no path or the value is missing).
+    """
+    if keys is None:
+        return None
+
+    value: Any = input_data
+    for key in keys:
+        if isinstance(value, dict):
+            value = value.get(key)
+            continue
+        if value is None:
+            return None
+        try:
+            value = get_item(value, key)
+        except (KeyError, TypeError, IndexError):
+            return None
+
+    return value
+
+
+class _KeyEvents:
+    """(Protected)
+    Events of a key in the window, sorted by timestamp, and their running counters.
+    """
+
+    __slots__ = ("events", "total", "valued")
+
+    def __init__(self) -> None:
+        self.events: deque[tuple[float, float | None]] = deque()
+        self.total: float = 0
+        self.valued: int = 0
+
+    def add(self, timestamp: float, value: float | None) -> None:
+        if len(self.events) == 0 or timestamp >= self.events[-1][0]:
+            self.events.append((timestamp, value))
+        else:
+            # Late event (event time): kept sorted, usually close to the end
+            idx: int = len(self.events)
+            while idx > 0 and self.events[idx - 1][0] > timestamp:
+                idx -= 1
+            self.events.insert(idx, (timestamp, value))
+
+        if value is not None:
+            self.total += value
+            self.valued += 1
+
+    def remove(self, timestamp: float, value: float | None) -> None:
+        try:
+            self.events.remove((timestamp, value))
+        except ValueError:
+            # Expired or dropped meanwhile
+            return
+
+        if value is not None:
+            self.total -= value
+            self.valued -= 1
+
+    def pop_oldest(self) -> None:
+        _, value = self.events.popleft()
+
+        if value is not None:
+            self.total -= value
+            self.valued -= 1
+
+    def expire(self, start: float) -> None:
+        while len(self.events) > 0 and self.events[0][0] <= start:
+            self.pop_oldest()
+
+
+class SlidingWindow:
+    """Events of the last 'duration' seconds, grouped by key.
+
+    Attributes:
+        name: Name of the window (e.g., 'claims_10m' for '@claims_10m').
+        duration: Duration of the window (seconds).
+        key_path: Data path of the key (e.g., 'input.customer_id').
+        value_path: Data path of the value (sum, avg, min, max), None if only the events are counted.
+        timestamp_path: Data path of the event time (seconds since the epoch), None for the processing time.
+        max_keys: Maximum number of keys (the least recently updated keys are evicted).
+        max_events: Maximum number of events per key (the oldest ones are dropped).
+        evicted_keys: Number of keys evicted before their events expired (max_keys).
+        dropped_events: Number of events dropped before they expired (max_events).
+    """
+
+    __slots__ = (
+        "name",
+        "duration",
+        "key_path",
+        "value_path",
+        "timestamp_path",
+        "max_keys",
+        "max_events",
+        "evicted_keys",
+        "dropped_events",
+        "_clock",
+        "_path_keys",
+        "_keys",
+        "_watermark",
+        "_lock",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        duration: float,
+        key: str,
+        value: str | None = None,
+        timestamp: str | None = None,
+        max_keys: int = 100_000,
+        max_events: int = 10_000,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize attributes.
+
+        Args:
+            name: Name of the window.
+            duration: Duration of the window (seconds).
+            key: Data path of the key.
+            value: Data path of the value.
+            timestamp: Data path of the event time (the clock is used if None).
+            max_keys: Maximum number of keys.
+            max_events: Maximum number of events per key.
+            clock: Processing time (seconds).
+
+        Raises:
+            ValueError: Wrong duration, limit or data path.
+        """
+        if duration <= 0 or max_keys <= 0 or max_events <= 0:
+            raise ValueError(f"Window '{name}': 'duration', 'max_keys' and 'max_events' must be positive.")
+        for path in (key, value, timestamp):
+            if path is not None and not path.startswith("input."):
+                raise ValueError(f"Window '{name}': '{path}' is not a data path of the input (e.g., 'input.x').")
+
+        self.name = name
+        self.duration = duration
+        self.key_path = key
+        self.value_path = value
+        self.timestamp_path = timestamp
+        self.max_keys = max_keys
+        self.max_events = max_events
+        self.evicted_keys: int = 0
+        self.dropped_events: int = 0
+
+        self._clock = clock
+        # Keys of the data paths (read on each request, without parsing them)
+        self._path_keys: tuple[tuple[str, ...] | None, ...] = tuple(
+            tuple(path.split(".")[1:]) if path is not None else None for path in (key, value, timestamp)
+        )
+        self._keys: OrderedDict[Any, _KeyEvents] = OrderedDict()
+        # Latest event time (event time windows)
+        self._watermark: float = float("-inf")
+        # Shared by the requests (threads)
+        self._lock: threading.Lock = threading.Lock()
+
+    def record(self, input_data: dict[str, Any]) -> tuple[Any, float, float | None] | None:
+        """Record the event of a request (nothing if the key is missing or not hashable).
+
+        Args:
+            input_data: Input data of the request.
+
+        Returns:
+            The recorded event as (key, timestamp, value), None if no event is recorded (see forget()).
+        """
+        key_keys, value_keys, timestamp_keys = self._path_keys
+
+        key: Any = _get_value(key_keys, input_data)
+        if key is None:
+            return None
+        try:
+            hash(key)
+        except TypeError:
+            return None
+
+        value: Any = _get_value(value_keys, input_data)
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            # Counted, but not aggregated
+            value = None
+
+        timestamp: Any = _get_value(timestamp_keys, input_data)
+        if isinstance(timestamp, bool) or not isinstance(timestamp, (int, float)):
+            timestamp = self._clock()
+
+        with self._lock:
+            self._watermark = max(self._watermark, timestamp)
+
+            key_events: _KeyEvents | None = self._keys.get(key)
+            if key_events is None:
+                key_events = self._keys[key] = _KeyEvents()
+            else:
+                self._keys.move_to_end(key)
+
+            key_events.add(timestamp, value)
+            if len(key_events.events) > self.max_events:
+                key_events.pop_oldest()
+                self.dropped_events += 1
+
+            self._evict()
+
+        return key, timestamp, value
+
+    def forget(self, event: tuple[Any, float, float | None]) -> None:
+        """Remove an event recorded by record(), e.g., the evaluation of the request failed
+        (nothing if it has already expired or been dropped).
+
+        Args:
+            event: The recorded event as (key, timestamp, value).
+        """
+        key, timestamp, value = event
+
+        with self._lock:
+            key_events: _KeyEvents | None = self._keys.get(key)
+            if key_events is not None:
+                key_events.remove(timestamp, value)
+                if len(key_events.events) == 0:
+                    del self._keys[key]
+
+    def count(self, key: Any) -> int:
+        """Return the number of events of a key in the window."""
+        key_events: _KeyEvents | None = self._get(key)
+        return len(key_events.events) if key_events is not None else 0
+
+    def sum(self, key: Any) -> float:
+        """Return the sum of the values of a key in the window."""
+        key_events: _KeyEvents | None = self._get(key)
+        return key_events.total if key_events is not None else 0
+
+    def avg(self, key: Any) -> float | None:
+        """Return the average of the values of a key in the window (None if there is no value)."""
+        key_events: _KeyEvents | None = self._get(key)
+        return key_events.total / key_events.valued if key_events is not None and key_events.valued > 0 else None
+
+    def min(self, key: Any) -> float | None:
+        """Return the minimum of the values of a key in the window (None if there is no value)."""
+        return min(self._values(key), default=None)
+
+    def max(self, key: Any) -> float | None:
+        """Return the maximum of the values of a key in the window (None if there is no value)."""
+        return max(self._values(key), default=None)
+
+    def info(self) -> dict[str, int]:
+        """Return the number of keys and the evictions (see the attributes)."""
+        return {"keys": len(self._keys), "evicted_keys": self.evicted_keys, "dropped_events": self.dropped_events}
+
+    def _now(self) -> float:
+        """(Protected)
+        Return the end of the window: the latest event time, or the processing time.
+        """
+        return self._watermark if self.timestamp_path is not None else self._clock()
+
+    def _get(self, key: Any) -> _KeyEvents | None:
+        """(Protected)
+        Return the events of a key after the expired ones have been removed.
+
+        Raises:
+            TypeError: The key is not hashable (the simple condition is ignored).
+        """
+        with self._lock:
+            key_events: _KeyEvents | None = self._keys.get(key)
+            if key_events is not None:
+                key_events.expire(self._now() - self.duration)
+            return key_events
+
+    def _values(self, key: Any) -> list[float]:
+        """(Protected)
+        Return the values of a key in the window.
+        """
+        with self._lock:
+            key_events: _KeyEvents | None = self._keys.get(key)
+            if key_events is None:
+                return []
+            key_events.expire(self._now() - self.duration)
+            return [value for _, value in key_events.events if value is not None]
+
+    def _evict(self) -> None:
+        """(Protected)
+        Evict the keys without events in the window (least recently updated first), then the keys beyond max_keys.
+        """
+        start: float = self._now() - self.duration
+
+        while len(self._keys) > 0:
+            key_events: _KeyEvents = next(iter(self._keys.values()))
+            if len(key_events.events) > 0 and key_events.events[-1][0] > start:
+                break
+            self._keys.popitem(last=False)
+
+        while len(self._keys) > self.max_keys:
+            self._keys.popitem(last=False)
+            self.evicted_keys += 1
+
+
+def build_windows(
+    definitions: Mapping[str, Mapping[str, Any]],
+    previous: Mapping[str, tuple[bytes, SlidingWindow]] | None = None,
+) -> dict[str, tuple[bytes, SlidingWindow]]:
+    """Build the sliding windows of a configuration.
+
+    Args:
+        definitions: Windows of the configuration (k: name, v: {'duration': float, 'key': str, 'value': str,
+            'timestamp': str, 'max_keys': int, 'max_events': int}).
+        previous: Windows of a previous build, reused with their events if their definition is unchanged.
+
+    Returns:
+        The windows (k: name, v: (definition digest, window)).
+
+    Raises:
+        ValueError: Wrong definition.
+    """
+    windows: dict[str, tuple[bytes, SlidingWindow]] = {}
+
+    for name, definition in definitions.items():
+        digest: bytes = get_config_digest(definition)
+
+        if previous is not None and name in previous and previous[name][0] == digest:
+            windows[name] = previous[name]
+            continue
+
+        options: dict[str, Any] = {option: value for option, value in definition.items() if value is not None}
+        windows[name] = (digest, SlidingWindow(name, **options))
+        logger.info("Sliding window '%s' is built (%s seconds).", name, windows[name][1].duration)
+
+    return windows
@@ -8,6 +8,8 @@ from __future__ import annotations
 
 from typing import Any
 
+from arta.cache import pure
+
 
 def set_admission(value: bool) -> dict[str, bool]:
     """Return a dictionary containing the admission result."""
@@ -62,3 +64,10 @@ def set_admission_custom(value: bool, **kwargs: Any) -> dict[str, bool]:
     value = value if kwargs["my_parameter"] is True else False
 
     return {"admission": value}
+
+
+@pure(maxsize=16)
+def set_course_level(course_id: str, age: int | None, **kwargs: Any) -> dict[str, str]:
+    """Return the course id and a level depending on the age (pure function)."""
+    level = "senior" if age is not None and age > 50 else "junior"
+    return {"course_id": course_id, "level": level}
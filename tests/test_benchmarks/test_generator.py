@@ -0,0 +1,42 @@
+"""Synthetic configuration generator and baseline comparison UT."""
+
+import pytest
+from arta import RulesEngine
+from benchmarks.compare import compare
+from benchmarks.generator import generate_config, generate_inputs
+
+
+def test_generator_is_deterministic():
+    """Same parameters and seed give the same configuration and inputs."""
+    assert generate_config(seed=3) == generate_config(seed=3)
+    assert generate_config(seed=3) != generate_config(seed=4)
+    assert generate_inputs(10, seed=3) == generate_inputs(10, seed=3)
+
+
+@pytest.mark.parametrize("rule_activation_mode", ["one_by_group", "many_by_group"])
+def test_generated_config_runs(rule_activation_mode):
+    """The generated configuration is valid and can be applied on the generated inputs."""
+    config = generate_config(
+        rule_sets=2, groups=3, rules_per_group=4, input_fields=12, rule_activation_mode=rule_activation_mode
+    )
+    eng = RulesEngine(config_dict=config)
+
+    assert list(eng.rules) == ["rule_set_0", "rule_set_1"]
+    assert sum(len(rules) for rules in eng.rules["rule_set_1"].values()) <= 12
+
+    for input_data in generate_inputs(20, input_fields=12):
+        results = eng.apply_rules(input_data, rule_set="rule_set_1")
+        assert set(results) == {"group_0", "group_1", "group_2"}
+
+
+def test_compare():
+    """Regressions are flagged according to the direction of the metric."""
+    baseline = {"results": {"latency": {"calls": 10, "p50_us": 100.0}, "throughput": {"calls_per_s": 1000.0}}}
+    candidate = {"results": {"latency": {"calls": 20, "p50_us": 150.0}, "throughput": {"calls_per_s": 1050.0}}}
+
+    rows = {row["metric"]: row for row in compare(baseline, candidate, threshold=10)}
+
+    assert set(rows) == {"latency.p50_us", "throughput.calls_per_s"}
+    assert rows["latency.p50_us"]["change"] == pytest.approx(-50.0)
+    assert rows["latency.p50_us"]["regression"] is True
+    assert rows["throughput.calls_per_s"]["regression"] is False
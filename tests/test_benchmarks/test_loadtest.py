@@ -0,0 +1,31 @@
+"""Load test harness UT."""
+
+import json
+
+from benchmarks.generator import generate_inputs
+from benchmarks.loadtest import load_corpus, run
+from benchmarks.suite import PROFILES
+
+
+def test_loadtest_threads():
+    """Each number of workers gets its percentiles, throughput and scaling efficiency."""
+    results = run([1, 2], requests=5, profile="small")["results"]
+
+    assert set(results) == {"1", "2"}
+    assert results["1"]["scaling_efficiency"] == 1.0
+    assert results["2"]["calls"] == 10
+    assert 0 < results["2"]["p50_us"] <= results["2"]["p999_us"] <= results["2"]["max_us"]
+
+
+def test_loadtest_recorded_corpus(tmp_path):
+    """Recorded inputs are read from a JSON lines file."""
+    path = tmp_path / "corpus.jsonl"
+    recorded = generate_inputs(3, input_fields=PROFILES["small"]["input_fields"], seed=42)
+    path.write_text("\n".join(json.dumps(input_data) for input_data in recorded) + "\n", encoding="utf-8")
+
+    corpus = load_corpus(path)
+    assert corpus == recorded
+
+    results = run([2], requests=4, profile="small", corpus=corpus)
+    assert results["parameters"]["corpus"] == "recorded"
+    assert results["results"]["2"]["calls"] == 8
@@ -71,3 +71,16 @@ def test_concatenate():
     """Action function unit test."""
     result = actions.concatenate("a", "b")
     assert result == "ab"
+
+
+@pytest.mark.parametrize(
+    "course_id, age, expected",
+    [
+        ("english", 62, {"course_id": "english", "level": "senior"}),
+        ("french", None, {"course_id": "french", "level": "junior"}),
+    ],
+)
+def test_set_course_level(course_id, age, expected):
+    """Action function unit test."""
+    result = actions.set_course_level(course_id, age)
+    assert result == expected
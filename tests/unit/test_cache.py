@@ -0,0 +1,157 @@
+"""Memoization of pure functions UT."""
+
+import os
+
+import pytest
+from arta import RulesEngine
+from arta.cache import FunctionCache, is_pure, make_hashable, pure
+
+from tests.examples.code import actions, conditions
+
+
+def test_pure_decorator():
+    """Unit test of the @pure decorator."""
+
+    @pure
+    def func_1(value):
+        return value
+
+    @pure(maxsize=2)
+    def func_2(value):
+        return value
+
+    assert is_pure(func_1)
+    assert is_pure(func_2)
+    assert not is_pure(conditions.is_speaking_language)
+    assert func_2(3) == 3
+
+    with pytest.raises(ValueError):
+        pure(maxsize=0)
+
+
+@pytest.mark.parametrize(
+    "value_1, value_2, is_equal",
+    [
+        (["fly", "strength"], ["fly", "strength"], True),
+        (["fly", "strength"], ("fly", "strength"), False),
+        ({"a": [1, 2], "b": {"c"}}, {"b": {"c"}, "a": [1, 2]}, True),
+        (1, True, False),
+        (1, 1.0, False),
+    ],
+)
+def test_make_hashable(value_1, value_2, is_equal):
+    """Unit test of the canonical hashing of parameters."""
+    assert (make_hashable(value_1) == make_hashable(value_2)) is is_equal
+
+
+def test_function_cache_lru():
+    """Unit test of the bounded LRU cache."""
+    calls = []
+
+    def double(value):
+        calls.append(value)
+        return value * 2
+
+    cache = FunctionCache(double, maxsize=2)
+
+    assert cache({"value": 1}) == 2
+    assert cache({"value": 1}) == 2
+    assert cache({"value": 2}) == 4
+    assert cache({"value": 3}) == 6
+    # 1 has been evicted
+    assert cache({"value": 1}) == 2
+    assert calls == [1, 2, 3, 1]
+
+    info = cache.info()
+    assert (info.hits, info.misses, info.maxsize, info.currsize) == (1, 4, 2, 2)
+
+    # Unhashable parameters are not memoized
+    assert cache({"value": bytearray(b"a")}) == bytearray(b"aa")
+    assert cache.info().uncacheable == 1
+
+    cache.clear()
+    assert cache.info().currsize == 0
+
+
+def test_engine_memoization(base_config_path):
+    """Pure functions are memoized by the engine (decorator or 'pure' flag in the configuration)."""
+    eng = RulesEngine(config_path=os.path.join(base_config_path, "pure_functions"))
+    input_data = {"age": 62, "language": "english", "powers": ["fly"]}
+
+    for _ in range(3):
+        result = eng.apply_rules(input_data)
+        assert result == {
+            "admission": {"admission": True},
+            "course": {"course_id": "english", "level": "senior"},
+        }
+
+    stats = eng.cache_info()
+    condition_stats = stats[FunctionCache.get_function_name(conditions.has_authorized_super_power)]
+    action_stats = stats[FunctionCache.get_function_name(actions.set_course_level)]
+
+    assert (condition_stats.hits, condition_stats.misses) == (2, 1)
+    assert (action_stats.hits, action_stats.misses, action_stats.maxsize) == (2, 1, 16)
+    assert FunctionCache.get_function_name(conditions.is_speaking_language) not in stats
+
+    eng.cache_clear()
+    assert eng.cache_info()[FunctionCache.get_function_name(actions.set_course_level)].currsize == 0
+
+
+def test_rules_dict_memoization():
+    """Pure functions are memoized in the rules dict mode."""
+    calls = []
+
+    @pure
+    def is_adult(age):
+        calls.append(age)
+        return age >= 18
+
+    eng = RulesEngine(
+        rules_dict={
+            "admission": {
+                "adult": {
+                    "condition": is_adult,
+                    "condition_parameters": {"age": "input.age"},
+                    "action": lambda value: value,
+                    "action_parameters": {"value": "adult"},
+                },
+            }
+        }
+    )
+
+    assert eng.apply_rules({"age": 20}) == {"admission": "adult"}
+    assert eng.apply_rules({"age": 20}) == {"admission": "adult"}
+    assert eng.apply_rules({"age": 12}) == {"admission": None}
+    assert calls == [20, 12]
+
+
+def test_mutable_results():
+    """Modifying a memoized result never modifies the cache (results which can be modified are copied)."""
+
+    @pure
+    def set_value(value):
+        return {"v": value}
+
+    eng = RulesEngine(
+        rules_dict={
+            "group": {
+                "rule": {
+                    "condition": None,
+                    "condition_parameters": None,
+                    "action": set_value,
+                    "action_parameters": {"value": "input.value"},
+                },
+            }
+        }
+    )
+
+    for _ in range(3):
+        result = eng.apply_rules({"value": 1})
+        assert result == {"group": {"v": 1}}
+        result["group"]["v"] = 999
+
+    assert eng.cache_info()[FunctionCache.get_function_name(set_value)].hits == 2
+    cache = FunctionCache(lambda: [1])
+    cache({}).append(2)
+    cache({}).append(3)
+    assert cache({}) == [1]
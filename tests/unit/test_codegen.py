@@ -0,0 +1,177 @@
+"""Code generation UT (differential tests against the interpreter)."""
+
+import importlib.util
+import os
+import subprocess
+import sys
+from types import MappingProxyType
+
+import pytest
+from arta import RulesEngine
+from arta.codegen import generate_code, write_module
+
+from benchmarks.generator import generate_config, generate_inputs
+
+HEROES = [
+    {"age": 100, "language": "french", "power": "strength", "powers": ["fly"], "favorite_meal": "Spinach"},
+    {"age": 30, "language": "english", "power": "fly", "powers": ["strength"], "favorite_meal": None},
+    {"age": None, "language": "german", "power": "invisibility", "powers": [], "favorite_meal": "French Fries"},
+    {"age": "unknown", "language": "english", "power": "fly", "powers": None, "favorite_meal": "Pizza"},
+    {"dummy": 100, "language": "french", "power": "strength", "favorite_meal": "Spinach"},
+    {"a": 1.3, "b": 0.7, "threshold": 0.89},
+    {"age": 30, "language": ["french"], "power": {"fly": True}, "powers": [], "favorite_meal": None},
+]
+
+
+class Hero:
+    """Hero read through its attributes (not a dictionary)."""
+
+    def __init__(self, **fields):
+        self.__dict__.update(fields)
+
+
+def load_module(engine, tmp_path, rule_sets=None, name="generated_rules"):
+    """Generate, write and import the module of an engine."""
+    path = write_module(engine, tmp_path / f"{name}.py", rule_sets=rule_sets)
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def run(apply_rules, input_data, **kwargs):
+    """Return the results, or the raised exception type and message."""
+    try:
+        return apply_rules(input_data, **kwargs)
+    except Exception as error:
+        return type(error), str(error)
+
+
+def assert_same_results(engine, module, inputs, rule_sets):
+    """Compare the interpreter and the generated code (results, verbosity and errors)."""
+    for input_data in inputs:
+        for rule_set in rule_sets:
+            for verbose in (False, True):
+                expected = run(engine.apply_rules, input_data, rule_set=rule_set, verbose=verbose)
+                assert run(module.apply_rules, input_data, rule_set=rule_set, verbose=verbose) == expected
+
+
+@pytest.mark.parametrize(
+    "config_dir",
+    [
+        "simple_condition/default",
+        "simple_condition/extended",
+        "simple_condition/ignore",
+        "simple_condition/math",
+        "simple_condition/raise",
+        "simple_condition/uppercase",
+        "simple_condition/whitespace",
+        "pure_functions",
+        "constant_folding",
+        "value_sharing",
+        "rule_activation_mode",
+        "ignore_conf",
+    ],
+)
+def test_example_configs(config_dir, base_config_path, tmp_path):
+    """Generated modules give the same results as the interpreter."""
+    engine = RulesEngine(config_path=os.path.join(base_config_path, config_dir))
+    module = load_module(engine, tmp_path)
+
+    assert_same_results(engine, module, HEROES, list(engine.rules.keys()))
+
+
+@pytest.mark.parametrize("config_dir", ["simple_condition/extended", "simple_condition/raise", "pure_functions"])
+def test_input_objects(config_dir, base_config_path, tmp_path):
+    """Objects and mappings which are not dictionaries are read like the interpreter does."""
+    engine = RulesEngine(config_path=os.path.join(base_config_path, config_dir))
+    module = load_module(engine, tmp_path)
+    inputs = [Hero(**hero) for hero in HEROES] + [MappingProxyType(hero) for hero in HEROES] + ["hero", None, {}]
+
+    assert_same_results(engine, module, inputs, list(engine.rules.keys()))
+
+
+def test_synthetic_configs(tmp_path):
+    """Differential test on generated configurations (standard and simple conditions, both activation modes)."""
+    for seed, mode in ((1, "one_by_group"), (2, "many_by_group")):
+        config = generate_config(groups=8, rules_per_group=12, custom_ratio=0.0, rule_activation_mode=mode, seed=seed)
+        engine = RulesEngine(config_dict=config)
+        module = load_module(engine, tmp_path, name=f"generated_{mode}")
+
+        assert_same_results(engine, module, generate_inputs(50, seed=seed), list(engine.rules.keys()))
+
+
+def test_ignored_rules_and_kwargs(base_config_path, tmp_path):
+    """Ignored rules and user extra arguments (value sharing) are supported."""
+    engine = RulesEngine(config_path=os.path.join(base_config_path, "good_conf"))
+    module = load_module(engine, tmp_path, rule_sets=["default_rule_set"])
+
+    for ignored_rules in ({"ADM_OK"}, {"COURSE_ENGLISH", "EMAIL_COOK"}):
+        for input_data in HEROES:
+            expected = run(engine.apply_rules, input_data, rule_set="default_rule_set", ignored_rules=ignored_rules)
+            result = run(module.apply_rules, input_data, rule_set="default_rule_set", ignored_rules=ignored_rules)
+            assert result == expected
+
+    assert run(module.apply_rules, {}) == run(engine.apply_rules, {})
+    assert run(module.apply_rules, HEROES[0], rule_set="unknown")[0] is KeyError
+
+
+def test_unsupported(base_config_path):
+    """Custom conditions can't be generated."""
+    engine = RulesEngine(config_path=os.path.join(base_config_path, "good_conf"))
+
+    with pytest.raises(ValueError, match="custom conditions"):
+        generate_code(engine, rule_sets=["second_rule_set"])
+
+    with pytest.raises(KeyError):
+        generate_code(engine, rule_sets=["unknown"])
+
+
+def test_standalone_module(tmp_path):
+    """The generated module is importable without arta, omegaconf and pydantic."""
+    (tmp_path / "standalone_functions.py").write_text(
+        "def is_adult(age):\n    return age >= 18\n\n\ndef set_value(value):\n    return value\n", encoding="utf-8"
+    )
+    sys.path.insert(0, str(tmp_path))
+    try:
+        engine = RulesEngine(
+            config_dict={
+                "conditions_source_modules": ["standalone_functions"],
+                "actions_source_modules": ["standalone_functions"],
+                "conditions": {
+                    "IS_ADULT": {
+                        "description": "Adult",
+                        "validation_function": "is_adult",
+                        "condition_parameters": {"age": "input.age"},
+                    }
+                },
+                "rules": {
+                    "default_rule_set": {
+                        "status": {
+                            "ADULT": {
+                                "condition": "IS_ADULT",
+                                "simple_condition": "input.name!=None",
+                                "action": "set_value",
+                                "action_parameters": {"value": "adult"},
+                            }
+                        }
+                    }
+                },
+            }
+        )
+        write_module(engine, tmp_path / "standalone_rules.py")
+    finally:
+        sys.path.remove(str(tmp_path))
+        sys.modules.pop("standalone_functions", None)
+
+    script = (
+        "import sys\n"
+        "sys.modules.update({'arta': None, 'omegaconf': None, 'pydantic': None})\n"
+        "import standalone_rules\n"
+        "print(standalone_rules.apply_rules({'age': 20, 'name': 'Bob'}))\n"
+    )
+    completed = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", script], cwd=tmp_path, capture_output=True, text=True, check=True
+    )
+
+    assert completed.stdout.strip() == "{'status': 'adult'}"
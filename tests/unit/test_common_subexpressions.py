@@ -0,0 +1,164 @@
+"""Common subexpression elimination UT (conditions evaluated once per request)."""
+
+import pytest
+from arta import RulesEngine
+
+CALLS = []
+
+
+def is_flying(power):
+    """Validation function counting its calls."""
+    CALLS.append(power)
+    return power == "fly"
+
+
+def is_median_above(values, limit, **kwargs):
+    """Validation function with value sharing (not shared between rules)."""
+    CALLS.append(limit)
+    return sum(values) / len(values) > limit
+
+
+def set_flag(**kwargs):
+    """Validation function with value sharing modifying the input data."""
+    kwargs["input_data"]["flag"] = 1
+    return False
+
+
+def set_value(value):
+    """Action function."""
+    return value
+
+
+CONFIG = {
+    "conditions": {
+        "IS_FLYING": {
+            "description": "Can fly?",
+            "validation_function": "is_flying",
+            "condition_parameters": {"power": "input.power"},
+        },
+        "IS_MEAN_ABOVE_10": {
+            "description": "Is the mean above 10?",
+            "validation_function": "is_median_above",
+            "condition_parameters": {"values": "input.values", "limit": 10},
+        },
+        "SET_FLAG": {
+            "description": "Set the flag",
+            "validation_function": "set_flag",
+            "condition_parameters": {},
+        },
+    },
+    "conditions_source_modules": ["tests.unit.test_common_subexpressions"],
+    "actions_source_modules": ["tests.unit.test_common_subexpressions"],
+    "rule_activation_mode": "many_by_group",
+}
+
+
+@pytest.fixture(autouse=True)
+def clear_calls():
+    """Reset the call tracking."""
+    CALLS.clear()
+
+
+def test_shared_evaluation_across_rule_groups():
+    """Each distinct condition is verified once per request."""
+    config = dict(CONFIG)
+    config["rule_activation_mode"] = "one_by_group"
+    config["rules"] = {
+        "default_rule_set": {
+            f"group_{idx}": {
+                "RULE_1": {
+                    "condition": "IS_FLYING and IS_MEAN_ABOVE_10",
+                    "simple_condition": 'input.age>=100 or input.power=="fly"',
+                    "action": "set_value",
+                    "action_parameters": {"value": "flying"},
+                },
+                "RULE_2": {"condition": "not(IS_FLYING)", "action": "set_value", "action_parameters": {"value": "no"}},
+            }
+            for idx in range(5)
+        }
+    }
+    eng = RulesEngine(config_dict=config)
+
+    result = eng.apply_rules({"power": "walk", "values": [1, 2], "age": 20}, verbose=True)
+
+    assert result["group_4"] == "no"
+    # IS_FLYING is verified once per group (results are invalidated after each action) instead of twice
+    assert CALLS.count("walk") == 5
+    assert CALLS.count(10) == 5
+    assert result["verbosity"]["results"][0]["verified_conditions"]["condition"]["values"] == {"IS_FLYING": False}
+
+
+def test_shared_evaluation_without_activation():
+    """Results are shared as long as no action is triggered."""
+    config = dict(CONFIG)
+    config["rules"] = {
+        "default_rule_set": {
+            f"group_{idx}": {
+                "RULE_1": {
+                    "condition": "IS_FLYING",
+                    "action": "set_value",
+                    "action_parameters": {"value": "flying"},
+                },
+            }
+            for idx in range(5)
+        }
+    }
+    eng = RulesEngine(config_dict=config)
+
+    assert eng.apply_rules({"power": "walk"}) == {f"group_{idx}": None for idx in range(5)}
+    assert CALLS == ["walk"]
+
+    # Every request is evaluated independently
+    assert eng.apply_rules({"power": "fly"}) == {f"group_{idx}": "flying" for idx in range(5)}
+    assert CALLS == ["walk", "fly", "fly", "fly", "fly", "fly"]
+
+
+def test_value_sharing_invalidation():
+    """Results stored before a value sharing condition are forgotten (the input data may have changed)."""
+    config = dict(CONFIG)
+    config["rule_activation_mode"] = "one_by_group"
+    config["rules"] = {
+        "default_rule_set": {
+            "group": {
+                "RULE_0": {
+                    "simple_condition": "input.flag==1",
+                    "action": "set_value",
+                    "action_parameters": {"value": 0},
+                },
+                "RULE_1": {"condition": "SET_FLAG", "action": "set_value", "action_parameters": {"value": 1}},
+                "RULE_2": {
+                    "simple_condition": "input.flag==1",
+                    "action": "set_value",
+                    "action_parameters": {"value": 2},
+                },
+            }
+        }
+    }
+    eng = RulesEngine(config_dict=config)
+
+    assert eng.apply_rules({"flag": 0}) == {"group": 2}
+
+
+def test_rules_dict_conditions():
+    """Rules of a rules dictionary share the same condition id, not the same condition (never shared)."""
+    eng = RulesEngine(
+        rules_dict={
+            "g": {
+                "one": {
+                    "condition": lambda value: value == 1,
+                    "condition_parameters": {"value": "input.value"},
+                    "action": set_value,
+                    "action_parameters": {"value": "one"},
+                },
+                "two": {
+                    "condition": lambda value: value == 2,
+                    "condition_parameters": {"value": "input.value"},
+                    "action": set_value,
+                    "action_parameters": {"value": "two"},
+                },
+            }
+        }
+    )
+
+    assert eng.apply_rules({"value": 2}) == {"g": "two"}
+    assert eng.apply_rules({"value": 1}) == {"g": "one"}
@@ -0,0 +1,92 @@
+"""Compact representation (__slots__ and interning) UT."""
+
+import os
+from types import MappingProxyType
+
+import pytest
+from arta import RulesEngine
+from arta.cache import InternPool
+from arta.condition import SimpleCondition, StandardCondition
+from arta.rule import Rule
+
+
+@pytest.mark.parametrize("klass", [Rule, StandardCondition, SimpleCondition])
+def test_slots(klass):
+    """Built-in classes have no instance __dict__."""
+    assert "__dict__" not in dir(klass)
+
+
+def test_intern_pool():
+    """Equal frozen values are shared, values which can be modified are never shared."""
+    pool = InternPool()
+    params_1 = pool.intern(MappingProxyType({"course_id": "english", "levels": (1, 2)}))
+    params_2 = pool.intern(MappingProxyType({"levels": (1, 2), "course_id": "english"}))
+    params_3 = pool.intern(MappingProxyType({"course_id": "french", "levels": (1, 2)}))
+
+    assert params_1 is params_2
+    assert params_1 is not params_3
+    assert len(pool) == 2
+    assert pool.intern("".join(["input.", "age"])) is pool.intern("input.age")
+
+    for make_value in [lambda: {"course_id": "english"}, lambda: MappingProxyType({"levels": [1, 2]}), lambda: ([1],)]:
+        assert pool.intern(make_value()) is not pool.intern(make_value())
+    assert len(pool) == 2
+
+
+def add_tag(tags):
+    """Action function modifying its parameter."""
+    tags.append("x")
+    return tags
+
+
+def test_mutable_parameters_not_shared():
+    """Rules with equal mutable parameters don't share them (a modification never leaks into another rule)."""
+    rule = {"simple_condition": None, "action": "add_tag", "action_parameters": {"tags": ["a"]}}
+    config = {
+        "rules": {"default_rule_set": {"group_1": {"RULE": rule}, "group_2": {"RULE": rule}}},
+        "actions_source_modules": ["tests.unit.test_compact_rules"],
+    }
+    eng = RulesEngine(config_dict=config)
+
+    rule_1, rule_2 = eng.rules["default_rule_set"]["group_1"][0], eng.rules["default_rule_set"]["group_2"][0]
+    assert rule_1._action_parameters is not rule_2._action_parameters
+    with pytest.raises(TypeError):
+        rule_1._action_parameters["tags"] = []
+
+    for _ in range(2):
+        assert eng.apply_rules({"id": 1}) == {"group_1": ["a", "x"], "group_2": ["a", "x"]}
+
+
+def test_shared_structures(base_config_path):
+    """Parameters, expressions and condition instances are shared between rules and rule sets."""
+    eng = RulesEngine(config_path=os.path.join(base_config_path, "good_conf"))
+
+    default_email = eng.rules["default_rule_set"]["email"][0]
+    second_email = eng.rules["second_rule_set"]["email"][0]
+    assert default_email._action_parameters is second_email._action_parameters
+
+    default_adm_ko = eng.rules["default_rule_set"]["admission"][1]
+    second_adm_ko = eng.rules["second_rule_set"]["admission"][1]
+    assert default_adm_ko._action_parameters is second_adm_ko._action_parameters
+
+
+def test_shared_simple_conditions():
+    """Simple condition instances with the same id are shared between rules and rule sets."""
+    rule = {"simple_condition": 'input.power=="fly"', "action": "set_admission", "action_parameters": {"value": True}}
+    config = {
+        "rules": {
+            "set_1": {"group_1": {"RULE_1": rule, "RULE_2": rule}},
+            "set_2": {"group_1": {"RULE_1": rule}},
+        },
+        "actions_source_modules": ["tests.examples.code.actions"],
+    }
+    eng = RulesEngine(config_dict=config)
+
+    instances = [
+        rule._condition_instances['input.power=="fly"']
+        for rules in (eng.rules["set_1"], eng.rules["set_2"])
+        for rule in rules["group_1"]
+    ]
+    assert len(instances) == 3
+    assert instances[0] is instances[1] is instances[2]
+    assert eng.apply_rules({"power": "fly"}, rule_set="set_2") == {"group_1": {"admission": True}}
@@ -0,0 +1,123 @@
+"""Constant folding UT."""
+
+import os
+
+import pytest
+from arta import RulesEngine
+from arta.utils import is_static_parameter, split_static_parameters
+
+
+@pytest.mark.parametrize(
+    "parameter, expected",
+    [
+        ("french", True),
+        (10, True),
+        (["strength", "fly"], True),
+        ({"key": "input.age"}, True),
+        ("input.age", False),
+        ("output.course.course_id", False),
+        (["fly", "input.power"], False),
+    ],
+)
+def test_is_static_parameter(parameter, expected):
+    """Utils function unit test."""
+    assert is_static_parameter(parameter) is expected
+
+
+def test_split_static_parameters():
+    """Utils function unit test."""
+    authorized_powers = ["strength", "fly"]
+    static, dynamic = split_static_parameters({"powers": authorized_powers, "candidate": "input.powers"})
+
+    assert static == {"powers": ["strength", "fly"]}
+    assert static["powers"] is not authorized_powers
+    assert dynamic == {"candidate": "input.powers"}
+
+
+def test_folding_and_pruning(base_config_path):
+    """Static pure conditions are evaluated at build time, always False rules are pruned."""
+    eng = RulesEngine(config_path=os.path.join(base_config_path, "constant_folding"))
+
+    rule_ids = {
+        group_id: [rule._rule_id for rule in rules] for group_id, rules in eng.rules["default_rule_set"].items()
+    }
+    assert rule_ids == {"course": ["COURSE_FRENCH", "COURSE_INTERNATIONAL"], "email": ["EMAIL_COOK"]}
+
+    french_campus = eng.rules["default_rule_set"]["course"][0]._condition_instances["IS_FRENCH_CAMPUS"]
+    speaking_french = eng.rules["default_rule_set"]["course"][0]._condition_instances["IS_SPEAKING_FRENCH"]
+    assert french_campus.folded_result is True
+    assert speaking_french.folded_result is None
+
+    result = eng.apply_rules({"language": "french", "favorite_meal": "Spinach"}, verbose=True)
+    assert result == {
+        "verbosity": {
+            "rule_set": "default_rule_set",
+            "results": [
+                {
+                    "rule_group": "course",
+                    "verified_conditions": {
+                        "condition": {
+                            "expression": "IS_FRENCH_CAMPUS and IS_SPEAKING_FRENCH",
+                            "values": {"IS_FRENCH_CAMPUS": True, "IS_SPEAKING_FRENCH": True},
+                        },
+                        "simple_condition": {"expression": None, "values": {}},
+                    },
+                    "activated_rule": "COURSE_FRENCH",
+                    "action_result": {"course_id": "french"},
+                },
+                {
+                    "rule_group": "email",
+                    "verified_conditions": {
+                        "condition": {"expression": "not(IS_GERMAN_CAMPUS)", "values": {"IS_GERMAN_CAMPUS": False}},
+                        "simple_condition": {"expression": None, "values": {}},
+                    },
+                    "activated_rule": "EMAIL_COOK",
+                    "action_result": True,
+                },
+            ],
+        },
+        "course": {"course_id": "french"},
+        "email": True,
+    }
+    assert eng.apply_rules({"language": "german", "favorite_meal": None}) == {
+        "course": {"course_id": "international"},
+        "email": False,
+    }
+
+
+def add_tag(tags):
+    """Action function modifying its parameter."""
+    tags.append("x")
+    return tags
+
+
+def has_tags(tags):
+    """Validation function modifying its parameter."""
+    tags.append("x")
+    return len(tags) == 2
+
+
+def test_mutable_static_parameters():
+    """Mutable static values are copied on each call: functions modifying them never modify the configuration."""
+    config = {
+        "conditions": {
+            "HAS_TAGS": {
+                "description": "Has tags?",
+                "validation_function": "has_tags",
+                "condition_parameters": {"tags": ["a"]},
+            },
+        },
+        "rules": {
+            "default_rule_set": {
+                "tags": {
+                    "RULE": {"condition": "HAS_TAGS", "action": "add_tag", "action_parameters": {"tags": ["a"]}},
+                }
+            }
+        },
+        "conditions_source_modules": ["tests.unit.test_constant_folding"],
+        "actions_source_modules": ["tests.unit.test_constant_folding"],
+    }
+    eng = RulesEngine(config_dict=config)
+
+    for _ in range(3):
+        assert eng.apply_rules({"id": 1}) == {"tags": ["a", "x"]}
@@ -0,0 +1,151 @@
+"""Reference datasets UT."""
+
+import gc
+import weakref
+
+import pytest
+from arta import EngineRegistry, RulesEngine
+from arta.dataset import BloomFilter, ReferenceDataset, _hash, write_index
+from arta.exceptions import UnsupportedExpressionError
+
+
+def dataset_config(path, simple_condition="input.customer_id in @sanctioned_ids", **options):
+    """Return a configuration whose first rule searches the customer in a reference dataset."""
+    return {
+        "rules": {
+            "default_rule_set": {
+                "admission": {
+                    "SANCTIONED": {
+                        "simple_condition": simple_condition,
+                        "action": "set_admission",
+                        "action_parameters": {"value": "KO"},
+                    },
+                    "DEFAULT": {
+                        "simple_condition": None,
+                        "action": "set_admission",
+                        "action_parameters": {"value": "OK"},
+                    },
+                }
+            }
+        },
+        "actions_source_modules": ["tests.examples.code.actions"],
+        "parsing_error_strategy": "ignore",
+        "reference_datasets": {"sanctioned_ids": {"path": str(path), **options}},
+    }
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    """CSV file of customers (the ids are in the second column)."""
+    path = tmp_path / "customers.csv"
+    path.write_text("name,id\nAlice,C-001\nBob,C-002\nCarol,42\nDave,C-001\nÉlodie,C-é\n", encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize("bloom_filter", [False, True])
+@pytest.mark.parametrize(
+    "input_data, good_results",
+    [
+        ({"customer_id": "C-001"}, {"admission": {"admission": "KO"}}),
+        ({"customer_id": "C-é"}, {"admission": {"admission": "KO"}}),
+        ({"customer_id": 42}, {"admission": {"admission": "KO"}}),
+        ({"customer_id": "C-003"}, {"admission": {"admission": "OK"}}),
+        ({"customer_id": "Alice"}, {"admission": {"admission": "OK"}}),
+        ({"customer_id": None}, {"admission": {"admission": "OK"}}),
+        ({"customer_id": 4.2}, {"admission": {"admission": "OK"}}),
+        ({"name": "Alice"}, {"admission": {"admission": "OK"}}),
+    ],
+)
+def test_dataset_condition(csv_path, bloom_filter, input_data, good_results):
+    """Values are searched in the column of the CSV file (other types than strings and integers are ignored)."""
+    eng = RulesEngine(config_dict=dataset_config(csv_path, column="id", bloom_filter=bloom_filter))
+
+    assert eng.apply_rules(input_data) == good_results
+
+
+def test_not_in_and_relative_path(csv_path, monkeypatch):
+    """'not in' is supported, relative paths are resolved from the current directory with 'config_dict' (first column)."""
+    config = dataset_config(csv_path.name, "input.customer_id not in @sanctioned_ids")
+
+    with pytest.raises(FileNotFoundError):
+        RulesEngine(config_dict=config)
+
+    monkeypatch.chdir(csv_path.parent)
+    eng = RulesEngine(config_dict=config)
+    assert eng.apply_rules({"customer_id": "Alice"}) == {"admission": {"admission": "OK"}}
+    assert eng.apply_rules({"customer_id": "C-001"}) == {"admission": {"admission": "KO"}}
+
+
+def test_index_file(tmp_path):
+    """Index files are mapped directly, files which are not index files raise an error."""
+    index_path = tmp_path / "ids.idx"
+    assert write_index(["a", "b", "a", 1], index_path) == 3
+
+    eng = RulesEngine(config_dict=dataset_config(index_path, bloom_filter=True))
+    assert eng.apply_rules({"customer_id": 1}) == {"admission": {"admission": "KO"}}
+    assert eng.dataset_info() == {"sanctioned_ids": {"size": 3, "path": str(index_path), "bloom_filter": True}}
+
+    not_index_path = tmp_path / "ids.txt"
+    not_index_path.write_text("a\nb\n")
+    with pytest.raises(ValueError, match="is not an index file"):
+        RulesEngine(config_dict=dataset_config(not_index_path))
+
+
+def test_hash_collisions(tmp_path):
+    """Values with the same hash are compared (binary search of the first one)."""
+    index_path = tmp_path / "ids.idx"
+    values = [f"value_{idx}" for idx in range(1000)]
+    write_index(values, index_path)
+    dataset = ReferenceDataset("ids", index_path)
+
+    assert len(dataset) == 1000
+    assert all(value in dataset for value in values)
+    assert not any(f"other_{idx}" in dataset for idx in range(1000))
+    with pytest.raises(TypeError):
+        _ = ["value_0"] in dataset
+
+
+def test_bloom_filter():
+    """No false negatives, few false positives."""
+    bloom = BloomFilter((_hash(str(idx).encode()) for idx in range(1000)), 1000)
+
+    assert all(_hash(str(idx).encode()) in bloom for idx in range(1000))
+    assert sum(_hash(str(idx).encode()) in bloom for idx in range(1000, 11000)) < 300
+
+
+@pytest.mark.parametrize(
+    "simple_condition",
+    ["input.customer_id in @unknown", "input.customer_id==@sanctioned_ids", "len(@sanctioned_ids)>1"],
+)
+def test_unsupported(csv_path, simple_condition):
+    """Unknown datasets and other operators than 'in' and 'not in' raise an error."""
+    with pytest.raises(UnsupportedExpressionError):
+        RulesEngine(config_dict=dataset_config(csv_path, simple_condition))
+
+
+def test_incremental_rebuild(csv_path):
+    """Unchanged datasets and rules are reused, a modified file is loaded again."""
+    config = dataset_config(csv_path, column="id")
+    eng = RulesEngine(config_dict=config)
+
+    new_eng = RulesEngine(config_dict=config, previous=eng)
+    assert new_eng._datasets["sanctioned_ids"] is eng._datasets["sanctioned_ids"]
+    assert new_eng.build_info()["reused_rules"] == 2
+
+    csv_path.write_text("name,id\nZoe,C-003\n", encoding="utf-8")
+    new_eng = RulesEngine(config_dict=config, previous=eng)
+    assert new_eng.build_info()["reused_rules"] == 0
+    assert new_eng.apply_rules({"customer_id": "C-003"}) == {"admission": {"admission": "KO"}}
+    assert new_eng.apply_rules({"customer_id": "C-001"}) == {"admission": {"admission": "OK"}}
+
+
+def test_release_with_engine(csv_path):
+    """Datasets (memory-mapped files) of an evicted engine are released with the intern pool, not kept by expressions."""
+    registry = EngineRegistry(
+        lambda tenant: dataset_config(csv_path, column="id"), max_engines=1, max_interned_values=1
+    )
+    index_file = weakref.ref(registry.get("tenant_a")._datasets["sanctioned_ids"]._mmap)
+
+    assert registry.apply_rules("tenant_b", {"customer_id": "C-001"}) == {"admission": {"admission": "KO"}}
+    gc.collect()
+    assert index_file() is None
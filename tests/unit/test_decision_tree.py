@@ -0,0 +1,181 @@
+"""Decision tree UT (differential tests against the linear evaluation)."""
+
+import os
+import random
+
+import pytest
+from arta import RulesEngine
+
+OPERATORS = ["==", "!=", "<", "<=", ">", ">="]
+CATEGORIES = ["red", "green", "blue"]
+NUM_FIELDS = ["num_a", "num_b", "num_c"]
+CAT_FIELDS = ["cat_a", "cat_b"]
+
+
+def simple_config(seed, groups=4, rules_per_group=15, parsing_error_strategy="ignore"):
+    """Return a configuration whose rules only use simple conditions on a few fields."""
+    rand = random.Random(seed)
+    rules = {}
+
+    for group_idx in range(groups):
+        group = {}
+        for rule_idx in range(rules_per_group):
+            atoms = [
+                f"input.{rand.choice(NUM_FIELDS)}{rand.choice(OPERATORS)}{rand.randrange(-2, 12)}",
+                f"input.{rand.choice(NUM_FIELDS)}{rand.choice(OPERATORS)}{rand.randrange(0, 20) / 2}",
+                f'input.{rand.choice(CAT_FIELDS)}{rand.choice(["==", "!="])}"{rand.choice(CATEGORIES)}"',
+                f"input.flag{rand.choice(['==', '!='])}{rand.choice(['True', 'None'])}",
+                f"input.{rand.choice(CAT_FIELDS)} {rand.choice(['in', 'not in'])} {rand.sample(CATEGORIES, 2)}",
+                f"between(input.{rand.choice(NUM_FIELDS)}, {rand.randrange(-2, 5)}, {rand.randrange(5, 12)})",
+                f"{rand.randrange(-2, 12)}<input.{rand.choice(NUM_FIELDS)}",
+            ]
+            picked = rand.sample(atoms, rand.randrange(1, 4))
+            expr = picked[0]
+            for atom in picked[1:]:
+                expr = f"{expr} {rand.choice(['and', 'or', 'and not'])} {atom}"
+            group[f"RULE_{group_idx}_{rule_idx}"] = {
+                "simple_condition": expr,
+                "action": "set_admission",
+                "action_parameters": {"value": f"{group_idx}_{rule_idx}"},
+            }
+        rules[f"group_{group_idx}"] = group
+
+    return {
+        "rules": {"default_rule_set": rules},
+        "actions_source_modules": ["tests.examples.code.actions"],
+        "parsing_error_strategy": parsing_error_strategy,
+    }
+
+
+def random_inputs(seed, count=150):
+    """Return inputs including missing keys and unexpected types."""
+    rand = random.Random(seed)
+    inputs = []
+
+    for _ in range(count):
+        data = {field: rand.choice([rand.randrange(-3, 13), rand.randrange(0, 20) / 2]) for field in NUM_FIELDS}
+        data.update({field: rand.choice([*CATEGORIES, "other"]) for field in CAT_FIELDS})
+        data["flag"] = rand.choice([True, False, None])
+        draw = rand.random()
+        if draw < 0.05:
+            del data[rand.choice(NUM_FIELDS)]
+        elif draw < 0.1:
+            data[rand.choice(NUM_FIELDS)] = rand.choice(["text", None, float("nan"), [1]])
+        inputs.append(data)
+
+    return inputs
+
+
+def run(engine, input_data, **kwargs):
+    """Return the results, or the raised exception type and message."""
+    try:
+        return engine.apply_rules(input_data, **kwargs)
+    except Exception as error:
+        return type(error), str(error)
+
+
+@pytest.mark.parametrize("parsing_error_strategy", ["ignore", "raise", "default_value"])
+def test_same_results(parsing_error_strategy):
+    """Compiled groups give the same results as the linear evaluation."""
+    for seed in range(3):
+        config = simple_config(seed, parsing_error_strategy=parsing_error_strategy)
+        linear = RulesEngine(config_dict=config)
+        compiled = RulesEngine(config_dict=config)
+
+        report = compiled.compile_decision_trees()
+        assert all(group["compiled"] for group in report.values())
+
+        for input_data in random_inputs(seed):
+            for verbose in (False, True):
+                expected = run(linear, input_data, verbose=verbose)
+                assert run(compiled, input_data, verbose=verbose) == expected
+
+            ignored_rules = {f"RULE_0_{idx}" for idx in range(0, 15, 2)}
+            assert run(compiled, input_data, ignored_rules=ignored_rules) == run(
+                linear, input_data, ignored_rules=ignored_rules
+            )
+
+
+def test_tree_decision():
+    """The tree finds the first matching rule, or can't decide on unexpected values."""
+    config = {
+        "rules": {
+            "default_rule_set": {
+                "admission": {
+                    "ADM_KO": {
+                        "simple_condition": "input.age<18",
+                        "action": "set_admission",
+                        "action_parameters": {"value": False},
+                    },
+                    "ADM_VIP": {
+                        "simple_condition": 'input.language=="french" and input.age>=60',
+                        "action": "set_admission",
+                        "action_parameters": {"value": "vip"},
+                    },
+                    "ADM_OK": {
+                        "simple_condition": "input.age>=18",
+                        "action": "set_admission",
+                        "action_parameters": {"value": True},
+                    },
+                }
+            }
+        },
+        "actions_source_modules": ["tests.examples.code.actions"],
+    }
+    engine = RulesEngine(config_dict=config)
+    report = engine.compile_decision_trees()
+
+    assert report["default_rule_set/admission"] == {"compiled": True, "rules": 3, "nodes": 2, "depth": 2}
+    assert engine.decision_tree_info() == report
+
+    tree = engine._decision_trees[("default_rule_set", "admission")]
+    assert tree.find_first_match({"age": 10, "language": "french"}) == 0
+    assert tree.find_first_match({"age": 60, "language": "french"}) == 1
+    assert tree.find_first_match({"age": 60, "language": "english"}) == 2
+    assert tree.find_first_match({"age": "60", "language": "french"}) is None
+    assert tree.find_first_match({"language": "french"}) is None
+
+    assert engine.apply_rules({"age": 70, "language": "french"}) == {"admission": {"admission": "vip"}}
+
+
+def test_not_compiled(base_config_path):
+    """Groups using other conditions or expressions are reported and evaluated linearly."""
+    engine = RulesEngine(config_path=os.path.join(base_config_path, "good_conf"))
+    report = engine.compile_decision_trees(min_rules=1)
+
+    assert len(report) > 0
+    assert not any(group["compiled"] for group in report.values())
+    assert "only simple conditions" in report["default_rule_set/admission"]["reason"]
+
+    engine = RulesEngine(config_path=os.path.join(base_config_path, "simple_condition/math"))
+    report = engine.compile_decision_trees(min_rules=1)
+    assert any("not a comparison" in group.get("reason", "") for group in report.values())
+
+    config = simple_config(0, groups=1)
+    engine = RulesEngine(config_dict={**config, "rule_activation_mode": "many_by_group"})
+    assert engine.compile_decision_trees() == {
+        "default_rule_set/group_0": {"compiled": False, "reason": "Only the ONE_BY_GROUP activation mode is supported."}
+    }
+
+    engine = RulesEngine(config_dict=config)
+    assert "more than 1 nodes" in engine.compile_decision_trees(max_nodes=1)["default_rule_set/group_0"]["reason"]
+    assert engine.compile_decision_trees(min_rules=100)["default_rule_set/group_0"]["compiled"] is False
+    assert engine._decision_trees == {}
+
+
+def test_instrumented_requests():
+    """Requests with statistics record every evaluated rule (no shortcut)."""
+    config = simple_config(1, groups=1)
+    linear = RulesEngine(config_dict=config)
+    compiled = RulesEngine(config_dict=config)
+    compiled.compile_decision_trees()
+
+    for engine in (linear, compiled):
+        engine.enable_stats()
+        for input_data in random_inputs(1, count=20):
+            run(engine, input_data)
+
+    def counts(engine):
+        return {key: (val["evaluations"], val["activations"]) for key, val in engine.stats()["rules"].items()}
+
+    assert counts(compiled) == counts(linear)
@@ -0,0 +1,44 @@
+"""Engine freezing UT."""
+
+import gc
+import os
+
+import pytest
+from arta import RulesEngine
+
+INPUT_DATA = {"age": None, "language": "french", "powers": ["strength", "fly"], "favorite_meal": "Spinach"}
+
+
+def test_freeze(base_config_path):
+    """A frozen engine is read-only and gives the same results."""
+    eng = RulesEngine(config_path=os.path.join(base_config_path, "good_conf"))
+    expected = eng.apply_rules(INPUT_DATA, rule_set="default_rule_set", verbose=True)
+
+    assert not eng.is_frozen
+    eng.freeze(gc_freeze=False)
+    assert eng.is_frozen
+
+    assert eng.apply_rules(INPUT_DATA, rule_set="default_rule_set", verbose=True) == expected
+
+    with pytest.raises(TypeError):
+        eng.rules["new_rule_set"] = {}
+    with pytest.raises(TypeError):
+        eng.rules["default_rule_set"]["admission"] = []
+    assert isinstance(eng.rules["default_rule_set"]["admission"], tuple)
+
+    # Idempotent
+    rules = eng.rules
+    eng.freeze(gc_freeze=False)
+    assert eng.rules is rules
+
+
+def test_freeze_gc(base_config_path):
+    """Objects are moved to the permanent generation of the garbage collector."""
+    eng = RulesEngine(config_path=os.path.join(base_config_path, "good_conf"))
+
+    try:
+        eng.freeze()
+        assert gc.get_freeze_count() > 0
+        assert eng.apply_rules(INPUT_DATA, rule_set="default_rule_set")["admission"] == {"admission": True}
+    finally:
+        gc.unfreeze()
@@ -0,0 +1,153 @@
+"""Execution hooks and tracing UT."""
+
+import json
+import os
+
+import pytest
+from arta import RulesEngine
+from arta.exceptions import RuleExecutionError
+from arta.hooks import EngineHook, InMemorySpanExporter, JsonLinesSpanExporter, TracingHook
+
+INPUT_DATA = {"age": None, "language": "french", "powers": ["strength", "fly"], "favorite_meal": "Spinach"}
+
+
+class RecordingHook(EngineHook):
+    """Keep the name of the called callbacks."""
+
+    def __init__(self):
+        self.calls = []
+
+    def on_rule_set_start(self, rule_set, start_ns):
+        self.calls.append(("rule_set_start", rule_set))
+
+    def on_rule_set_end(self, rule_set, start_ns, duration_ns, error):
+        self.calls.append(("rule_set_end", rule_set, error))
+
+    def on_group_start(self, rule_set, group_id, start_ns):
+        self.calls.append(("group_start", group_id))
+
+    def on_group_end(self, rule_set, group_id, start_ns, duration_ns):
+        self.calls.append(("group_end", group_id))
+
+    def on_rule_evaluated(self, rule_set, group_id, rule_id, activated, start_ns, duration_ns):
+        self.calls.append(("rule", rule_id, activated))
+
+    def on_condition_verified(self, rule_set, group_id, rule_id, condition_id, result, start_ns, duration_ns):
+        self.calls.append(("condition", rule_id, condition_id, result))
+
+    def on_action_executed(self, rule_set, group_id, rule_id, action, start_ns, duration_ns):
+        self.calls.append(("action", rule_id, action))
+
+
+def test_hook_callbacks(base_config_path):
+    """Callbacks are called in the evaluation order."""
+    eng = RulesEngine(config_path=os.path.join(base_config_path, "good_conf"))
+    hook = RecordingHook()
+    eng.add_hook(hook)
+
+    result = eng.apply_rules(INPUT_DATA, rule_set="default_rule_set")
+
+    assert hook.calls[0] == ("rule_set_start", "default_rule_set")
+    assert hook.calls[-1] == ("rule_set_end", "default_rule_set", None)
+    assert [call[1] for call in hook.calls if call[0] == "group_start"] == ["admission", "course", "email"]
+    assert ("rule", "ADM_OK", True) in hook.calls
+    assert ("action", "ADM_OK", "set_admission") in hook.calls
+    assert ("condition", "COURSE_ENGLISH", "IS_SPEAKING_ENGLISH", False) in hook.calls
+
+    # Children are reported before their rule
+    assert hook.calls.index(("action", "ADM_OK", "set_admission")) < hook.calls.index(("rule", "ADM_OK", True))
+
+    # Same results as without hooks
+    eng.remove_hook(hook)
+    assert eng.apply_rules(INPUT_DATA, rule_set="default_rule_set") == result
+
+    with pytest.raises(ValueError):
+        eng.remove_hook(hook)
+
+
+def test_hook_error():
+    """The rule set end callback receives the raised error."""
+
+    def failing_action():
+        raise ValueError("boom")
+
+    eng = RulesEngine(
+        rules_dict={"group": {"RULE": {"condition": None, "condition_parameters": None, "action": failing_action}}}
+    )
+    hook = RecordingHook()
+    eng.add_hook(hook)
+
+    with pytest.raises(RuleExecutionError):
+        eng.apply_rules({"age": 5})
+
+    last_call = hook.calls[-1]
+    assert last_call[0] == "rule_set_end"
+    assert isinstance(last_call[2], RuleExecutionError)
+    assert ("group_end", "group") not in hook.calls
+
+
+def test_tracing_in_memory(base_config_path):
+    """One trace per request: rule set > groups > rules > conditions/actions."""
+    eng = RulesEngine(config_path=os.path.join(base_config_path, "good_conf"))
+    exporter = InMemorySpanExporter(max_traces=2)
+    eng.add_hook(TracingHook(exporter))
+
+    for _ in range(3):
+        eng.apply_rules(INPUT_DATA, rule_set="default_rule_set")
+
+    traces = exporter.get_traces()
+    assert len(traces) == 2
+
+    spans = traces[-1]
+    by_id = {span.span_id: span for span in spans}
+    root = spans[0]
+
+    assert root.kind == "rule_set"
+    assert root.parent_id is None
+    assert len({span.trace_id for span in spans}) == 1
+
+    groups = [span for span in spans if span.kind == "group"]
+    assert [span.name for span in groups] == ["admission", "course", "email"]
+    assert all(span.parent_id == root.span_id and span.duration_ns > 0 for span in groups)
+
+    for span in spans:
+        if span.kind == "rule":
+            assert by_id[span.parent_id].kind == "group"
+        elif span.kind in ("condition", "action"):
+            parent = by_id[span.parent_id]
+            assert parent.kind == "rule"
+            assert parent.name == span.attributes["rule_id"]
+
+    action_span = next(span for span in spans if span.kind == "action" and span.name == "set_admission")
+    assert by_id[action_span.parent_id].attributes["activated"] is True
+
+    exporter.clear()
+    assert exporter.get_spans() == []
+
+
+def test_tracing_slow_threshold(base_config_path):
+    """Only slow traces are exported."""
+    eng = RulesEngine(config_path=os.path.join(base_config_path, "good_conf"))
+    exporter = InMemorySpanExporter()
+    eng.add_hook(TracingHook(exporter, slow_threshold_ms=60_000))
+
+    eng.apply_rules(INPUT_DATA, rule_set="default_rule_set")
+
+    assert exporter.get_traces() == []
+
+
+def test_tracing_json_lines(base_config_path, tmp_path):
+    """Spans are appended to a JSON lines file."""
+    path = tmp_path / "spans.jsonl"
+    eng = RulesEngine(config_path=os.path.join(base_config_path, "good_conf"))
+    eng.add_hook(TracingHook(JsonLinesSpanExporter(path)))
+
+    eng.apply_rules(INPUT_DATA, rule_set="default_rule_set")
+    eng.apply_rules(INPUT_DATA, rule_set="default_rule_set")
+
+    spans = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    roots = [span for span in spans if span["kind"] == "rule_set"]
+
+    assert len(roots) == 2
+    assert roots[0]["trace_id"] != roots[1]["trace_id"]
+    assert {"span_id", "parent_id", "name", "start_time_ns", "duration_ns", "attributes"} <= set(spans[0])
@@ -0,0 +1,143 @@
+"""Incremental rebuild UT."""
+
+import copy
+import os
+import sys
+
+import pytest
+from arta import RulesEngine
+from arta.config import load_config
+
+INPUT_DATA = {"age": None, "language": "english", "powers": ["strength", "fly"], "favorite_meal": "Spinach"}
+
+
+@pytest.fixture
+def config_dict(base_config_path):
+    """Configuration of good_conf as a dictionary."""
+    return load_config(os.path.join(base_config_path, "good_conf"))
+
+
+def get_rules(engine):
+    """Return the rules of an engine (k: (rule set, group, rule id))."""
+    return {
+        (set_id, group_id, rule._rule_id): rule
+        for set_id, groups in engine.rules.items()
+        for group_id, rules in groups.items()
+        for rule in rules
+    }
+
+
+def test_unchanged_config(config_dict):
+    """All the rules and conditions are reused."""
+    first = RulesEngine(config_dict=config_dict)
+    second = RulesEngine(config_dict=copy.deepcopy(config_dict), previous=first)
+
+    info = second.build_info()
+    assert info["incremental"] is True
+    assert info["built_rules"] == 0
+    assert info["built_conditions"] == 0
+    assert info["reused_rules"] == len(get_rules(first))
+    assert info["reloaded_modules"] == []
+
+    for key, rule in get_rules(second).items():
+        assert rule is get_rules(first)[key]
+
+
+def test_changed_rule(config_dict):
+    """Only the modified rule is rebuilt."""
+    first = RulesEngine(config_dict=config_dict)
+
+    new_config = copy.deepcopy(config_dict)
+    new_config["rules"]["default_rule_set"]["admission"]["ADM_OK"]["action_parameters"]["value"] = "maybe"
+    second = RulesEngine(config_dict=new_config, previous=first)
+
+    assert second.build_info()["built_rules"] == 1
+
+    first_rules, second_rules = get_rules(first), get_rules(second)
+    for key, rule in second_rules.items():
+        if key == ("default_rule_set", "admission", "ADM_OK"):
+            assert rule is not first_rules[key]
+        else:
+            assert rule is first_rules[key]
+
+    assert second.apply_rules(INPUT_DATA, rule_set="default_rule_set")["admission"] == {"admission": "maybe"}
+    assert first.apply_rules(INPUT_DATA, rule_set="default_rule_set")["admission"] == {"admission": True}
+
+
+def test_changed_condition(config_dict):
+    """Only the rules depending on a modified condition are rebuilt."""
+    first = RulesEngine(config_dict=config_dict)
+
+    new_config = copy.deepcopy(config_dict)
+    new_config["conditions"]["IS_SPEAKING_ENGLISH"]["condition_parameters"]["value"] = "french"
+    second = RulesEngine(config_dict=new_config, previous=first)
+
+    info = second.build_info()
+    assert info["built_conditions"] == 1
+    assert info["reused_conditions"] == len(config_dict["conditions"]) - 1
+
+    for key, rule in get_rules(second).items():
+        uses_condition = "IS_SPEAKING_ENGLISH" in rule._condition_instances
+        assert (rule is get_rules(first)[key]) is not uses_condition
+
+    # Same results as a full build
+    full = RulesEngine(config_dict=new_config)
+    for data in (INPUT_DATA, {**INPUT_DATA, "language": "french", "age": 20}):
+        for rule_set in ("default_rule_set", "second_rule_set"):
+            assert second.apply_rules(data, rule_set=rule_set) == full.apply_rules(data, rule_set=rule_set)
+
+
+def test_module_reload(config_dict, tmp_path, monkeypatch):
+    """Unchanged source modules are not re-imported, modified ones are reloaded."""
+    module_name = "incremental_test_actions"
+    module_path = tmp_path / f"{module_name}.py"
+    module_path.write_text("def set_admission(value, **kwargs):\n    return {'admission': value}\n", encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    config_dict["actions_source_modules"].append(module_name)
+
+    try:
+        first = RulesEngine(config_dict=config_dict)
+        second = RulesEngine(config_dict=config_dict, previous=first)
+        assert second.build_info()["reloaded_modules"] == []
+
+        module_path.write_text(
+            "def set_admission(value, **kwargs):\n    return {'admission': f'reloaded {value}'}\n", encoding="utf-8"
+        )
+        later = os.stat(module_path).st_mtime_ns + 10**9
+        os.utime(module_path, ns=(later, later))
+
+        third = RulesEngine(config_dict=config_dict, previous=second)
+        info = third.build_info()
+
+        assert info["reloaded_modules"] == [module_name]
+        # Rules using the reloaded function are rebuilt
+        assert info["built_rules"] == sum(
+            rule.get("action") == "set_admission"
+            for groups in config_dict["rules"].values()
+            for rules in groups.values()
+            for rule in rules.values()
+        )
+        assert third.apply_rules(INPUT_DATA, rule_set="default_rule_set")["admission"] == {"admission": "reloaded True"}
+    finally:
+        sys.modules.pop(module_name, None)
+
+
+def test_frozen_previous(config_dict):
+    """A frozen engine can't be reused: full build."""
+    first = RulesEngine(config_dict=config_dict)
+    first.freeze(gc_freeze=False)
+    second = RulesEngine(config_dict=config_dict, previous=first)
+
+    info = second.build_info()
+    assert info["incremental"] is False
+    assert info["reused_rules"] == 0
+    assert info["built_rules"] == len(get_rules(first))
+
+
+def test_previous_with_rules_dict(config_dict):
+    """The rules dict mode can't be rebuilt incrementally."""
+    first = RulesEngine(config_dict=config_dict)
+
+    with pytest.raises(ValueError):
+        RulesEngine(rules_dict={"admission": {}}, previous=first)
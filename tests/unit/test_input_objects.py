@@ -0,0 +1,152 @@
+"""Input data which are not dictionaries (dataclasses, Pydantic models, objects) UT."""
+
+from __future__ import annotations
+
+import copy
+from dataclasses import dataclass, field
+from typing import Any
+
+import pytest
+from arta import RulesEngine
+from arta.path import get_item, register_accessor
+from pydantic import BaseModel
+
+
+@dataclass
+class Item:
+    """Item of a basket."""
+
+    price: float
+
+
+@dataclass
+class Customer:
+    """Customer with a basket (dataclass)."""
+
+    customer_id: str
+    age: int
+    items: list[Item] = field(default_factory=list)
+    _secret: int = 1
+
+
+class CustomerModel(BaseModel):
+    """Customer with a basket (Pydantic model)."""
+
+    customer_id: str
+    age: int
+    items: list[dict[str, Any]] = []
+
+
+class NoCopy:
+    """Object which can't be copied."""
+
+    def __init__(self, age: int) -> None:
+        self.age = age
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> NoCopy:
+        raise RuntimeError("Not copied.")
+
+
+class Row:
+    """Object with its own accessor."""
+
+    def __init__(self, **fields: Any) -> None:
+        self.fields = fields
+
+    def get_field(self, key: str) -> Any:
+        return self.fields[key]
+
+
+CONFIG = {
+    "rules": {
+        "default_rule_set": {
+            "admission": {
+                "ADMITTED": {
+                    "simple_condition": "input.age>=18 and sum(input.items[*].price)>100",
+                    "action": "set_admission",
+                    "action_parameters": {"value": "OK"},
+                },
+                "DEFAULT": {
+                    "simple_condition": None,
+                    "action": "set_admission",
+                    "action_parameters": {"value": "KO"},
+                },
+            },
+            "summary": {
+                "ADMITTED": {
+                    "simple_condition": 'output.admission.admission=="OK"',
+                    "action": "set_admission",
+                    "action_parameters": {"value": "input.customer_id"},
+                },
+            },
+        }
+    },
+    "actions_source_modules": ["tests.examples.code.actions"],
+    "parsing_error_strategy": "ignore",
+}
+
+
+@pytest.mark.parametrize("copy_input", [None, True, False])
+@pytest.mark.parametrize(
+    "input_data, good_results",
+    [
+        (
+            Customer("C-001", 30, [Item(60), Item(50)]),
+            {"admission": {"admission": "OK"}, "summary": {"admission": "C-001"}},
+        ),
+        (Customer("C-002", 30, [Item(60)]), {"admission": {"admission": "KO"}, "summary": None}),
+        (
+            CustomerModel(customer_id="C-003", age=20, items=[{"price": 200}]),
+            {"admission": {"admission": "OK"}, "summary": {"admission": "C-003"}},
+        ),
+        (
+            {"customer_id": "C-004", "age": 20, "items": [Item(200)]},
+            {"admission": {"admission": "OK"}, "summary": {"admission": "C-004"}},
+        ),
+    ],
+)
+def test_input_objects(input_data, good_results, copy_input):
+    """Attributes are read without conversion, outputs are never written in the input data."""
+    eng = RulesEngine(config_dict=CONFIG)
+    original = copy.deepcopy(input_data)
+
+    assert eng.apply_rules(input_data, copy_input=copy_input) == good_results
+    assert input_data == original
+
+
+def test_zero_copy():
+    """Objects are only copied if 'copy_input' is True, dictionaries unless it is False."""
+    eng = RulesEngine(config_dict=CONFIG)
+
+    assert eng.apply_rules(NoCopy(30)) == {"admission": {"admission": "KO"}, "summary": None}
+    assert eng.apply_rules(NoCopy(30), copy_input=False) == {"admission": {"admission": "KO"}, "summary": None}
+    assert eng.apply_rules({"age": NoCopy(30)}, copy_input=False)["admission"] == {"admission": "KO"}
+    with pytest.raises(RuntimeError):
+        eng.apply_rules(NoCopy(30), copy_input=True)
+    with pytest.raises(RuntimeError):
+        eng.apply_rules({"age": NoCopy(30)})
+
+
+def test_accessors():
+    """Registered accessors come first, private attributes are never read, built-in types keep their behavior."""
+    register_accessor(Row, lambda row, key: row.get_field(key))
+    eng = RulesEngine(config_dict=CONFIG)
+
+    input_data = Row(customer_id="C-005", age=18, items=[Row(price=101)])
+    assert eng.apply_rules(input_data)["summary"] == {"admission": "C-005"}
+
+    with pytest.raises(KeyError):
+        get_item(Customer("C-006", 30), "_secret")
+    with pytest.raises(KeyError):
+        get_item(Customer("C-006", 30), "unknown")
+    with pytest.raises(TypeError):
+        get_item([1], "price")
+
+
+@pytest.mark.parametrize("input_data", ["customer", None, 42, ["customer"]])
+def test_wrong_input_data(input_data):
+    """Values of built-in types which are not dictionaries raise a TypeError."""
+    eng = RulesEngine(config_dict=CONFIG)
+
+    with pytest.raises(TypeError):
+        eng.apply_rules(input_data)
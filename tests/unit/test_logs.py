@@ -1,4 +1,5 @@
 import logging
+import warnings
 from pathlib import Path
 
 
@@ -28,3 +29,39 @@ def test_info_logs(base_config_path, caplog):
     eng.apply_rules(input_data, rule_set="default_rule_set")
 
     assert caplog.messages[-1] == "'4' rules were correctly evaluated against input data."
+
+
+def test_deprecation_warning_once():
+    """The 'input_data' deprecation warning is emitted once per rule, then counted."""
+
+    def old_action(input_data):
+        return input_data["age"]
+
+    eng = RulesEngine(
+        rules_dict={"group": {"RULE": {"condition": None, "condition_parameters": None, "action": old_action}}}
+    )
+
+    with warnings.catch_warnings(record=True) as records:
+        warnings.simplefilter("always")
+        for _ in range(3):
+            assert eng.apply_rules({"age": 5}) == {"group": 5}
+
+    assert [record.category for record in records] == [DeprecationWarning]
+    assert eng.diagnostics()["deprecated_input_data"] == {"default_rule_set/group/RULE": 3}
+
+    eng.reset_diagnostics()
+    assert eng.diagnostics()["deprecated_input_data"] == {}
+
+
+def test_ignored_condition_logged_once(base_config_path, caplog):
+    """Simple conditions ignored because of the parameter's type are logged once, then counted."""
+    caplog.set_level(logging.WARNING, logger="arta")
+    eng = RulesEngine(config_path=Path(base_config_path) / "simple_condition" / "ignore")
+    input_data = {"age": "old", "language": "french", "power": "strength", "favorite_meal": "Spinach"}
+
+    for _ in range(3):
+        eng.apply_rules(input_data)
+
+    warning_messages = [msg for msg in caplog.messages if "is ignored because of the parameter's type" in msg]
+    assert warning_messages == ["Condition 'input.age>=100' is ignored because of the parameter's type."]
+    assert eng.diagnostics()["ignored_condition"] == {"input.age>=100": 3}
@@ -0,0 +1,132 @@
+"""Extended data paths (list indexes and wildcards) UT."""
+
+import pytest
+from arta import RulesEngine
+from arta.codegen import generate_code
+from arta.exceptions import UnsupportedExpressionError
+from arta.path import PathAccessor, compile_path
+from arta.utils import get_value_in_nested_dict_from_path
+
+INPUT_DATA = {
+    "items": [{"price": 60, "tags": ["a"]}, {"price": 50, "tags": ["b", "c"]}, {"other": 1}],
+    "orders": [{"items": [{"price": 1}, {"price": 2}]}, {"items": []}, {"items": [{"price": 3}]}],
+}
+
+
+def path_config(simple_condition, action_parameters=None):
+    """Return a configuration whose first rule uses an extended data path."""
+    return {
+        "rules": {
+            "default_rule_set": {
+                "basket": {
+                    "BIG": {
+                        "simple_condition": simple_condition,
+                        "action": "set_admission",
+                        "action_parameters": action_parameters or {"value": "KO"},
+                    },
+                    "DEFAULT": {
+                        "simple_condition": None,
+                        "action": "set_admission",
+                        "action_parameters": {"value": "OK"},
+                    },
+                }
+            }
+        },
+        "actions_source_modules": ["tests.examples.code.actions"],
+        "parsing_error_strategy": "ignore",
+    }
+
+
+@pytest.mark.parametrize(
+    "path, good_value",
+    [
+        ("items[0].price", 60),
+        ("items[-2].tags[1]", "c"),
+        ("items[*].price", [60, 50]),
+        ("items[*].tags", [["a"], ["b", "c"]]),
+        ("items[*].tags[*]", ["a", "b", "c"]),
+        ("orders[*].items[*].price", [1, 2, 3]),
+        ("orders[1].items[*].price", []),
+    ],
+)
+def test_path_accessor(path, good_value):
+    """Indexes and wildcards are applied in one pass, nested wildcards are flattened, missing elements are skipped."""
+    assert get_value_in_nested_dict_from_path(path, INPUT_DATA) == good_value
+
+
+@pytest.mark.parametrize("path", ["items[3].price", "items[0].tags[0][0]", "orders[0][*]", "unknown[*].price"])
+def test_missing_path(path):
+    """Missing indexes (outside of a wildcard) and lists which are not lists raise a KeyError."""
+    with pytest.raises(KeyError):
+        get_value_in_nested_dict_from_path(path, INPUT_DATA)
+
+
+def test_compile_path():
+    """Paths without list index or wildcard keep the regular lookup, accessors are compiled once."""
+    assert compile_path("items.price") is None
+    assert compile_path("items[x].price") is None
+    assert compile_path("items[*].price") is compile_path("items[*].price")
+    assert compile_path("items[*].price").has_wildcard
+    assert not compile_path("items[0].price").has_wildcard
+
+
+@pytest.mark.parametrize(
+    "simple_condition, good_result",
+    [
+        ("sum(input.items[*].price)>100", "KO"),
+        ("sum(input.items[*].price)>110", "OK"),
+        ("count(input.items[*].price)==2 and max(input.items[*].price)==60", "KO"),
+        ("avg(input.items[*].price)==55 and min(input.items[*].price)==50", "KO"),
+        ("any(input.items[*].other)", "KO"),
+        ("all(input.items[*].price)", "KO"),
+        ("input.items[0].price>input.items[-1].other", "KO"),
+        ("count(input.orders[*].items[*].price)>3", "OK"),
+        ("max(input.orders[1].items[*].price)>0", "OK"),
+        ("sum(input.items)>0", "OK"),
+        ("sum(input.unknown[*].price)>0", "OK"),
+    ],
+)
+def test_path_condition(simple_condition, good_result):
+    """Lists of the wildcards are aggregated, wrong values are ignored (not a list, None, empty list)."""
+    eng = RulesEngine(config_dict=path_config(simple_condition))
+
+    assert eng.apply_rules(INPUT_DATA) == {"basket": {"admission": good_result}}
+
+
+def test_action_parameter():
+    """Extended paths are supported by the parameters of the actions."""
+    eng = RulesEngine(config_dict=path_config(None, {"value": "input.orders[*].items[*].price"}))
+
+    assert eng.apply_rules(INPUT_DATA) == {"basket": {"admission": [1, 2, 3]}}
+
+
+def test_path_read_once(monkeypatch):
+    """An extended path shared by simple conditions is read once per request."""
+    calls = []
+    accessor_call = PathAccessor.__call__
+
+    def counting_call(self, data):
+        calls.append(self.path)
+        return accessor_call(self, data)
+
+    monkeypatch.setattr(PathAccessor, "__call__", counting_call)
+    eng = RulesEngine(
+        config_dict=path_config("sum(input.items[*].price)>1000 or max(input.items[*].price)>1000 or input.x==1")
+    )
+
+    for _ in range(2):
+        calls.clear()
+        assert eng.apply_rules(INPUT_DATA) == {"basket": {"admission": "OK"}}
+        assert calls == ["items[*].price"]
+
+
+def test_unsupported():
+    """Aggregates need a data path, decision trees and generated code don't support extended paths."""
+    with pytest.raises(UnsupportedExpressionError):
+        RulesEngine(config_dict=path_config("sum(1)>1"))
+
+    eng = RulesEngine(config_dict=path_config("input.items[0].price==60"))
+    assert "is not supported" in eng.compile_decision_trees(min_rules=1)["default_rule_set/basket"]["reason"]
+
+    with pytest.raises(ValueError, match="list indexes or wildcards"):
+        generate_code(eng)
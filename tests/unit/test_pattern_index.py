@@ -0,0 +1,201 @@
+"""Pattern index UT (differential tests against the linear evaluation)."""
+
+import random
+import re
+
+import pytest
+from arta import RulesEngine
+from arta.pattern_index import AhoCorasick, get_literal
+
+KEYWORDS = ["refund", "fund", "un", "late", "latest", "delivery", "re.f", "a b", "été", ""]
+REGEXES = [r"^re", r"d\b", r"[0-9]{2}", r"(?i)LATE", r"(un|fu)nd$", r"(.)\1"]
+WORDS = ["refund", "late", "latest", "delivery", "un", "fun", "re.fund", "a b", "été", "42", "RE", "xx", "Late"]
+
+
+def pattern_config(seed, rules_per_group=30, rule_activation_mode="one_by_group", parsing_error_strategy="ignore"):
+    """Return a configuration whose rules search keywords and patterns in a few text fields."""
+    rand = random.Random(seed)
+    rules = {}
+
+    for group_idx in range(3):
+        group = {}
+        for rule_idx in range(rules_per_group):
+            field = rand.choice(["comment", "comment", "title"])
+            atoms = [
+                f'input.{field} contains "{rand.choice(KEYWORDS)}"',
+                f"input.{field} matches /{rand.choice(REGEXES)}/",
+                f"input.score>{rand.randrange(0, 10)}",
+            ]
+            picked = rand.sample(atoms, rand.randrange(1, 3))
+            expr = picked[0]
+            for atom in picked[1:]:
+                expr = f"{expr} {rand.choice(['and', 'or', 'and not'])} {atom}"
+            group[f"RULE_{group_idx}_{rule_idx}"] = {
+                "simple_condition": expr,
+                "action": "set_admission",
+                "action_parameters": {"value": f"{group_idx}_{rule_idx}"},
+            }
+        rules[f"group_{group_idx}"] = group
+
+    return {
+        "rules": {"default_rule_set": rules},
+        "actions_source_modules": ["tests.examples.code.actions"],
+        "rule_activation_mode": rule_activation_mode,
+        "parsing_error_strategy": parsing_error_strategy,
+    }
+
+
+def random_inputs(seed, count=100):
+    """Return inputs including missing keys and texts which are not strings."""
+    rand = random.Random(seed)
+    inputs = []
+
+    for _ in range(count):
+        data = {
+            "comment": " ".join(rand.choices(WORDS, k=rand.randrange(0, 6))),
+            "title": "".join(rand.choices(WORDS, k=rand.randrange(0, 3))),
+            "score": rand.randrange(0, 10),
+        }
+        draw = rand.random()
+        if draw < 0.05:
+            del data["comment"]
+        elif draw < 0.1:
+            data["title"] = rand.choice([None, 42, ["late"]])
+        inputs.append(data)
+
+    return inputs
+
+
+def set_comment(**kwargs):
+    """Validation function with value sharing modifying the searched text."""
+    kwargs["input_data"]["comment"] = "refund"
+    return False
+
+
+def run(engine, input_data, **kwargs):
+    """Return the results, or the raised exception type and message."""
+    try:
+        return engine.apply_rules(input_data, **kwargs)
+    except Exception as error:
+        return type(error), str(error)
+
+
+@pytest.mark.parametrize(
+    "rule_activation_mode, parsing_error_strategy",
+    [("one_by_group", "ignore"), ("many_by_group", "ignore"), ("one_by_group", "raise")],
+)
+def test_same_results(rule_activation_mode, parsing_error_strategy):
+    """Indexed groups give the same results as the linear evaluation."""
+    for seed in range(3):
+        config = pattern_config(
+            seed, rule_activation_mode=rule_activation_mode, parsing_error_strategy=parsing_error_strategy
+        )
+        linear = RulesEngine(config_dict=config)
+        indexed = RulesEngine(config_dict=config)
+
+        report = indexed.compile_pattern_indexes()
+        assert all(group["compiled"] for group in report.values())
+
+        for input_data in random_inputs(seed):
+            for verbose in (False, True):
+                assert run(indexed, input_data, verbose=verbose) == run(linear, input_data, verbose=verbose)
+
+
+def test_report():
+    """Literal patterns go to the automaton, the other ones to the combined alternation."""
+    config = {
+        "rules": {
+            "default_rule_set": {
+                "topic": {
+                    "REFUND": {
+                        "simple_condition": 'input.comment contains "refund" or input.comment matches /re\\.fund/',
+                        "action": "set_admission",
+                        "action_parameters": {"value": "refund"},
+                    },
+                    "LATE": {
+                        "simple_condition": "input.comment matches /late(st)?/ and input.score>2",
+                        "action": "set_admission",
+                        "action_parameters": {"value": "late"},
+                    },
+                    "OTHER": {
+                        "simple_condition": "input.title matches /other/",
+                        "action": "set_admission",
+                        "action_parameters": {"value": "other"},
+                    },
+                }
+            }
+        },
+        "actions_source_modules": ["tests.examples.code.actions"],
+    }
+    engine = RulesEngine(config_dict=config)
+    report = engine.compile_pattern_indexes()
+
+    assert report == {
+        "default_rule_set/topic": {"compiled": True, "paths": {"input.comment": {"literals": 2, "regexes": 1}}}
+    }
+    assert engine.pattern_index_info() == report
+    assert engine.apply_rules({"comment": "latest", "title": "other", "score": 3}) == {"topic": {"admission": "late"}}
+
+    report = engine.compile_pattern_indexes(min_patterns=4)
+    assert report["default_rule_set/topic"] == {"compiled": False, "reason": "Less than 4 pattern conditions."}
+    assert engine._pattern_indexes == {}
+
+
+def test_modified_input_data():
+    """Rules of a group whose conditions can modify the input data are not skipped before their evaluation."""
+    config = {
+        "conditions": {
+            "SET_COMMENT": {
+                "description": "Set the comment",
+                "validation_function": "set_comment",
+                "condition_parameters": {},
+            },
+        },
+        "rules": {
+            "default_rule_set": {
+                "topic": {
+                    "SET": {
+                        "condition": "SET_COMMENT",
+                        "action": "set_admission",
+                        "action_parameters": {"value": "set"},
+                    },
+                    "REFUND": {
+                        "simple_condition": 'input.comment contains "refund" or input.comment contains "fund"',
+                        "action": "set_admission",
+                        "action_parameters": {"value": "refund"},
+                    },
+                    "LATE": {
+                        "simple_condition": 'input.comment contains "late"',
+                        "action": "set_admission",
+                        "action_parameters": {"value": "late"},
+                    },
+                }
+            }
+        },
+        "conditions_source_modules": ["tests.unit.test_pattern_index"],
+        "actions_source_modules": ["tests.examples.code.actions"],
+    }
+    engine = RulesEngine(config_dict=config)
+
+    assert engine.compile_pattern_indexes()["default_rule_set/topic"]["compiled"]
+    assert engine.apply_rules({"comment": "nothing"}) == {"topic": {"admission": "refund"}}
+
+
+def test_aho_corasick():
+    """All the occurrences are found, including overlapping and nested patterns."""
+    rand = random.Random(0)
+    patterns = ["he", "she", "his", "hers", "a", "aa", "aab", "b", "abba", "", "xyz"]
+    automaton = AhoCorasick(patterns)
+
+    for _ in range(200):
+        text = "".join(rand.choices("abhers", k=rand.randrange(0, 12)))
+        assert automaton.find(text) == {idx for idx, pattern in enumerate(patterns) if pattern in text}
+
+
+@pytest.mark.parametrize(
+    "pattern, literal",
+    [("refund", "refund"), (re.escape("re.fund (a+b)"), "re.fund (a+b)"), ("re.fund", None), (r"\d", None)],
+)
+def test_get_literal(pattern, literal):
+    """Only patterns matching a literal string are found by the automaton."""
+    assert get_literal(re.compile(pattern)) == literal
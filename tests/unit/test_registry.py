@@ -0,0 +1,134 @@
+"""Engine registry UT."""
+
+import copy
+import os
+import shutil
+import threading
+
+import pytest
+from arta import EngineRegistry, RulesEngine
+from arta.config import load_config
+from arta.registry import estimate_engine_size
+
+INPUT_DATA = {"age": None, "language": "french", "powers": ["strength", "fly"], "favorite_meal": "Spinach"}
+
+
+@pytest.fixture
+def tenants_dir(base_config_path, tmp_path):
+    """Directory with one configuration directory per tenant."""
+    for tenant in ("tenant_a", "tenant_b", "tenant_c"):
+        shutil.copytree(os.path.join(base_config_path, "good_conf"), tmp_path / tenant)
+    return tmp_path
+
+
+def test_lazy_build(tenants_dir):
+    """Engines are built on first use, then reused."""
+    registry = EngineRegistry(tenants_dir)
+    assert len(registry) == 0
+
+    result = registry.apply_rules("tenant_a", INPUT_DATA, rule_set="default_rule_set")
+    assert result["admission"] == {"admission": True}
+
+    engine = registry.get("tenant_a")
+    assert isinstance(engine, RulesEngine)
+    assert "tenant_a" in registry
+
+    stats = registry.stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 1
+    assert stats["build_latency"]["evaluations"] == 1
+    assert stats["tenants"]["tenant_a"]["memory"] > 0
+
+
+def test_count_budget(tenants_dir):
+    """The least recently used engine is evicted."""
+    registry = EngineRegistry(tenants_dir, max_engines=2)
+
+    registry.get("tenant_a")
+    registry.get("tenant_b")
+    registry.get("tenant_a")
+    registry.get("tenant_c")
+
+    assert registry.tenants() == ["tenant_a", "tenant_c"]
+    assert registry.stats()["evictions"] == 1
+
+    # Rebuilt on demand
+    registry.get("tenant_b")
+    assert registry.stats()["misses"] == 4
+
+
+def test_memory_budget(tenants_dir):
+    """Engines are evicted when the memory budget is exceeded (the last one is always kept)."""
+    registry = EngineRegistry(tenants_dir, max_memory=1)
+
+    registry.get("tenant_a")
+    registry.get("tenant_b")
+
+    stats = registry.stats()
+    assert registry.tenants() == ["tenant_b"]
+    assert stats["evictions"] == 1
+    assert stats["evicted_memory"] > 0
+
+
+def test_shared_structures(tenants_dir):
+    """Equal structures are shared between the engines of different tenants."""
+    registry = EngineRegistry(tenants_dir)
+    rule_a = registry.get("tenant_a").rules["default_rule_set"]["admission"][0]
+    rule_b = registry.get("tenant_b").rules["default_rule_set"]["admission"][0]
+
+    assert rule_a is not rule_b
+    assert rule_a._action_parameters is rule_b._action_parameters
+
+
+def test_unknown_tenant(tenants_dir):
+    """Unknown tenants (or paths outside of the base directory) raise a KeyError."""
+    registry = EngineRegistry(tenants_dir / "tenant_a")
+
+    with pytest.raises(KeyError):
+        registry.get("missing")
+
+    with pytest.raises(KeyError):
+        registry.get("../tenant_b")
+
+    assert registry.stats()["build_errors"] == 2
+
+
+def test_callable_source(base_config_path):
+    """Configurations can be given by a function."""
+    config = load_config(os.path.join(base_config_path, "good_conf"))
+    registry = EngineRegistry(lambda tenant: config)
+
+    assert registry.apply_rules("any", INPUT_DATA, rule_set="default_rule_set")["admission"] == {"admission": True}
+    assert registry.evict("any") is True
+    assert registry.evict("any") is False
+
+
+def test_concurrent_build(tenants_dir):
+    """An engine requested by concurrent threads is built once."""
+    registry = EngineRegistry(tenants_dir)
+    barrier = threading.Barrier(8)
+    engines = []
+
+    def worker():
+        barrier.wait()
+        engines.append(registry.get("tenant_a"))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(engine) for engine in engines}) == 1
+    assert registry.stats()["misses"] == 1
+
+
+def test_estimate_engine_size(base_config_path):
+    """The estimated size grows with the number of rules."""
+    config = load_config(os.path.join(base_config_path, "good_conf"))
+    small = RulesEngine(config_dict=config)
+
+    config["rules"]["copied_rule_set"] = copy.deepcopy(config["rules"]["default_rule_set"])
+    large = RulesEngine(config_dict=config)
+
+    assert 0 < estimate_engine_size(small) < estimate_engine_size(large)
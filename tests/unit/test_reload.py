@@ -0,0 +1,156 @@
+"""Hot reload UT."""
+
+import os
+import shutil
+import time
+
+import pytest
+from arta import ReloadableRulesEngine
+from arta.hooks import EngineHook
+
+INPUT_DATA = {"age": None, "language": "french", "powers": ["strength", "fly"], "favorite_meal": "Spinach"}
+
+
+@pytest.fixture
+def config_dir(base_config_path, tmp_path):
+    """Copy of a configuration directory which can be modified."""
+    path = tmp_path / "conf"
+    shutil.copytree(os.path.join(base_config_path, "good_conf"), path)
+    return path
+
+
+def deny_admissions(config_dir):
+    """Change the admission action parameter (and the file size)."""
+    rules_file = config_dir / "rules.yaml"
+    content = rules_file.read_text(encoding="utf-8")
+    rules_file.write_text(content.replace("value: true", "value: false  # Modified"), encoding="utf-8")
+
+
+def test_reload(config_dir):
+    """A modified configuration is rebuilt and activated, the previous engine stays usable."""
+    reloadable = ReloadableRulesEngine(config_dir)
+    version = reloadable.version
+    old_engine = reloadable.engine
+
+    assert reloadable.apply_rules(INPUT_DATA, rule_set="default_rule_set")["admission"] == {"admission": True}
+    assert reloadable.build_duration > 0
+    assert reloadable.reload() is False
+
+    deny_admissions(config_dir)
+
+    assert reloadable.reload() is True
+    assert reloadable.version != version
+    assert reloadable.reload_count == 1
+    assert reloadable.engine is not old_engine
+    assert reloadable.apply_rules(INPUT_DATA, rule_set="default_rule_set")["admission"] == {"admission": False}
+
+    # Calls already holding the previous engine finish on the previous version
+    assert old_engine.apply_rules(INPUT_DATA, rule_set="default_rule_set")["admission"] == {"admission": True}
+
+
+def test_reload_touched_files(config_dir):
+    """Files touched without modification don't trigger a rebuild."""
+    reloadable = ReloadableRulesEngine(config_dir)
+    engine = reloadable.engine
+
+    later = time.time() + 10
+    os.utime(config_dir / "rules.yaml", (later, later))
+
+    assert reloadable.reload() is False
+    assert reloadable.engine is engine
+    assert reloadable.reload(force=True) is True
+
+
+def test_reload_error(config_dir):
+    """An invalid configuration is rejected and the active engine is kept."""
+    reloadable = ReloadableRulesEngine(config_dir)
+    engine = reloadable.engine
+    version = reloadable.version
+
+    (config_dir / "rules.yaml").write_text("rules:\n  default_rule_set:\n    admission: 12\n", encoding="utf-8")
+
+    with pytest.raises(Exception):  # noqa: B017
+        reloadable.reload()
+
+    assert reloadable.engine is engine
+    assert reloadable.version == version
+    assert reloadable.last_error is not None
+
+
+def test_prepare(config_dir):
+    """The prepare function is applied on each new engine and can reject it."""
+    prepared = []
+
+    def prepare(engine):
+        engine.add_hook(EngineHook())
+        result = engine.apply_rules(INPUT_DATA, rule_set="default_rule_set")
+        if result["admission"] == {"admission": False}:
+            raise ValueError("Admissions can't be denied")
+        prepared.append(engine)
+
+    reloadable = ReloadableRulesEngine(config_dir, prepare=prepare)
+    assert prepared == [reloadable.engine]
+
+    deny_admissions(config_dir)
+
+    with pytest.raises(ValueError):
+        reloadable.reload()
+
+    assert reloadable.engine is prepared[0]
+
+
+def test_reload_retry(config_dir):
+    """A failed build is retried at the next check, even if the files have not changed since."""
+    failures = [ConnectionError("Reference inputs unavailable")]
+
+    def prepare(engine):
+        if (
+            engine.apply_rules(INPUT_DATA, rule_set="default_rule_set")["admission"] == {"admission": False}
+            and failures
+        ):
+            raise failures.pop()
+
+    reloadable = ReloadableRulesEngine(config_dir, prepare=prepare)
+    engine = reloadable.engine
+
+    deny_admissions(config_dir)
+
+    with pytest.raises(ConnectionError):
+        reloadable.reload()
+
+    assert reloadable.engine is engine
+    assert reloadable.reload() is True
+    assert reloadable.last_error is None
+    assert reloadable.apply_rules(INPUT_DATA, rule_set="default_rule_set")["admission"] == {"admission": False}
+    assert reloadable.reload() is False
+
+
+def test_background_polling(config_dir):
+    """Changes are detected by the background thread."""
+    with ReloadableRulesEngine(config_dir, poll_interval=0.01) as reloadable:
+        deny_admissions(config_dir)
+
+        deadline = time.monotonic() + 5
+        while reloadable.reload_count == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert reloadable.apply_rules(INPUT_DATA, rule_set="default_rule_set")["admission"] == {"admission": False}
+
+    assert reloadable._thread is None
+
+
+def test_incremental_reload(config_dir):
+    """New versions reuse the unchanged rules of the active engine (unless disabled)."""
+    reloadable = ReloadableRulesEngine(config_dir)
+    deny_admissions(config_dir)
+    reloadable.reload()
+
+    info = reloadable.engine.build_info()
+    assert info["incremental"] is True
+    assert info["built_rules"] == 1
+    assert info["reused_rules"] > 0
+
+    full_reloadable = ReloadableRulesEngine(config_dir, incremental=False)
+    full_reloadable.reload(force=True)
+
+    assert full_reloadable.engine.build_info()["incremental"] is False
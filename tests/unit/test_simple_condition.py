@@ -4,7 +4,8 @@ import os
 
 import pytest
 from arta import RulesEngine
-from arta.exceptions import ConditionExecutionError, RuleExecutionError
+from arta.categorical import CategoryTest
+from arta.exceptions import ConditionExecutionError, UnsupportedExpressionError
 
 
 @pytest.mark.parametrize(
@@ -203,16 +204,6 @@ def test_simple_condition_verbose(input_data, good_results, base_config_path):
             "simple_condition/raise",
             ConditionExecutionError,
         ),
-        (
-            {
-                "age": 100,
-                "language": "french",
-                "power": "strength",
-                "favorite_meal": "Spinach",
-            },
-            "simple_condition/wrong/dummy",
-            RuleExecutionError,
-        ),
         (
             {
                 "age": 100,
@@ -262,3 +253,134 @@ def test_math(input_data, config_dir, good_results, base_config_path):
     eng = RulesEngine(config_path=config_path)
     res = eng.apply_rules(input_data=input_data)
     assert res == good_results
+
+
+@pytest.mark.parametrize("age, expected", [(5, {"admission": "young"}), (50, {"admission": "adult"}), (0, None)])
+def test_simple_condition_prefix_ids(age, expected):
+    """A condition id which is a prefix of another one (input.age>=1 / input.age>=10) is replaced correctly."""
+    config = {
+        "rules": {
+            "default_rule_set": {
+                "category": {
+                    "YOUNG": {
+                        "simple_condition": "input.age>=1 and not input.age>=10",
+                        "action": "set_admission",
+                        "action_parameters": {"value": "young"},
+                    },
+                    "ADULT": {
+                        "simple_condition": "input.age>=10 and input.age>=1",
+                        "action": "set_admission",
+                        "action_parameters": {"value": "adult"},
+                    },
+                }
+            }
+        },
+        "actions_source_modules": ["tests.examples.code.actions"],
+    }
+    eng = RulesEngine(config_dict=config)
+
+    assert eng.apply_rules({"age": age})["category"] == expected
+
+
+@pytest.mark.parametrize(
+    "input_data, good_results",
+    [
+        (
+            {"language": "french", "power": "strength", "age": 70, "favorite_meal": "Spinach", "powers": ["fly"]},
+            {"membership": "europe", "range": "senior", "regex": "matched", "length": "powers", "categories": "any"},
+        ),
+        (
+            {"language": "german", "power": "fly", "age": 18, "favorite_meal": "spinach", "powers": []},
+            {"membership": None, "range": "adult", "regex": "lowercase", "length": None, "categories": None},
+        ),
+        (
+            {"language": "english", "power": None, "age": "18", "favorite_meal": "FRIES/", "powers": None},
+            {"membership": "other", "range": None, "regex": "matched", "length": None, "categories": None},
+        ),
+        (
+            {
+                "language": "english",
+                "power": "fly",
+                "age": 30,
+                "favorite_meal": None,
+                "powers": {"invisibility", "fly"},
+            },
+            {"membership": "other", "range": "adult", "regex": None, "length": "powers", "categories": "all"},
+        ),
+        (
+            {"language": ["french"], "power": {"fly": True}, "age": 30, "favorite_meal": None, "powers": []},
+            {"membership": "other", "range": "adult", "regex": None, "length": None, "categories": None},
+        ),
+    ],
+)
+def test_extended_operators(input_data, good_results, base_config_path):
+    """Membership tests (unhashable values are not members), between(), regular expressions, len() and categories."""
+    eng = RulesEngine(config_path=os.path.join(base_config_path, "simple_condition/extended"))
+    assert eng.apply_rules(input_data=input_data) == good_results
+
+
+def test_unsupported_expression_at_build_time(base_config_path):
+    """Unknown names are rejected when the rules engine is built (not at evaluation time)."""
+    with pytest.raises(UnsupportedExpressionError, match="unknown name 'dummy'"):
+        RulesEngine(config_path=os.path.join(base_config_path, "simple_condition/wrong/dummy"))
+
+
+@pytest.mark.parametrize(
+    "simple_condition",
+    [
+        "input.name==open",
+        'input.name==__import__("os")',
+        'input.name.upper()=="BOB"',
+        "input.age>=1 and len",
+        "input.age>=(1",
+        "input.name matches /(/",
+        "between(input.age, 18)",
+        "len(input.items, 2)>1",
+        "any_of(input.powers, input.authorized_powers)",
+        "all_of(input.powers, [input.power])",
+    ],
+)
+def test_unsupported_constructs(simple_condition):
+    """Only comparisons, boolean and arithmetic operators, literals and data paths are allowed."""
+    config = {
+        "rules": {
+            "default_rule_set": {
+                "category": {
+                    "RULE": {
+                        "simple_condition": simple_condition,
+                        "action": "set_admission",
+                        "action_parameters": {"value": "ok"},
+                    },
+                }
+            }
+        },
+        "actions_source_modules": ["tests.examples.code.actions"],
+    }
+
+    with pytest.raises(UnsupportedExpressionError):
+        RulesEngine(config_dict=config)
+
+
+@pytest.mark.parametrize(
+    "kind, value, expected",
+    [
+        ("any_of", ["fly", "sleep"], True),
+        ("any_of", "strength", True),
+        ("any_of", ("sleep",), False),
+        ("all_of", {"fly", "strength", "sleep"}, True),
+        ("all_of", ["fly"], False),
+        ("none_of", [], True),
+        ("none_of", frozenset({"fly"}), False),
+    ],
+)
+def test_category_test(kind, value, expected):
+    """Categories are encoded as bit sets (same results as the set operations)."""
+    test = CategoryTest(kind, ["fly", "strength"])
+
+    for _ in range(2):
+        assert test(value) is expected
+
+    with pytest.raises(TypeError):
+        test(None)
+    with pytest.raises(TypeError):
+        test([["fly"]])
@@ -0,0 +1,104 @@
+"""Execution statistics UT."""
+
+import os
+import threading
+
+import pytest
+from arta import RulesEngine
+from arta.stats import StatsCollector
+
+INPUT_DATA = {"age": None, "language": "french", "powers": ["strength", "fly"], "favorite_meal": "Spinach"}
+
+
+def test_stats_disabled(base_config_path):
+    """No statistics by default."""
+    eng = RulesEngine(config_path=os.path.join(base_config_path, "good_conf"))
+    eng.apply_rules(INPUT_DATA, rule_set="default_rule_set")
+    assert eng.stats() == {}
+
+
+def test_stats_content(base_config_path):
+    """Rules, conditions and actions statistics."""
+    eng = RulesEngine(config_path=os.path.join(base_config_path, "good_conf"))
+    eng.enable_stats()
+
+    for _ in range(3):
+        eng.apply_rules(INPUT_DATA, rule_set="default_rule_set")
+
+    stats = eng.stats()
+
+    assert stats["sampled_requests"] == 3
+    assert set(stats["rules"]) == {
+        "default_rule_set/admission/ADM_OK",
+        "default_rule_set/course/COURSE_ENGLISH",
+        "default_rule_set/course/COURSE_SENIOR",
+        "default_rule_set/email/EMAIL_COOK",
+    }
+    assert stats["rules"]["default_rule_set/admission/ADM_OK"]["activations"] == 3
+    assert stats["rules"]["default_rule_set/course/COURSE_ENGLISH"]["activations_ratio"] == 0.0
+
+    conditions = stats["conditions"]
+    assert conditions["IS_SPEAKING_ENGLISH"]["evaluations"] == 3
+    assert conditions["IS_SPEAKING_ENGLISH"]["true"] == 0
+    assert conditions["IS_AGE_UNKNOWN"]["true_ratio"] == 1.0
+
+    assert stats["actions"]["set_admission"]["evaluations"] == 3
+    assert stats["actions"]["send_email"]["evaluations"] == 3
+
+    rule_stats = stats["rules"]["default_rule_set/admission/ADM_OK"]
+    assert 0 < rule_stats["p50_ms"] <= rule_stats["max_ms"] <= rule_stats["total_ms"]
+
+    eng.reset_stats()
+    assert eng.stats()["sampled_requests"] == 0
+    assert eng.stats()["rules"] == {}
+
+    eng.disable_stats()
+    assert eng.stats() == {}
+
+
+def test_stats_sampling(base_config_path):
+    """One request out of N is recorded."""
+    eng = RulesEngine(config_path=os.path.join(base_config_path, "good_conf"))
+    eng.enable_stats(sample_rate=4)
+
+    for _ in range(10):
+        eng.apply_rules(INPUT_DATA, rule_set="default_rule_set")
+
+    assert eng.stats()["sampled_requests"] == 3
+
+
+def test_stats_concurrency(base_config_path):
+    """Statistics are consistent when collected by many threads."""
+    eng = RulesEngine(config_path=os.path.join(base_config_path, "good_conf"))
+    eng.enable_stats()
+
+    def worker():
+        for _ in range(50):
+            eng.apply_rules(INPUT_DATA, rule_set="default_rule_set")
+            eng.stats()
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = eng.stats()
+    assert stats["sampled_requests"] == 400
+    assert stats["rules"]["default_rule_set/admission/ADM_OK"]["evaluations"] == 400
+
+
+def test_collector_percentiles():
+    """Percentiles are computed from the latency samples."""
+    collector = StatsCollector(reservoir_size=1000)
+    collector.merge([("condition", "COND", duration, duration % 2 == 0) for duration in range(1, 101)])
+
+    stats = collector.snapshot()["conditions"]["COND"]
+    assert stats["evaluations"] == 100
+    assert stats["true"] == 50
+    assert stats["p50_ms"] == pytest.approx(50e-6, abs=1e-6)
+    assert stats["p99_ms"] == pytest.approx(99e-6, abs=1e-6)
+    assert stats["max_ms"] == pytest.approx(100e-6)
+
+    with pytest.raises(ValueError):
+        StatsCollector(sample_rate=0)
@@ -0,0 +1,109 @@
+"""Thread-safety UT: one engine shared by many threads gives the same results as a sequential run."""
+
+import os
+import sys
+import threading
+
+import pytest
+from arta import RulesEngine
+from arta.hooks import InMemorySpanExporter, TracingHook
+
+THREADS = 8
+CALLS = 100
+
+LANGUAGES = ["english", "french", "german"]
+POWERS = [["strength"], ["fly", "immortality"], ["invisibility"], []]
+
+
+def make_input(idx):
+    """Return a distinct input data (ages, languages and powers vary)."""
+    return {
+        "age": idx % 120,
+        "language": LANGUAGES[idx % len(LANGUAGES)],
+        "powers": POWERS[idx % len(POWERS)],
+        "favorite_meal": "Spinach" if idx % 2 else None,
+    }
+
+
+@pytest.fixture
+def fast_switching():
+    """Switch threads as often as possible to expose the races."""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def run_concurrently(worker):
+    """Run the worker in many threads (started together) and return the raised errors."""
+    errors = []
+    barrier = threading.Barrier(THREADS)
+
+    def target(thread_idx):
+        barrier.wait()
+        try:
+            worker(thread_idx)
+        except Exception as error:  # noqa: BLE001
+            errors.append(error)
+
+    threads = [threading.Thread(target=target, args=(idx,)) for idx in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return errors
+
+
+@pytest.mark.parametrize("config_dir", ["good_conf", "pure_functions"])
+@pytest.mark.parametrize("verbose", [False, True])
+def test_shared_engine(config_dir, verbose, base_config_path, fast_switching):
+    """Results, statistics and traces are consistent with concurrent requests."""
+    eng = RulesEngine(config_path=os.path.join(base_config_path, config_dir))
+    inputs = [make_input(idx) for idx in range(THREADS * CALLS)]
+    expected = [eng.apply_rules(input_data, rule_set="default_rule_set", verbose=verbose) for input_data in inputs]
+
+    exporter = InMemorySpanExporter(max_traces=THREADS * CALLS)
+    eng.enable_stats()
+    eng.add_hook(TracingHook(exporter))
+
+    def worker(thread_idx):
+        for idx in range(thread_idx, len(inputs), THREADS):
+            assert eng.apply_rules(inputs[idx], rule_set="default_rule_set", verbose=verbose) == expected[idx]
+
+    assert run_concurrently(worker) == []
+
+    assert eng.stats()["sampled_requests"] == THREADS * CALLS
+    traces = exporter.get_traces()
+    assert len(traces) == THREADS * CALLS
+    assert all(len({span.trace_id for span in trace}) == 1 for trace in traces)
+
+
+def test_value_sharing_isolation(base_config_path, fast_switching):
+    """Values shared through 'input_data' by a validation function never leak to another request."""
+    eng = RulesEngine(config_path=os.path.join(base_config_path, "value_sharing"))
+
+    def worker(thread_idx):
+        for idx in range(CALLS):
+            median = 11 + thread_idx * CALLS + idx
+            result = eng.apply_rules({"values": [median, median, median]})
+            assert result["median_check"] == f"Median is too high: {median}, limit is: 10."
+
+    assert run_concurrently(worker) == []
+
+
+def test_hooks_updated_concurrently(base_config_path, fast_switching):
+    """Hooks can be added and removed while requests are running."""
+    eng = RulesEngine(config_path=os.path.join(base_config_path, "good_conf"))
+    expected = eng.apply_rules(make_input(1), rule_set="default_rule_set")
+
+    def worker(thread_idx):
+        for _ in range(CALLS):
+            if thread_idx == 0:
+                hook = TracingHook(InMemorySpanExporter())
+                eng.add_hook(hook)
+                eng.remove_hook(hook)
+            else:
+                assert eng.apply_rules(make_input(1), rule_set="default_rule_set") == expected
+
+    assert run_concurrently(worker) == []
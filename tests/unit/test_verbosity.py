@@ -0,0 +1,60 @@
+"""Verbose and non verbose execution paths UT."""
+
+import os
+
+import pytest
+from arta import RulesEngine
+from arta.utils import ParsingErrorStrategy
+
+
+@pytest.mark.parametrize(
+    "config_dir, rule_set, input_data",
+    [
+        (
+            "good_conf",
+            "default_rule_set",
+            {"age": None, "language": "french", "powers": ["strength", "fly"], "favorite_meal": "Spinach"},
+        ),
+        (
+            "good_conf",
+            "second_rule_set",
+            {"age": 20, "language": "english", "powers": ["time-manipulation"], "favorite_meal": None},
+        ),
+        (
+            "simple_condition/default",
+            None,
+            {"age": 30, "language": "english", "power": "fly", "favorite_meal": None},
+        ),
+        (
+            "rule_activation_mode",
+            None,
+            {"age": 100, "language": "french", "power": "fly", "favorite_meal": "Spinach"},
+        ),
+    ],
+)
+def test_same_results(base_config_path, config_dir, rule_set, input_data):
+    """Results of the lean path are the same as the verbose ones (without the verbosity key)."""
+    eng = RulesEngine(config_path=os.path.join(base_config_path, config_dir))
+
+    verbose_results = eng.apply_rules(input_data, rule_set=rule_set, verbose=True)
+    lean_results = eng.apply_rules(input_data, rule_set=rule_set, verbose=False)
+
+    assert "verbosity" in verbose_results
+    verbose_results.pop("verbosity")
+    assert lean_results == verbose_results
+
+
+def test_no_details_when_not_verbose(base_config_path):
+    """Condition details are not built by the lean path."""
+    eng = RulesEngine(config_path=os.path.join(base_config_path, "good_conf"))
+    rule = eng.rules["default_rule_set"]["course"][0]
+    input_data = {"age": 20, "language": "english", "powers": ["fly"], "favorite_meal": None, "output": {}}
+
+    is_ok, details = rule._check_conditions(input_data, ParsingErrorStrategy.RAISE, verbose=False)
+    assert is_ok is True
+    assert details is None
+
+    assert rule.apply_lean(input_data, parsing_error_strategy=ParsingErrorStrategy.RAISE) == (
+        True,
+        {"course_id": "english"},
+    )
@@ -0,0 +1,165 @@
+"""Sliding window UT."""
+
+import pytest
+from arta import RulesEngine
+from arta.exceptions import ConditionExecutionError, UnsupportedExpressionError
+from arta.window import SlidingWindow
+
+
+def window_config(simple_condition, **window):
+    """Return a configuration whose first rule aggregates the claims of the customer (event time by default)."""
+    return {
+        "rules": {
+            "default_rule_set": {
+                "fraud": {
+                    "SUSPICIOUS": {
+                        "simple_condition": simple_condition,
+                        "action": "set_admission",
+                        "action_parameters": {"value": "KO"},
+                    },
+                    "DEFAULT": {
+                        "simple_condition": None,
+                        "action": "set_admission",
+                        "action_parameters": {"value": "OK"},
+                    },
+                }
+            }
+        },
+        "actions_source_modules": ["tests.examples.code.actions"],
+        "parsing_error_strategy": "ignore",
+        "sliding_windows": {
+            "claims_10m": {
+                "duration": 600,
+                "key": "input.customer_id",
+                "value": "input.amount",
+                "timestamp": "input.ts",
+                **window,
+            }
+        },
+    }
+
+
+@pytest.mark.parametrize(
+    "simple_condition, events, good_results",
+    [
+        (
+            "count(@claims_10m)>2",
+            [("A", 10, 0), ("A", 10, 100), ("B", 10, 150), ("A", 10, 200), ("A", 10, 900)],
+            ["OK", "OK", "OK", "KO", "OK"],
+        ),
+        (
+            "sum(@claims_10m)>=100",
+            [("A", 50, 0), ("A", 40, 100), ("A", 20, 200), ("A", 5, 650), ("A", None, 700)],
+            ["OK", "OK", "KO", "OK", "OK"],
+        ),
+        (
+            "avg(@claims_10m)>30 and max(@claims_10m)<100 and min(@claims_10m)>=10",
+            [("A", 50, 0), ("A", 100, 10), ("A", 10, 20), ("A", 40, 620), ("B", "50", 630)],
+            ["KO", "OK", "OK", "KO", "OK"],
+        ),
+        (
+            "count(@claims_10m)>=2 and input.amount>count(@claims_10m)",
+            [("A", 1, 0), ("A", 1, 1), ("A", 10, 2), ("A", 10, 900), ("A", 10, 400)],
+            ["OK", "OK", "KO", "OK", "KO"],
+        ),
+    ],
+)
+def test_window_condition(simple_condition, events, good_results):
+    """Aggregates include the current event, expired events are removed (late events are kept sorted)."""
+    eng = RulesEngine(config_dict=window_config(simple_condition))
+    results = []
+
+    for customer_id, amount, ts in events:
+        result = eng.apply_rules({"customer_id": customer_id, "amount": amount, "ts": ts})
+        results.append(result["fraud"]["admission"])
+
+    assert results == good_results
+
+
+def test_processing_time_and_bounds():
+    """The clock is used without timestamp, keys and events are bounded."""
+    now = [1000.0]
+    window = SlidingWindow("claims", 60, "input.customer_id", max_keys=2, max_events=3, clock=lambda: now[0])
+
+    for customer_id in ["A", "A", "A", "A", "B", "C"]:
+        window.record({"customer_id": customer_id})
+    assert window.info() == {"keys": 2, "evicted_keys": 1, "dropped_events": 1}
+    assert (window.count("A"), window.count("B"), window.count("C")) == (0, 1, 1)
+
+    # TTL: keys without events in the window are evicted
+    now[0] += 61
+    assert window.count("B") == 0
+    window.record({"customer_id": "D"})
+    assert window.info()["keys"] == 1
+
+    # Missing, None and unhashable keys are not recorded
+    for input_data in [{"other": 1}, {"customer_id": None}, {"customer_id": ["A"]}, {"customer_id": (["A"],)}]:
+        window.record(input_data)
+    assert window.info()["keys"] == 1
+    with pytest.raises(TypeError):
+        window.count(["A"])
+
+
+def test_incremental_rebuild():
+    """Unchanged windows are reused with their events, a modified one starts empty."""
+    config = window_config("count(@claims_10m)>1")
+    eng = RulesEngine(config_dict=config)
+    assert eng.apply_rules({"customer_id": "A", "ts": 0}) == {"fraud": {"admission": "OK"}}
+
+    new_eng = RulesEngine(config_dict=config, previous=eng)
+    assert new_eng.build_info()["reused_rules"] == 2
+    assert new_eng.apply_rules({"customer_id": "A", "ts": 1}) == {"fraud": {"admission": "KO"}}
+    assert new_eng.window_info() == {"claims_10m": {"duration": 600, "keys": 1, "evicted_keys": 0, "dropped_events": 0}}
+
+    config["sliding_windows"]["claims_10m"]["duration"] = 60
+    new_eng = RulesEngine(config_dict=config, previous=eng)
+    assert new_eng.build_info()["reused_rules"] == 0
+    assert new_eng.apply_rules({"customer_id": "A", "ts": 2}) == {"fraud": {"admission": "OK"}}
+
+
+def test_recorded_requests():
+    """Only the requests of the rule sets using a window are recorded, failed requests are removed."""
+    config = window_config("count(@claims_10m)>1 and input.amount>0")
+    config["parsing_error_strategy"] = "raise"
+    config["rules"]["other_rule_set"] = {
+        "amount": {
+            "POSITIVE": {
+                "simple_condition": "input.amount>0",
+                "action": "set_admission",
+                "action_parameters": {"value": "OK"},
+            },
+        }
+    }
+    eng = RulesEngine(config_dict=config)
+
+    for ts in range(3):
+        eng.apply_rules({"customer_id": "A", "amount": 10, "ts": ts}, rule_set="other_rule_set")
+    with pytest.raises(ConditionExecutionError):
+        eng.apply_rules({"customer_id": "A", "ts": 3}, rule_set="default_rule_set")
+    assert eng.window_info()["claims_10m"]["keys"] == 0
+
+    results = [
+        eng.apply_rules({"customer_id": "A", "amount": 10, "ts": ts}, rule_set="default_rule_set")["fraud"]
+        for ts in (4, 5)
+    ]
+    assert results == [{"admission": "OK"}, {"admission": "KO"}]
+
+
+@pytest.mark.parametrize(
+    "simple_condition",
+    ["count(@unknown)>1", "@claims_10m>1", "len(@claims_10m)>1", "count(@claims_10m, 1)>1", "count(1)>1"],
+)
+def test_unsupported(simple_condition):
+    """Unknown windows and other uses than an aggregate raise an error."""
+    with pytest.raises(UnsupportedExpressionError):
+        RulesEngine(config_dict=window_config(simple_condition))
+
+
+@pytest.mark.parametrize(
+    "window, error",
+    [({"duration": 0}, "must be positive"), ({"key": "customer_id"}, "is not a data path of the input")],
+)
+def test_wrong_window(window, error):
+    """Wrong definitions raise an error when the rules engine is built."""
+    with pytest.raises(ValueError, match=error):
+        RulesEngine(config_dict=window_config("count(@claims_10m)>1", **window))